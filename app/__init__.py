@@ -1,9 +1,67 @@
+import asyncio
+
 from fastapi import FastAPI
 from fastapi.concurrency import asynccontextmanager
 
+from app.api.v1.currency_converter.tasks import (
+    ensure_currency_indexes,
+    listen_currency_invalidations,
+    load_rate_table,
+    refresh_currencies_periodically,
+    refresh_rate_table_periodically,
+)
+from app.api.v1.words.parallel import (
+    close_process_pool,
+    parallel_enabled,
+    warm_up_process_pool,
+)
+from app.repositories.mongo_repository import (
+    close_mongo_client,
+    get_mongo_client,
+)
+from app.repositories.redis_repository import (
+    close_redis_client,
+    get_redis_client,
+)
+from app.services.awesomeapi import (
+    close_http_client,
+    get_http_client,
+)
+from app.utils.config import return_default_settings
+
+settings = return_default_settings()
+
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):  # pragma: no cover
     # Valores aqui executam antes do sistema subir
+    get_mongo_client()
+    get_redis_client()
+    get_http_client()
+    if settings.MONGO_CREATE_INDEXES:
+        await ensure_currency_indexes()
+    await load_rate_table()
+    if parallel_enabled():
+        warm_up_process_pool()
+    rate_table_refresher = asyncio.create_task(
+        refresh_rate_table_periodically(settings.RATE_TABLE_REFRESH_INTERVAL)
+    )
+    invalidation_listener = asyncio.create_task(listen_currency_invalidations())
+    background_tasks = [rate_table_refresher, invalidation_listener]
+    if settings.CURRENCY_REFRESH_ENABLED:
+        background_tasks.append(
+            asyncio.create_task(
+                refresh_currencies_periodically(
+                    settings.CURRENCY_REFRESH_INTERVAL,
+                    settings.CURRENCY_REFRESH_JITTER,
+                )
+            )
+        )
     yield
     # E aqui quando o sistema está sendo fechado.
+    for task in background_tasks:
+        task.cancel()
+    close_mongo_client()
+    await close_redis_client()
+    close_process_pool()
+    await close_http_client()
@@ -7,6 +7,9 @@ from fastapi.responses import (
     RedirectResponse,
 )
 
+from app.api.v1.words.vowel_count.cache import vowel_count_cache
+from app.utils.circuit_breaker import circuit_breakers_state
+
 router = APIRouter(tags=["Health Checker"])
 
 
@@ -16,7 +19,13 @@ router = APIRouter(tags=["Health Checker"])
     status_code=status.HTTP_200_OK,
 )
 def check_health() -> JSONResponse:
-    return JSONResponse(content={"status": "OK"})
+    return JSONResponse(
+        content={
+            "status": "OK",
+            "circuit_breakers": circuit_breakers_state(),
+            "caches": {"vowel_count": vowel_count_cache.stats()},
+        }
+    )
 
 
 @router.get("/", include_in_schema=False)
@@ -0,0 +1,30 @@
+from pymongo import (
+    ASCENDING,
+    IndexModel,
+)
+
+# Índices da collection de moedas, criados no startup da aplicação
+# e no script de carga das cotações.
+CURRENCY_INDEXES = [
+    IndexModel([("acronym", ASCENDING)], name="acronym_unique", unique=True),
+    # O id não é único: o default do model é gerado uma vez por processo.
+    IndexModel([("id", ASCENDING)], name="id"),
+    # Cobre a busca da cotação, o Mongo responde direto pelo índice.
+    IndexModel(
+        [("acronym", ASCENDING), ("dolar_price_reference", ASCENDING)],
+        name="acronym_dolar_price_reference",
+    ),
+]
+
+# Índice da collection com a data da última carga das cotações, só o
+# documento marcador entra nele.
+DATE_INDEXES = [
+    IndexModel(
+        [("daily_time", ASCENDING)],
+        name="daily_time_marker",
+        partialFilterExpression={"daily_time": True},
+    ),
+]
+
+# Projeção da cotação, sem o _id para a consulta ser coberta pelo índice.
+RATE_PROJECTION = {"_id": 0, "acronym": 1, "dolar_price_reference": 1}
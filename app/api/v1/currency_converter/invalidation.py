@@ -0,0 +1,51 @@
+import logging
+from uuid import uuid4
+
+from app.api.v1.currency_converter.rate_table import rate_table
+from app.api.v1.currency_converter.response_cache import (
+    ALL_CURRENCIES_RESPONSE,
+    response_cache,
+)
+
+logger = logging.getLogger(__name__)
+CURRENCY_INVALIDATION_CHANNEL = "currency_invalidation"
+# Identifica o worker para ele ignorar as próprias mensagens.
+WORKER_ID = uuid4().hex
+
+
+def build_invalidation_message(acronym: str, currency: dict | None) -> dict:
+    return {
+        "origin": WORKER_ID,
+        "acronym": acronym,
+        "deleted": currency is None,
+        "dolar_price_reference": (currency or {}).get("dolar_price_reference"),
+    }
+
+
+def build_snapshot_message(rates: dict[str, float]) -> dict:
+    """
+    Mensagem com as cotações de uma carga completa vinda da AwesomeAPI.
+    """
+    return {"origin": WORKER_ID, "rates": rates}
+
+
+def apply_invalidation(message: dict | None) -> bool:
+    """
+    Aplica nas cópias locais do worker uma mutação (ou uma carga nova das
+    cotações) feita por outro worker.
+    """
+    if not message or message.get("origin") == WORKER_ID:
+        return False
+
+    response_cache.invalidate(ALL_CURRENCIES_RESPONSE)
+    if (rates := message.get("rates")) is not None:
+        rate_table.update(rates)
+        return True
+
+    acronym = message.get("acronym")
+    value = message.get("dolar_price_reference")
+    if message.get("deleted") or value is None:
+        rate_table.discard(acronym)
+    else:
+        rate_table.set(acronym, value)
+    return True
@@ -0,0 +1,68 @@
+import math
+
+import numpy as np
+
+
+class ConversionMatrix:
+    """
+    Matriz N x N com todas as cotações cruzadas, onde
+    matrix[i][j] = dolar_price_reference[i] / dolar_price_reference[j],
+    ou seja, quanto 1 unidade de acronyms[i] vale em acronyms[j].
+    """
+
+    def __init__(self) -> None:
+        self.acronyms: list[str] = []
+        self.index: dict[str, int] = {}
+        self.values = np.empty(0, dtype=np.float64)
+        self.matrix = np.empty((0, 0), dtype=np.float64)
+
+    def rebuild(self, rates: dict[str, float]) -> None:
+        self.acronyms = sorted(rates)
+        self.index = {acronym: i for i, acronym in enumerate(self.acronyms)}
+        self.values = np.array(
+            [rates[acronym] for acronym in self.acronyms], dtype=np.float64
+        )
+        with np.errstate(divide="ignore", invalid="ignore"):
+            self.matrix = self.values[:, None] / self.values[None, :]
+
+    def set_rate(self, acronym: str, value: float) -> None:
+        """
+        Atualiza só a linha e a coluna da moeda alterada.
+        """
+        if (i := self.index.get(acronym)) is None:
+            i = len(self.acronyms)
+            self.acronyms.append(acronym)
+            self.index[acronym] = i
+            self.values = np.append(self.values, np.float64(value))
+            matrix = np.empty((i + 1, i + 1), dtype=np.float64)
+            matrix[:i, :i] = self.matrix
+            self.matrix = matrix
+
+        self.values[i] = value
+        with np.errstate(divide="ignore", invalid="ignore"):
+            self.matrix[i, :] = self.values[i] / self.values
+            self.matrix[:, i] = self.values / self.values[i]
+
+    def remove(self, acronym: str) -> None:
+        if (i := self.index.get(acronym)) is None:
+            return
+        self.acronyms.pop(i)
+        self.index = {acronym: i for i, acronym in enumerate(self.acronyms)}
+        self.values = np.delete(self.values, i)
+        self.matrix = np.delete(np.delete(self.matrix, i, axis=0), i, axis=1)
+
+    def get(self, from_: str, to: str) -> float | None:
+        i, j = self.index.get(from_), self.index.get(to)
+        if i is None or j is None:
+            return None
+        return float(self.matrix[i, j])
+
+    def to_dict(self) -> dict:
+        rows = self.matrix.tolist()
+        if not np.isfinite(self.matrix).all():
+            # JSON não aceita inf/nan (ex.: moeda com cotação zerada).
+            rows = [
+                [value if math.isfinite(value) else None for value in row]
+                for row in rows
+            ]
+        return {"acronyms": list(self.acronyms), "matrix": rows}
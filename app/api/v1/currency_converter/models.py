@@ -4,6 +4,8 @@ from uuid import uuid4
 
 from pydantic import (
     BaseModel,
+    ConfigDict,
+    Field,
     field_validator,
 )
 
@@ -45,3 +47,19 @@ class Currency(BaseModel):
 class UpdateCurrency(Currency):
     name: str
     updated_at: str | None = created_at()
+
+
+class CurrencyExchangeItem(BaseModel):
+    model_config = ConfigDict(populate_by_name=True)
+
+    from_: str = Field(alias="from")
+    to: str
+    amount: float
+
+    @field_validator("from_", "to")
+    def upper_acronym(cls, acronym: str) -> str:
+        return acronym.upper()
+
+
+class CurrencyExchangeBatchRequest(BaseModel):
+    conversions: list[CurrencyExchangeItem]
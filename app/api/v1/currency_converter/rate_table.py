@@ -0,0 +1,95 @@
+from threading import Lock
+from time import time
+
+from app.api.v1.currency_converter.matrix import ConversionMatrix
+
+
+class RateTable:
+    """
+    Tabela local (uma por worker) com o dolar_price_reference de cada moeda.
+
+    As leituras não usam lock: toda escrita monta um novo dict e troca a
+    referência, incrementando a versão da tabela. A matriz de cotações
+    cruzadas acompanha cada escrita, e o horário de cada cotação é
+    guardado para saber a idade dela.
+    """
+
+    def __init__(self) -> None:
+        self._rates: dict[str, float] = {}
+        self._updated_at: dict[str, float] = {}
+        self._lock = Lock()
+        self.version = 0
+        self.matrix = ConversionMatrix()
+
+    def get(self, acronym: str) -> float | None:
+        return self._rates.get(acronym)
+
+    def age(self, acronym: str) -> float | None:
+        """
+        Segundos desde que a cotação foi carregada ou atualizada.
+        """
+        if (updated_at := self._updated_at.get(acronym)) is None:
+            return None
+        return max(time() - updated_at, 0.0)
+
+    def snapshot(self) -> dict[str, float]:
+        return dict(self._rates)
+
+    def load(self, rates: dict[str, float]) -> int:
+        """
+        Substitui a tabela inteira, usado na carga do startup e no refresh.
+        """
+        with self._lock:
+            self._rates = {acronym: float(value) for acronym, value in rates.items()}
+            self._updated_at = dict.fromkeys(self._rates, time())
+            self.matrix.rebuild(self._rates)
+            self.version += 1
+            return self.version
+
+    def set(self, acronym: str, value: float) -> int:
+        with self._lock:
+            rates = dict(self._rates)
+            rates[acronym] = float(value)
+            self._rates = rates
+            self._updated_at = {**self._updated_at, acronym: time()}
+            self.matrix.set_rate(acronym, rates[acronym])
+            self.version += 1
+            return self.version
+
+    def update(self, rates: dict[str, float]) -> int:
+        """
+        Atualiza várias moedas de uma vez, mantendo as que não vieram.
+        """
+        with self._lock:
+            updated_rates = dict(self._rates)
+            updated_rates.update(
+                {acronym: float(value) for acronym, value in rates.items()}
+            )
+            self._rates = updated_rates
+            self._updated_at = {**self._updated_at, **dict.fromkeys(rates, time())}
+            self.matrix.rebuild(self._rates)
+            self.version += 1
+            return self.version
+
+    def discard(self, acronym: str) -> int:
+        with self._lock:
+            if acronym in self._rates:
+                rates = dict(self._rates)
+                rates.pop(acronym)
+                self._rates = rates
+                updated_at = dict(self._updated_at)
+                updated_at.pop(acronym, None)
+                self._updated_at = updated_at
+                self.matrix.remove(acronym)
+                self.version += 1
+            return self.version
+
+    def clear(self) -> None:
+        with self._lock:
+            self._rates = {}
+            self._updated_at = {}
+            self.matrix.rebuild(self._rates)
+            self.version += 1
+
+
+rate_table = RateTable()
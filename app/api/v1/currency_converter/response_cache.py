@@ -0,0 +1,62 @@
+from hashlib import blake2b
+from time import monotonic
+from typing import NamedTuple
+
+from app.utils.config import return_default_settings
+
+settings = return_default_settings()
+ALL_CURRENCIES_RESPONSE = "response:all_currencys"
+
+
+class CachedResponse(NamedTuple):
+    body: bytes
+    etag: str
+
+
+def build_etag(body: bytes) -> str:
+    return f'"{blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def etag_matches(etag: str, if_none_match: str | None) -> bool:
+    """
+    Compara o ETag com o header If-None-Match (lista separada por vírgula).
+    """
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    return "*" in candidates or etag in [
+        candidate.removeprefix("W/") for candidate in candidates
+    ]
+
+
+class ResponseCache:
+    """
+    Cache em memória (por worker) dos bodies já serializados.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        self._entries: dict[str, tuple[float, CachedResponse]] = {}
+
+    def get(self, key: str) -> CachedResponse | None:
+        if (entry := self._entries.get(key)) is None:
+            return None
+        expires_at, response = entry
+        if expires_at < monotonic():
+            self._entries.pop(key, None)
+            return None
+        return response
+
+    def set(self, key: str, body: bytes) -> CachedResponse:
+        response = CachedResponse(body=body, etag=build_etag(body))
+        self._entries[key] = (monotonic() + self.ttl, response)
+        return response
+
+    def invalidate(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+response_cache = ResponseCache(ttl=settings.CURRENCIES_RESPONSE_LOCAL_TTL)
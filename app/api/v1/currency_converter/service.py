@@ -1,82 +1,327 @@
+import asyncio
 import logging
+from contextlib import suppress
+from datetime import (
+    datetime,
+    timezone,
+)
+from typing import AsyncIterator
+
+import orjson
+from fastapi import status
+from redis.exceptions import LockError
 
 from app.api.v1.currency_converter.exceptions import CurrencyServiceException
-from app.api.v1.currency_converter.models import Currency
+from app.api.v1.currency_converter.indexes import (
+    CURRENCY_INDEXES,
+    DATE_INDEXES,
+    RATE_PROJECTION,
+)
+from app.api.v1.currency_converter.invalidation import (
+    CURRENCY_INVALIDATION_CHANNEL,
+    build_invalidation_message,
+    build_snapshot_message,
+)
+from app.api.v1.currency_converter.models import (
+    Currency,
+    CurrencyExchangeItem,
+)
+from app.api.v1.currency_converter.rate_table import rate_table
+from app.api.v1.currency_converter.response_cache import (
+    ALL_CURRENCIES_RESPONSE,
+    CachedResponse,
+    build_etag,
+    response_cache,
+)
 from app.api.v1.currency_converter.utils import (
     amount_from_api_response,
     amount_from_bd_response,
+    amounts_from_bd_response,
 )
-from app.exceptions.default_exceptions import MongoRepositoryTransactionsException
-from app.repositories.mongo_repository import MongoRepository
-from app.repositories.redis_repository import RedisRepository
-from app.services.awesomeapi import AwesomeApiService
+from app.exceptions.default_exceptions import (
+    ApiInvalidResponseException,
+    CircuitOpenException,
+    MongoRepositoryTransactionsException,
+    ServiceUnavailableException,
+)
+from app.repositories.mongo_repository import AsyncMongoRepository
+from app.repositories.redis_repository import AsyncRedisRepository
+from app.services.awesomeapi import AsyncAwesomeApiService
+from app.utils.config import return_default_settings
+from app.utils.single_flight import SingleFlight
 
 logger = logging.getLogger(__name__)
+settings = return_default_settings()
 CURRENCY_DATABASE = "currency_db"
 CURRENCY_COLLECTION = "currencys"
 DATE_COLLECTION = "daily_time"
+# Pares da AwesomeAPI cotados em dólar, ex.: BRL-USD.
+DOLAR_PAIR_SUFFIX = "-USD"
+# Incrementada a cada escrita nas moedas, os preenchimentos do cache lidos
+# do banco antes dela são descartados.
+CURRENCY_GENERATION = "generation:currencys"
+currency_single_flight = SingleFlight()
 
 
 class CurrencyConverterService:
     def __init__(self) -> None:
-        self.awesome_service = AwesomeApiService()
-        self.mongo_repository = MongoRepository(server_timeout=100)
-        self.redis = RedisRepository()
+        self.awesome_service = AsyncAwesomeApiService()
+        self.mongo_repository = AsyncMongoRepository()
+        self.redis = AsyncRedisRepository()
+        # Idade (segundos) da cotação mais antiga usada na última conversão.
+        self.rate_age = 0.0
 
-    def currency_exchange(
+    async def currency_exchange(
         self, from_: str = "", to: str = "", amount: float = None
     ) -> str:
         try:
-            return self._get_currency_exchange_from_db(from_, to, amount)
-        except MongoRepositoryTransactionsException:
+            return await self._get_currency_exchange_from_db(from_, to, amount)
+        except (MongoRepositoryTransactionsException, CircuitOpenException):
             logger.info("Error in database, trying to get values in the api")
-        awesome_response = self.awesome_service.get_currency_values(from_, to)
+        try:
+            awesome_response = await currency_single_flight.do(
+                f"awesomeapi:{from_}-{to}",
+                lambda: self.awesome_service.get_currency_values(from_, to),
+            )
+        except (ApiInvalidResponseException, ServiceUnavailableException):
+            # Banco e api fora: usa a última cotação boa da tabela local,
+            # mesmo velha (o header Age mostra a idade).
+            if (rates := self._get_rates_from_snapshot([from_, to])) is None:
+                raise
+            logger.info("Api unavailable, using the last known rates")
+            return amount_from_bd_response(rates[from_], rates[to], amount=amount)
         actual_value = amount_from_api_response(from_, to, amount, awesome_response)
         return actual_value
 
-    def get_currency(self, acronym: str) -> dict | None:
-        if response := self.mongo_repository.get_by_acronym(
+    async def currency_exchange_batch(
+        self, conversions: list[CurrencyExchangeItem]
+    ) -> list[str]:
+        """
+        Converte várias moedas de uma vez: cada sigla é resolvida uma única
+        vez e as contas são feitas de forma vetorizada.
+        """
+        acronyms = {conversion.from_ for conversion in conversions}
+        acronyms.update(conversion.to for conversion in conversions)
+        rates = await self._get_dolar_price_references(acronyms)
+        return amounts_from_bd_response(
+            [rates[conversion.from_] for conversion in conversions],
+            [rates[conversion.to] for conversion in conversions],
+            [conversion.amount for conversion in conversions],
+        )
+
+    async def get_currency(self, acronym: str) -> dict | None:
+        if response := await self.mongo_repository.get_by_acronym(
             CURRENCY_DATABASE, CURRENCY_COLLECTION, acronym.upper()
         ):
             response = Currency.model_validate(response).model_dump()
         return response
 
-    def get_all_currency(self) -> list[dict] | None:
-        if response := self.redis.get("all_currencys"):
+    async def get_all_currency(self) -> list[dict] | None:
+        if response := await self.redis.get("all_currencys"):
             return response
 
-        response = self.mongo_repository.get_all_currency(
+        generation = await self.redis.get_generation(CURRENCY_GENERATION)
+        response = await self.mongo_repository.get_all_currency(
             CURRENCY_DATABASE, CURRENCY_COLLECTION
         )
         response = [
             Currency.model_validate(response).model_dump() for response in response
         ]
-        self.redis.create("all_currencys", response)
+        # A lista e as chaves de cada moeda são gravadas no mesmo script.
+        cache = {currency["acronym"]: currency for currency in response}
+        cache["all_currencys"] = response
+        await self.redis.set_many_if_generation(cache, CURRENCY_GENERATION, generation)
         return response
 
-    def create_currency(self, payload: Currency) -> dict | None:
+    async def get_currency_page(self, after: str | None, limit: int) -> dict:
+        """
+        Uma página do GET /currencies, next é a sigla a ser passada como
+        after na próxima página (None quando acabou).
+        """
+        response = await self.mongo_repository.get_page_by_acronym(
+            CURRENCY_DATABASE, CURRENCY_COLLECTION, after, limit, {"_id": 0}
+        )
+        currencies = [Currency.model_validate(item).model_dump() for item in response]
+        next_after = currencies[-1]["acronym"] if len(currencies) == limit else None
+        return {"currencies": currencies, "next": next_after}
+
+    async def stream_currencies(self, after: str | None) -> AsyncIterator[bytes]:
+        """
+        Retorna as moedas em NDJSON, um pedaço por lote do cursor. O primeiro
+        lote é buscado aqui, para um erro do banco aparecer antes da
+        resposta começar a ser enviada.
+        """
+        batches = self.mongo_repository.iter_by_acronym(
+            CURRENCY_DATABASE,
+            CURRENCY_COLLECTION,
+            after,
+            settings.CURRENCIES_STREAM_BATCH_SIZE,
+            {"_id": 0},
+        )
+        first_batch = await anext(batches, [])
+        return self._ndjson_chunks(first_batch, batches)
+
+    async def _ndjson_chunks(
+        self, batch: list, batches: AsyncIterator[list]
+    ) -> AsyncIterator[bytes]:
+        while batch:
+            yield b"".join(
+                orjson.dumps(Currency.model_validate(item).model_dump()) + b"\n"
+                for item in batch
+            )
+            batch = await anext(batches, [])
+
+    async def get_all_currency_response(self) -> CachedResponse:
+        """
+        Retorna o body já serializado do GET /currencies com o ETag dele,
+        procurando primeiro no processo e depois no Redis.
+        """
+        if cached := response_cache.get(ALL_CURRENCIES_RESPONSE):
+            return cached
+        return await currency_single_flight.do(
+            ALL_CURRENCIES_RESPONSE, self._load_all_currency_response
+        )
+
+    async def _load_all_currency_response(self) -> CachedResponse:
+        if (body := await self.redis.get_bytes(ALL_CURRENCIES_RESPONSE)) is None:
+            generation = await self.redis.get_generation(CURRENCY_GENERATION)
+            body = orjson.dumps(await self.get_all_currency() or [])
+            # Uma escrita no meio do caminho deixa o body velho, ele ainda
+            # é respondido, mas não fica em cache.
+            if not await self.redis.set_bytes_if_generation(
+                {ALL_CURRENCIES_RESPONSE: body}, CURRENCY_GENERATION, generation
+            ):
+                return CachedResponse(body=body, etag=build_etag(body))
+        return response_cache.set(ALL_CURRENCIES_RESPONSE, body)
+
+    async def create_indexes(self) -> list[str]:
+        currency_indexes = await self.mongo_repository.create_indexes(
+            CURRENCY_DATABASE, CURRENCY_COLLECTION, CURRENCY_INDEXES
+        )
+        date_indexes = await self.mongo_repository.create_indexes(
+            CURRENCY_DATABASE, DATE_COLLECTION, DATE_INDEXES
+        )
+        return currency_indexes + date_indexes
+
+    async def refresh_currencies_from_api(self) -> int:
+        """
+        Busca a cotação em dólar de todas as moedas da AwesomeAPI, grava
+        tudo com um único bulk_write, registra a data da carga, já deixa
+        as chaves de cada moeda no Redis e manda as cotações novas para
+        os outros workers.
+        """
+        currencies = await self._get_currencies_from_api()
+        await self.mongo_repository.bulk_update_or_create_by_acronym(
+            CURRENCY_DATABASE, CURRENCY_COLLECTION, currencies
+        )
+        await self.mongo_repository.update_or_create_date_cache(
+            CURRENCY_DATABASE,
+            DATE_COLLECTION,
+            {
+                "daily_time": True,
+                "updated_at": datetime.now(timezone.utc).isoformat(),
+                "total_currencies": len(currencies),
+            },
+        )
+        # A lista completa também tem as moedas criadas pela API, então
+        # ela é removida e remontada na próxima leitura.
+        response_cache.invalidate(ALL_CURRENCIES_RESPONSE)
+        await self.redis.write_through(
+            {currency["acronym"]: currency for currency in currencies},
+            ["all_currencys", ALL_CURRENCIES_RESPONSE],
+            generation_key=CURRENCY_GENERATION,
+        )
+        rates = {
+            currency["acronym"]: currency["dolar_price_reference"]
+            for currency in currencies
+            if currency["dolar_price_reference"] is not None
+        }
+        rate_table.update(rates)
+        await self.redis.publish(
+            CURRENCY_INVALIDATION_CHANNEL, build_snapshot_message(rates)
+        )
+        return len(currencies)
+
+    async def _get_currencies_from_api(self) -> list[dict]:
+        available_pairs = await self.awesome_service.get_available_pairs()
+        pairs = sorted(
+            pair for pair in available_pairs if pair.endswith(DOLAR_PAIR_SUFFIX)
+        )
+        chunks = []
+        for start in range(0, len(pairs), settings.AWESOME_API_PAIRS_PER_REQUEST):
+            stop = start + settings.AWESOME_API_PAIRS_PER_REQUEST
+            chunks.append(pairs[start:stop])
+        responses = await asyncio.gather(
+            *[self.awesome_service.get_last_quotations(chunk) for chunk in chunks],
+            return_exceptions=True,
+        )
+
+        currencies = [
+            Currency(
+                acronym="USD", name="dólar americano", dolar_price_reference=1
+            ).model_dump()
+        ]
+        for response in responses:
+            if isinstance(response, Exception):
+                logger.error("Error to get api quotations", extra={"error": response})
+                continue
+            for quotation in response.values():
+                # O nome vem como "Real Brasileiro/Dólar Americano".
+                try:
+                    currency = Currency(
+                        acronym=quotation.get("code"),
+                        name=quotation.get("name", "").split("/")[0],
+                        dolar_price_reference=quotation.get("bid"),
+                    )
+                except Exception as error:
+                    logger.error("Invalid api quotation", extra={"error": error})
+                    continue
+                currencies.append(currency.model_dump())
+        return currencies
+
+    async def get_all_rates(self) -> dict[str, float]:
+        """
+        Retorna o dolar_price_reference de todas as moedas do banco,
+        usado para carregar a tabela local de cotações.
+        """
+        response = await self.mongo_repository.get_all_currency(
+            CURRENCY_DATABASE, CURRENCY_COLLECTION
+        )
+        return {
+            currency["acronym"]: float(currency["dolar_price_reference"])
+            for currency in response
+            if currency.get("acronym")
+            and currency.get("dolar_price_reference") is not None
+        }
+
+    async def create_currency(self, payload: Currency) -> dict | None:
         try:
-            self.mongo_repository.create(
+            await self.mongo_repository.create(
                 CURRENCY_DATABASE, CURRENCY_COLLECTION, payload.model_dump()
             )
         except Exception as error:
             logger.error("Unmapped error", extra={"error": error})
             raise CurrencyServiceException(detail={"error": "Error to create currency"})
+        if payload.dolar_price_reference is not None:
+            rate_table.set(payload.acronym, payload.dolar_price_reference)
+        await self._write_through(payload.acronym, payload.model_dump())
         return payload.id
 
-    def delete_currency(self, acronym: str) -> dict | None:
+    async def delete_currency(self, acronym: str) -> dict | None:
         try:
-            self.mongo_repository.delete_by_acronym(
+            await self.mongo_repository.delete_by_acronym(
                 CURRENCY_DATABASE, CURRENCY_COLLECTION, acronym
             )
         except Exception as error:
             logger.error("Unmapped error", extra={"error": error})
             raise CurrencyServiceException(detail={"error": "Error to delete currency"})
+        rate_table.discard(acronym.upper())
+        await self._write_through(acronym.upper(), None)
         return acronym
 
-    def update_currency(self, payload: Currency) -> bool:
+    async def update_currency(self, payload: Currency) -> bool:
         try:
-            self.mongo_repository.update_or_create_by_acronym(
+            await self.mongo_repository.update_or_create_by_acronym(
                 CURRENCY_DATABASE,
                 CURRENCY_COLLECTION,
                 payload.acronym,
@@ -85,30 +330,175 @@ class CurrencyConverterService:
         except Exception as error:
             logger.error("Unmapped error", extra={"error": error})
             raise CurrencyServiceException(detail={"error": "Error to delete currency"})
+        if payload.dolar_price_reference is not None:
+            rate_table.set(payload.acronym, payload.dolar_price_reference)
+        await self._write_through(payload.acronym, payload.model_dump())
         return True
 
-    def _get_currency_exchange_from_db(self, from_, to, amount):
-        current_currency: dict = self.redis.get(from_)
-        currency_to_exchange: dict = self.redis.get(to)
-        if not current_currency:
-            current_currency: dict = self.mongo_repository.get_by_acronym(
-                CURRENCY_DATABASE, CURRENCY_COLLECTION, from_
+    async def _write_through(self, acronym: str, currency: dict | None) -> None:
+        """
+        Atualiza (ou remove, quando currency é None) a chave da moeda no Redis,
+        remove as listas em cache e avisa os outros workers pelo pub/sub.
+        """
+        response_cache.invalidate(ALL_CURRENCIES_RESPONSE)
+        values = {acronym: currency} if currency is not None else {}
+        delete_keys = ["all_currencys", ALL_CURRENCIES_RESPONSE]
+        if currency is None:
+            delete_keys.append(acronym)
+        try:
+            await self.redis.write_through(
+                values, delete_keys, generation_key=CURRENCY_GENERATION
+            )
+            await self.redis.publish(
+                CURRENCY_INVALIDATION_CHANNEL,
+                build_invalidation_message(acronym, currency),
             )
-            current_currency = Currency.model_validate(current_currency).model_dump()
-            self.redis.create(from_, current_currency)
+        except Exception as error:
+            logger.error("Error to update currency cache", extra={"error": error})
+
+    async def _get_currency_exchange_from_db(self, from_, to, amount):
+        # A tabela local resolve o caminho quente sem I/O, Redis e Mongo
+        # só são consultados quando a moeda ainda não está carregada.
+        rates = self._get_rates_from_table([from_, to])
+        if missing := [acronym for acronym, rate in rates.items() if rate is None]:
+            rates.update(await self._get_dolar_price_reference_many(missing))
+
+        amount = amount_from_bd_response(rates[from_], rates[to], amount=amount)
+        return amount
 
-        if not currency_to_exchange:
-            currency_to_exchange: dict = self.mongo_repository.get_by_acronym(
-                CURRENCY_DATABASE, CURRENCY_COLLECTION, to
+    def _get_rates_from_table(self, acronyms: list[str] | set[str]) -> dict:
+        """
+        Stale-while-revalidate na tabela local: até o soft TTL a cotação é
+        usada direto, entre o soft e o hard TTL é usada e recarregada em
+        background, depois do hard TTL conta como ausente (None).
+        """
+        rates, stale = {}, []
+        for acronym in acronyms:
+            rate, age = rate_table.get(acronym), rate_table.age(acronym)
+            if rate is None or age >= settings.RATE_HARD_TTL:
+                rates[acronym] = None
+                continue
+            rates[acronym] = rate
+            self.rate_age = max(self.rate_age, age)
+            if age >= settings.RATE_SOFT_TTL:
+                stale.append(acronym)
+
+        if stale:
+            stale.sort()
+            currency_single_flight.start(
+                f"revalidate:{','.join(stale)}",
+                lambda: self._revalidate_rates(stale),
             )
-            currency_to_exchange = Currency.model_validate(
-                currency_to_exchange
-            ).model_dump()
-            self.redis.create(to, currency_to_exchange)
+        return rates
+
+    def _get_rates_from_snapshot(self, acronyms: list[str]) -> dict | None:
+        rates = {acronym: rate_table.get(acronym) for acronym in acronyms}
+        if None in rates.values():
+            return None
+        self.rate_age = max(rate_table.age(acronym) for acronym in acronyms)
+        return rates
+
+    async def _revalidate_rates(self, acronyms: list[str]) -> None:
+        currencies = await self._load_currencies_from_db(acronyms)
+        for acronym, currency in currencies.items():
+            if (value := currency.get("dolar_price_reference")) is not None:
+                rate_table.set(acronym, value)
 
-        amount = amount_from_bd_response(
-            current_currency.get("dolar_price_reference"),
-            currency_to_exchange.get("dolar_price_reference"),
-            amount=amount,
+    async def _get_dolar_price_references(self, acronyms: set[str]) -> dict:
+        rates = self._get_rates_from_table(acronyms)
+        if missing := [acronym for acronym, rate in rates.items() if rate is None]:
+            cached = await self.redis.get_many(missing)
+            currencies = [currency for currency in cached if currency]
+            if not_cached := [
+                acronym for acronym, currency in zip(missing, cached) if not currency
+            ]:
+                generation = await self.redis.get_generation(CURRENCY_GENERATION)
+                loaded = await self.mongo_repository.get_by_acronyms(
+                    CURRENCY_DATABASE, CURRENCY_COLLECTION, not_cached, RATE_PROJECTION
+                )
+                await self.redis.set_many_if_generation(
+                    {currency["acronym"]: currency for currency in loaded},
+                    CURRENCY_GENERATION,
+                    generation,
+                )
+                currencies.extend(loaded)
+
+            for currency in currencies:
+                value = currency.get("dolar_price_reference")
+                if value is not None:
+                    rates[currency["acronym"]] = float(value)
+                    rate_table.set(currency["acronym"], value)
+
+        if not_found := sorted(
+            acronym for acronym, rate in rates.items() if rate is None
+        ):
+            raise CurrencyServiceException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail={"error": "Currencies not found", "acronyms": not_found},
+            )
+        return rates
+
+    async def _get_dolar_price_reference_many(self, acronyms: list[str]) -> dict:
+        # Chamadas concorrentes para as mesmas moedas esperam um único loader.
+        return await currency_single_flight.do(
+            f"currency:{','.join(acronyms)}",
+            lambda: self._load_dolar_price_references(acronyms),
         )
-        return amount
+
+    async def _load_dolar_price_references(self, acronyms: list[str]) -> dict:
+        # Um único MGET para as moedas que faltam na tabela local.
+        cached = await self.redis.get_many(acronyms)
+        currencies = dict(zip(acronyms, cached))
+        if misses := [
+            acronym for acronym, currency in currencies.items() if not currency
+        ]:
+            currencies.update(await self._load_currencies_into_cache(misses))
+
+        rates = {}
+        for acronym, currency in currencies.items():
+            rates[acronym] = value = currency.get("dolar_price_reference")
+            if value is not None:
+                rate_table.set(acronym, value)
+        return rates
+
+    async def _load_currencies_into_cache(self, acronyms: list[str]) -> dict:
+        if not settings.SINGLE_FLIGHT_REDIS_LOCK:
+            return await self._load_currencies_from_db(acronyms)
+
+        lock = self.redis.lock(
+            ",".join(acronyms),
+            timeout=settings.SINGLE_FLIGHT_LOCK_TIMEOUT,
+            blocking_timeout=settings.SINGLE_FLIGHT_LOCK_WAIT,
+        )
+        if not await lock.acquire():
+            logger.info("Redis lock not acquired, loading currency without it")
+            return await self._load_currencies_from_db(acronyms)
+        try:
+            # Outro worker pode ter preenchido o cache enquanto esperávamos.
+            cached = await self.redis.get_many(acronyms)
+            if all(cached):
+                return dict(zip(acronyms, cached))
+            return await self._load_currencies_from_db(acronyms)
+        finally:
+            with suppress(LockError):
+                await lock.release()
+
+    async def _load_currencies_from_db(self, acronyms: list[str]) -> dict:
+        # Só a cotação é buscada, direto do índice. As chaves das moedas
+        # no Redis só são lidas pelo caminho da conversão.
+        generation = await self.redis.get_generation(CURRENCY_GENERATION)
+        currencies = {}
+        for acronym in acronyms:
+            currency: dict = await self.mongo_repository.get_by_acronym(
+                CURRENCY_DATABASE, CURRENCY_COLLECTION, acronym, RATE_PROJECTION
+            )
+            currencies[acronym] = {
+                "acronym": currency["acronym"],
+                "dolar_price_reference": currency.get("dolar_price_reference"),
+            }
+        # Um único script grava todas as chaves com TTL, se nenhuma escrita
+        # aconteceu enquanto o banco era lido.
+        await self.redis.set_many_if_generation(
+            currencies, CURRENCY_GENERATION, generation
+        )
+        return currencies
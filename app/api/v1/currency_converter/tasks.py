@@ -0,0 +1,111 @@
+import asyncio
+import logging
+from contextlib import suppress
+from random import uniform
+
+from app.api.v1.currency_converter.invalidation import (
+    CURRENCY_INVALIDATION_CHANNEL,
+    apply_invalidation,
+)
+from app.api.v1.currency_converter.rate_table import rate_table
+from app.api.v1.currency_converter.service import CurrencyConverterService
+from app.repositories.redis_repository import AsyncRedisRepository
+from app.utils.config import return_default_settings
+
+logger = logging.getLogger(__name__)
+settings = return_default_settings()
+RECONNECT_DELAY = 1  # segundos
+CURRENCY_REFRESH_LOCK = "currency_refresh"
+
+
+async def ensure_currency_indexes() -> list[str]:
+    """
+    Cria os índices da collection de moedas no startup. Índices já
+    existentes não são recriados; se o banco falhar a aplicação sobe
+    mesmo assim.
+    """
+    service = CurrencyConverterService()
+    try:
+        return await service.create_indexes()
+    except Exception as error:
+        logger.error("Error to create the currency indexes", extra={"error": error})
+        return []
+
+
+async def load_rate_table() -> int:
+    """
+    Carrega todas as cotações do banco na tabela local do worker.
+    Se o banco falhar a tabela atual é mantida.
+    """
+    service = CurrencyConverterService()
+    try:
+        rates = await service.get_all_rates()
+    except Exception as error:
+        logger.error("Error to load the rate table", extra={"error": error})
+        return rate_table.version
+    return rate_table.load(rates)
+
+
+async def refresh_rate_table_periodically(interval: int) -> None:
+    """
+    Loop executado em background pelo lifespan da aplicação.
+    """
+    while True:
+        await asyncio.sleep(interval)
+        await load_rate_table()
+
+
+async def refresh_currencies_as_leader() -> bool:
+    """
+    Só o worker que pegar o lock carrega as cotações da AwesomeAPI. O lock
+    não é liberado, ele expira sozinho depois de um intervalo, então a
+    carga acontece uma vez por intervalo em toda a frota. Os outros
+    workers recebem as cotações novas pelo pub/sub. Se a carga falhar o
+    lock é liberado, para outro worker tentar de novo na próxima volta.
+    """
+    redis = AsyncRedisRepository()
+    lock = redis.lock(
+        CURRENCY_REFRESH_LOCK,
+        timeout=settings.CURRENCY_REFRESH_INTERVAL,
+        blocking_timeout=0,
+    )
+    try:
+        if not await lock.acquire(blocking=False):
+            return False
+    except Exception as error:
+        logger.error("Error to acquire the refresh lock", extra={"error": error})
+        return False
+    try:
+        total = await CurrencyConverterService().refresh_currencies_from_api()
+    except Exception as error:
+        logger.error("Error to refresh the currencies", extra={"error": error})
+        with suppress(Exception):
+            await lock.release()
+        return False
+    logger.info(f"{total} currencies refreshed from the api")
+    return True
+
+
+async def refresh_currencies_periodically(interval: int, jitter: int) -> None:
+    """
+    Loop executado em background pelo lifespan da aplicação. O jitter
+    espalha as tentativas dos workers que subiram juntos.
+    """
+    while True:
+        await asyncio.sleep(interval + uniform(0, jitter))
+        await refresh_currencies_as_leader()
+
+
+async def listen_currency_invalidations() -> None:
+    """
+    Escuta as mutações feitas pelos outros workers e descarta as cópias
+    locais (tabela de cotações e body do GET /currencies).
+    """
+    redis = AsyncRedisRepository()
+    while True:
+        try:
+            async for message in redis.subscribe(CURRENCY_INVALIDATION_CHANNEL):
+                apply_invalidation(message)
+        except Exception as error:
+            logger.error("Error in invalidation listener", extra={"error": error})
+        await asyncio.sleep(RECONNECT_DELAY)
@@ -1,3 +1,6 @@
+import numpy as np
+
+
 def amount_from_api_response(
     from_: str, to: str, amount: float, actual_values: dict
 ) -> str:
@@ -14,3 +17,16 @@ def amount_from_bd_response(from_value: str, to_value: str, amount: float) -> st
     quotation = from_value / to_value
     value = quotation * amount
     return f"{value:.6f}"
+
+
+def amounts_from_bd_response(
+    from_values: list[float], to_values: list[float], amounts: list[float]
+) -> list[str]:
+    """
+    Versão vetorizada do amount_from_bd_response, mesma ordem de operações
+    e mesma formatação para cada conversão.
+    """
+    from_array = np.asarray(from_values, dtype=np.float64)
+    to_array = np.asarray(to_values, dtype=np.float64)
+    values = (from_array / to_array) * np.asarray(amounts, dtype=np.float64)
+    return [f"{value:.6f}" for value in values.tolist()]
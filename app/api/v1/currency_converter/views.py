@@ -3,40 +3,56 @@ from typing import Annotated
 
 from fastapi import (
     APIRouter,
+    Header,
     Path,
     Query,
     status,
 )
-from fastapi.responses import JSONResponse
+from fastapi.responses import (
+    ORJSONResponse,
+    Response,
+    StreamingResponse,
+)
 
 from app.api.v1.currency_converter.exceptions import GenericApiException
 from app.api.v1.currency_converter.models import (
     Currency,
+    CurrencyExchangeBatchRequest,
     UpdateCurrency,
 )
+from app.api.v1.currency_converter.rate_table import rate_table
+from app.api.v1.currency_converter.response_cache import etag_matches
 from app.api.v1.currency_converter.service import CurrencyConverterService
-from app.exceptions.default_exceptions import DefaultApiException
+from app.exceptions.default_exceptions import (
+    CircuitOpenException,
+    DefaultApiException,
+)
+from app.utils.config import return_default_settings
 
 logger = logging.getLogger(__name__)
+settings = return_default_settings()
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
 router = APIRouter(tags=["Currency"])
 
 
 @router.get(
     path="/currency/{acronym}",
-    response_class=JSONResponse,
+    response_class=ORJSONResponse,
     status_code=status.HTTP_200_OK,
 )
-def get_currency(
+async def get_currency(
     acronym: Annotated[str, Path(title="Currency Acronym to return")]
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Returns the currency we created in our database by they name
     """
     service = CurrencyConverterService()
     try:
-        if response := service.get_currency(acronym):
-            return JSONResponse(content=response, status_code=status.HTTP_200_OK)
-        return JSONResponse(content={}, status_code=status.HTTP_404_NOT_FOUND)
+        if response := await service.get_currency(acronym):
+            return ORJSONResponse(content=response, status_code=status.HTTP_200_OK)
+        return ORJSONResponse(content={}, status_code=status.HTTP_404_NOT_FOUND)
+    except CircuitOpenException as error:
+        raise error
     except Exception as error:
         logger.error("Unmapped error", extra={"error": error})
         raise GenericApiException()
@@ -44,43 +60,43 @@ def get_currency(
 
 @router.post(
     path="/currency/{acronym}",
-    response_class=JSONResponse,
+    response_class=ORJSONResponse,
     status_code=status.HTTP_200_OK,
 )
-def create_currency(
+async def create_currency(
     acronym: Annotated[str, Path(title="Currency Acronym to create")],
     payload: Currency,
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Create a currency in our database
     """
     payload.acronym = acronym
     service = CurrencyConverterService()
     try:
-        id = service.create_currency(payload)
+        id = await service.create_currency(payload)
     except DefaultApiException as error:
         raise error
     except Exception as error:
         logger.error("Unmapped error", extra={"error": error})
         raise GenericApiException()
-    return JSONResponse(content={"id": id}, status_code=status.HTTP_201_CREATED)
+    return ORJSONResponse(content={"id": id}, status_code=status.HTTP_201_CREATED)
 
 
 @router.put(
     path="/currency/{acronym}",
-    response_class=JSONResponse,
+    response_class=ORJSONResponse,
     status_code=status.HTTP_200_OK,
 )
-def update_currency(
+async def update_currency(
     acronym: Annotated[str, Path(title="Currency Acronym to update")],
     payload: UpdateCurrency,
-) -> JSONResponse:
+) -> ORJSONResponse:
 
     service = CurrencyConverterService()
     payload.acronym = acronym
     try:
-        if service.update_currency(payload):
-            return JSONResponse(
+        if await service.update_currency(payload):
+            return ORJSONResponse(
                 content={"acronym": acronym}, status_code=status.HTTP_200_OK
             )
     except DefaultApiException as error:
@@ -92,52 +108,82 @@ def update_currency(
 
 @router.delete(
     path="/currency/{acronym}",
-    response_class=JSONResponse,
+    response_class=ORJSONResponse,
     status_code=status.HTTP_200_OK,
 )
-def delete_currency_by_acronym(
+async def delete_currency_by_acronym(
     acronym: Annotated[str, Path(title="Currency Acronym to delete")],
-) -> JSONResponse:
+) -> ORJSONResponse:
 
     service = CurrencyConverterService()
     try:
-        acronym = service.delete_currency(acronym)
+        acronym = await service.delete_currency(acronym)
     except DefaultApiException as error:
         raise error
     except Exception as error:
         logger.error("Unmapped error", extra={"error": error})
         raise GenericApiException()
-    return JSONResponse(content={"acronym": acronym}, status_code=status.HTTP_200_OK)
+    return ORJSONResponse(content={"acronym": acronym}, status_code=status.HTTP_200_OK)
 
 
 @router.get(
     path="/currencies",
-    response_class=JSONResponse,
+    response_class=Response,
     status_code=status.HTTP_200_OK,
 )
-def get_all_currency() -> JSONResponse:
+async def get_all_currency(
+    if_none_match: Annotated[str | None, Header()] = None,
+    after: Annotated[str | None, Query(title="Last acronym of the page")] = None,
+    limit: Annotated[
+        int | None, Query(ge=1, le=settings.CURRENCIES_MAX_PAGE_SIZE)
+    ] = None,
+    stream: Annotated[bool, Query(title="Stream the currencies as NDJSON")] = False,
+) -> Response:
     """
-    Returns all the currencys we created in our database
+    Returns all the currencys we created in our database.
+    With after/limit returns one page ordered by acronym, with stream
+    returns every currency as NDJSON
     """
     service = CurrencyConverterService()
+    after = after.upper() if after else None
     try:
-        if response := service.get_all_currency():
-            return JSONResponse(content=response, status_code=status.HTTP_200_OK)
+        if stream:
+            chunks = await service.stream_currencies(after)
+            return StreamingResponse(chunks, media_type=NDJSON_MEDIA_TYPE)
+        if after or limit:
+            page = await service.get_currency_page(
+                after, limit or settings.CURRENCIES_PAGE_SIZE
+            )
+            return ORJSONResponse(content=page, status_code=status.HTTP_200_OK)
+        cached = await service.get_all_currency_response()
+    except CircuitOpenException as error:
+        raise error
     except Exception as error:
         logger.error("Unmapped error", extra={"error": error})
         raise GenericApiException()
 
+    headers = {"ETag": cached.etag}
+    if etag_matches(cached.etag, if_none_match):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    # O body já está serializado, é enviado direto sem passar pelo ORJSONResponse.
+    return Response(
+        content=cached.body,
+        media_type="application/json",
+        headers=headers,
+        status_code=status.HTTP_200_OK,
+    )
+
 
 @router.get(
     path="/currency_exchange",
-    response_class=JSONResponse,
+    response_class=ORJSONResponse,
     status_code=status.HTTP_200_OK,
 )
-def currency_exchange(
+async def currency_exchange(
     from_: str = Query(alias="from"),
     to: str = Query(),
     amount: float = Query(),
-) -> JSONResponse:
+) -> ORJSONResponse:
     """
     Return the value of the amount of a conversion between one currency and another
     """
@@ -145,12 +191,64 @@ def currency_exchange(
     from_, to = from_.upper(), to.upper()
     service = CurrencyConverterService()
     try:
-        converted_value = service.currency_exchange(from_, to, amount)
-        return JSONResponse(
-            content={"converted_value": converted_value}, status_code=status.HTTP_200_OK
+        converted_value = await service.currency_exchange(from_, to, amount)
+        return ORJSONResponse(
+            content={"converted_value": converted_value},
+            headers={"Age": str(int(service.rate_age))},
+            status_code=status.HTTP_200_OK,
+        )
+    except DefaultApiException as error:
+        raise error
+    except Exception as error:
+        logger.error("Unmapped error", extra={"error": error})
+        raise GenericApiException()
+
+
+@router.post(
+    path="/currency_exchange/batch",
+    response_class=ORJSONResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def currency_exchange_batch(
+    payload: CurrencyExchangeBatchRequest,
+) -> ORJSONResponse:
+    """
+    Return the converted values of many conversions, in the same order they were sent
+    """
+    service = CurrencyConverterService()
+    try:
+        converted_values = await service.currency_exchange_batch(payload.conversions)
+        return ORJSONResponse(
+            content={"converted_values": converted_values},
+            headers={"Age": str(int(service.rate_age))},
+            status_code=status.HTTP_200_OK,
         )
     except DefaultApiException as error:
         raise error
     except Exception as error:
         logger.error("Unmapped error", extra={"error": error})
         raise GenericApiException()
+
+
+@router.get(
+    path="/currency_matrix",
+    response_class=ORJSONResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def get_currency_matrix() -> ORJSONResponse:
+    """
+    Return every cross rate between the currencies, matrix[i][j] is the value
+    of one unit of acronyms[i] in acronyms[j]
+    """
+    service = CurrencyConverterService()
+    try:
+        if not rate_table.matrix.acronyms:
+            rate_table.load(await service.get_all_rates())
+        content = rate_table.matrix.to_dict()
+        content["version"] = rate_table.version
+        return ORJSONResponse(content=content, status_code=status.HTTP_200_OK)
+    except CircuitOpenException as error:
+        raise error
+    except Exception as error:
+        logger.error("Unmapped error", extra={"error": error})
+        raise GenericApiException()
@@ -0,0 +1,25 @@
+from typing import (
+    Literal,
+    get_args,
+)
+
+from pydantic import (
+    BaseModel,
+    Field,
+)
+
+from app.api.v1.words.sort.models import SortOptions
+
+Stage = Literal[
+    "sort", "vowel_count", "consonant_count", "length_histogram", "char_frequency"
+]
+
+
+class AnalyzeWordsRequest(BaseModel):
+    words: list[str]
+    stages: list[Stage] = Field(default=list(get_args(Stage)), min_length=1)
+    sort: SortOptions = SortOptions(order="asc")
+
+
+class AnalyzeWordsResponse(BaseModel):
+    response: dict
@@ -0,0 +1,37 @@
+import logging
+
+from app.api.v1.words.analyze.exceptions import AnalyzeWordsException
+from app.api.v1.words.analyze.models import (
+    AnalyzeWordsRequest,
+    AnalyzeWordsResponse,
+)
+from app.api.v1.words.analyze.stages import (
+    STAGES,
+    AnalysisContext,
+)
+from app.exceptions.default_exceptions import DefaultApiException
+
+logger = logging.getLogger(__name__)
+
+
+class AnalyzeWordsService:
+
+    def analyze_words(self, analyze_words: AnalyzeWordsRequest) -> AnalyzeWordsResponse:
+        """
+        Executa os estágios pedidos, na ordem pedida, sobre o mesmo payload
+        já validado. Os estágios compartilham o AnalysisContext, então o
+        buffer com as palavras é montado uma vez só.
+        """
+        context = AnalysisContext(analyze_words)
+        response = {}
+        try:
+            for name in dict.fromkeys(analyze_words.stages):
+                response[name] = STAGES[name]().run(context)
+        except DefaultApiException as error:
+            raise error
+        except Exception as error:
+            logger.error(
+                "Unmapped error in AnalyzeWordsService", extra={"error": error}
+            )
+            raise AnalyzeWordsException()
+        return response
@@ -0,0 +1,134 @@
+from functools import cached_property
+
+import numpy as np
+from unidecode import unidecode
+
+from app.api.v1.words.analyze.models import AnalyzeWordsRequest
+from app.api.v1.words.sort.models import SortWordsRequest
+from app.api.v1.words.sort.service import SortWordService
+from app.api.v1.words.vowel_count.service import VowelCountService
+from app.api.v1.words.vowel_count.utils import (
+    ENCODING_ERRORS,
+    VOWELS,
+    count_per_code,
+)
+
+CONSONANTS = "".join(
+    letter
+    for letter in "abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ"
+    if letter not in VOWELS
+)
+# Tabela código -> 1 se o caractere ASCII é uma consoante.
+ASCII_CONSONANT_TABLE = np.zeros(128, dtype=np.int64)
+ASCII_CONSONANT_TABLE[np.frombuffer(CONSONANTS.encode("ascii"), dtype=np.uint8)] = 1
+
+
+def count_word_consonants(word: str) -> int:
+    decoded_word = unidecode(word)
+    return sum(decoded_word.count(consonant) for consonant in CONSONANTS)
+
+
+class AnalysisContext:
+    """
+    Dados compartilhados pelos estágios de uma análise. O payload é
+    convertido uma vez só num buffer de code points (todas as palavras
+    juntas) e no tamanho de cada palavra, e todos os estágios que contam
+    caracteres trabalham em cima deles.
+    """
+
+    def __init__(self, request: AnalyzeWordsRequest) -> None:
+        self.request = request
+        self.words = request.words
+
+    @cached_property
+    def codes(self) -> np.ndarray:
+        text = "".join(self.words).encode("utf-32-le", ENCODING_ERRORS)
+        return np.frombuffer(text, dtype=np.uint32)
+
+    @cached_property
+    def lengths(self) -> np.ndarray:
+        return np.fromiter(map(len, self.words), dtype=np.int64, count=len(self.words))
+
+    @cached_property
+    def starts(self) -> np.ndarray:
+        """
+        Posição de cada palavra no buffer, sem precisar de separador.
+        """
+        return np.concatenate(([0], np.cumsum(self.lengths[:-1])))
+
+    def sum_per_word(self, counts: np.ndarray) -> np.ndarray:
+        """
+        Soma as contagens de cada code point por palavra. counts tem um item
+        extra no final (ver count_per_code).
+        """
+        totals = np.add.reduceat(counts, self.starts)
+        # O reduceat retorna o item da posição para os intervalos vazios.
+        totals[self.lengths == 0] = 0
+        return totals
+
+
+class SortStage:
+    name = "sort"
+
+    def run(self, context: AnalysisContext) -> list[str]:
+        # model_construct evita validar as palavras de novo, e a cópia da
+        # lista evita que o sort (in place) mude a ordem para os outros.
+        request = SortWordsRequest.model_construct(
+            words=list(context.words), **dict(context.request.sort)
+        )
+        return SortWordService().sort_words(request)
+
+
+class VowelCountStage:
+    name = "vowel_count"
+
+    def run(self, context: AnalysisContext) -> dict[str, int]:
+        return VowelCountService().return_total_vowels(context.words)
+
+
+class ConsonantCountStage:
+    name = "consonant_count"
+
+    def run(self, context: AnalysisContext) -> dict[str, int]:
+        if not context.words:
+            return {}
+        consonants = count_per_code(
+            context.codes, ASCII_CONSONANT_TABLE, count_word_consonants
+        )
+        return dict(zip(context.words, context.sum_per_word(consonants).tolist()))
+
+
+class LengthHistogramStage:
+    name = "length_histogram"
+
+    def run(self, context: AnalysisContext) -> dict[int, int]:
+        """
+        Quantas palavras do payload (com repetição) têm cada tamanho.
+        """
+        histogram = np.bincount(context.lengths)
+        sizes = np.flatnonzero(histogram)
+        return dict(zip(sizes.tolist(), histogram[sizes].tolist()))
+
+
+class CharFrequencyStage:
+    name = "char_frequency"
+
+    def run(self, context: AnalysisContext) -> dict[str, int]:
+        """
+        Quantas vezes cada caractere aparece no payload, como foi enviado.
+        """
+        frequencies = np.bincount(context.codes)
+        codes = np.flatnonzero(frequencies)
+        return dict(zip(map(chr, codes.tolist()), frequencies[codes].tolist()))
+
+
+STAGES: dict[str, type] = {
+    stage.name: stage
+    for stage in (
+        SortStage,
+        VowelCountStage,
+        ConsonantCountStage,
+        LengthHistogramStage,
+        CharFrequencyStage,
+    )
+}
@@ -0,0 +1,38 @@
+import logging
+
+from fastapi import (
+    APIRouter,
+    status,
+)
+
+from app.api.v1.words.analyze.models import AnalyzeWordsRequest
+from app.api.v1.words.analyze.service import AnalyzeWordsService
+from app.exceptions.default_exceptions import (
+    DefaultApiException,
+    InternalServerErrorException,
+)
+from app.utils.json_body import ORJSONFallbackResponse
+
+router = APIRouter(tags=["Words"])
+logger = logging.getLogger(__name__)
+
+
+@router.post(
+    path="/words/analyze",
+    response_class=ORJSONFallbackResponse,
+    status_code=status.HTTP_200_OK,
+)
+def analyze_words(payload: AnalyzeWordsRequest) -> ORJSONFallbackResponse:
+    """
+    Runs the chosen stages (sort, vowel_count, consonant_count,
+    length_histogram, char_frequency) over one parse of the words
+    """
+    service = AnalyzeWordsService()
+    try:
+        response = service.analyze_words(payload)
+        return ORJSONFallbackResponse(content=response, status_code=status.HTTP_200_OK)
+    except DefaultApiException as error:
+        raise error
+    except Exception as error:
+        logger.error("Unmapped error", extra={"error": error})
+        raise InternalServerErrorException()
@@ -0,0 +1,146 @@
+import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import repeat
+from multiprocessing import get_context
+
+import numpy as np
+
+from app.api.v1.words.vowel_count.utils import (
+    ENCODING_ERRORS,
+    WORD_SEPARATOR,
+    count_joined_vowels,
+    count_vowels,
+)
+from app.utils.config import return_default_settings
+
+logger = logging.getLogger(__name__)
+settings = return_default_settings()
+ENCODING = "utf-8"
+
+_process_pool: ProcessPoolExecutor | None = None
+
+
+def pool_size() -> int:
+    return settings.WORDS_PARALLEL_WORKERS or os.cpu_count() or 1
+
+
+def get_process_pool() -> ProcessPoolExecutor:
+    """
+    Retorna o pool de processos do worker, criando na primeira chamada.
+    Usa spawn para não herdar as threads e o event loop do servidor.
+    """
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = ProcessPoolExecutor(
+            max_workers=pool_size(), mp_context=get_context("spawn")
+        )
+    return _process_pool
+
+
+def close_process_pool() -> None:
+    global _process_pool
+    if _process_pool is not None:
+        _process_pool.shutdown(wait=False, cancel_futures=True)
+        _process_pool = None
+
+
+def parallel_enabled() -> bool:
+    return settings.WORDS_PARALLEL_THRESHOLD > 0 and pool_size() > 1
+
+
+def should_run_in_parallel(total_words: int) -> bool:
+    """
+    Só listas a partir de WORDS_PARALLEL_THRESHOLD palavras vão para o
+    pool, abaixo disso mandar os dados para outro processo custa mais do
+    que processar aqui. Threshold 0 desliga.
+    """
+    return parallel_enabled() and settings.WORDS_PARALLEL_THRESHOLD <= total_words
+
+
+def warm_up_process_pool() -> None:
+    """
+    Cria o pool e sobe os processos no startup, para a primeira lista
+    grande não pagar o spawn dentro da requisição.
+    """
+    workers = pool_size()
+    list(get_process_pool().map(count_vowels_shard, [b"a"] * workers, [1] * workers))
+
+
+def encode_shards(words: list[str], shards: int) -> list[tuple[bytes, int]] | None:
+    """
+    Divide as palavras em partes contíguas, cada uma unida por
+    WORD_SEPARATOR num único bytes (bem mais barato de mandar para outro
+    processo do que uma lista de str). Retorna None se alguma palavra tem
+    o separador dentro.
+    """
+    size = -(-len(words) // shards)
+    encoded = []
+    for start in range(0, len(words), size):
+        stop = start + size
+        shard = words[start:stop]
+        text = WORD_SEPARATOR.join(shard)
+        if text.count(WORD_SEPARATOR) != len(shard) - 1:
+            return None
+        encoded.append((text.encode(ENCODING, ENCODING_ERRORS), len(shard)))
+    return encoded
+
+
+def decode_words(buffer: bytes) -> list[str]:
+    return buffer.decode(ENCODING, ENCODING_ERRORS).split(WORD_SEPARATOR)
+
+
+def count_vowels_shard(buffer: bytes, total_words: int) -> np.ndarray | None:
+    return count_joined_vowels(buffer.decode(ENCODING, ENCODING_ERRORS), total_words)
+
+
+def sort_shard(buffer: bytes, reverse: bool) -> bytes:
+    words = decode_words(buffer)
+    words.sort(reverse=reverse)
+    return WORD_SEPARATOR.join(words).encode(ENCODING, ENCODING_ERRORS)
+
+
+def merge_sorted_runs(runs: list[list[str]], reverse: bool = False) -> list[str]:
+    """
+    Merge das partes já ordenadas. O Timsort reconhece cada parte como um
+    run e só faz os merges entre eles, em C, bem mais rápido que um
+    heapq.merge em Python.
+    """
+    merged = []
+    for run in runs:
+        merged.extend(run)
+    merged.sort(reverse=reverse)
+    return merged
+
+
+def map_shards(function, *iterables) -> list | None:
+    """
+    Roda a função nos shards pelo pool. Se um processo do pool morreu
+    (ex.: OOM) o pool quebrado é descartado, o próximo é criado de novo,
+    e retorna None para quem chamou processar aqui mesmo.
+    """
+    try:
+        return list(get_process_pool().map(function, *iterables))
+    except BrokenProcessPool as error:
+        logger.error("Process pool is broken, running serially", extra={"error": error})
+        close_process_pool()
+        return None
+
+
+def parallel_count_vowels(words: list[str]) -> list[int]:
+    if (shards := encode_shards(words, pool_size())) is None:
+        return count_vowels(words)
+    buffers, sizes = zip(*shards)
+    if (totals := map_shards(count_vowels_shard, buffers, sizes)) is None:
+        return count_vowels(words)
+    return np.concatenate(totals).tolist()
+
+
+def parallel_sort(words: list[str], reverse: bool = False) -> list[str]:
+    if (shards := encode_shards(words, pool_size())) is None:
+        return sorted(words, reverse=reverse)
+    buffers = [buffer for buffer, _ in shards]
+    if (runs := map_shards(sort_shard, buffers, repeat(reverse))) is None:
+        return sorted(words, reverse=reverse)
+    return merge_sorted_runs([decode_words(run) for run in runs], reverse)
@@ -0,0 +1,71 @@
+import re
+from typing import (
+    Any,
+    Callable,
+)
+
+from unidecode import unidecode
+
+DEFAULT = "default"
+CASE_INSENSITIVE = "case_insensitive"
+ACCENT_INSENSITIVE = "accent_insensitive"
+NATURAL = "natural"
+DIGITS = re.compile(r"([0-9]+)")
+
+
+class TransliterationTable(dict):
+    """
+    Tabela do str.translate preenchida sob demanda: o unidecode translitera
+    caractere a caractere, então cada caractere distinto passa por ele uma
+    vez só, em vez de a palavra inteira passar de novo a cada chamada.
+    """
+
+    def __missing__(self, code: int) -> str:
+        self[code] = transliterated = unidecode(chr(code))
+        return transliterated
+
+
+transliteration_table = TransliterationTable()
+
+# As chaves terminam com a própria palavra para desempatar, assim palavras
+# com a mesma chave ("Casa" e "casa") saem sempre na mesma ordem.
+
+
+def case_insensitive_key(word: str) -> tuple:
+    return (word.casefold(), word)
+
+
+def accent_insensitive_key(word: str) -> tuple:
+    """
+    Ordem de dicionário: ignora acentos (via unidecode) e maiúsculas,
+    "Árvore" fica junto de "arvore", antes de "zebra".
+    """
+    return (word.translate(transliteration_table).casefold(), word)
+
+
+def natural_key(word: str) -> tuple:
+    """
+    Compara os trechos de dígitos pelo valor, "item2" antes de "item10".
+    Os números viram (quantidade de dígitos, dígitos) em vez de int para
+    não ter limite de tamanho e continuarem serializáveis em JSON.
+    """
+    parts = DIGITS.split(word)
+    for index in range(1, len(parts), 2):
+        digits = parts[index].lstrip("0")
+        parts[index] = (len(digits), digits)
+    return (parts, word)
+
+
+COLLATION_KEYS: dict[str, Callable[[str], Any]] = {
+    CASE_INSENSITIVE: case_insensitive_key,
+    ACCENT_INSENSITIVE: accent_insensitive_key,
+    NATURAL: natural_key,
+}
+
+
+def get_collation_key(collation: str) -> Callable[[str], Any] | None:
+    """
+    Retorna a função de chave da collation, None na ordem padrão (por
+    code point), que não precisa de chave.
+    """
+    return COLLATION_KEYS.get(collation)
@@ -0,0 +1,134 @@
+import heapq
+from operator import itemgetter
+from tempfile import TemporaryFile
+from typing import (
+    IO,
+    Any,
+    AsyncIterator,
+    Callable,
+    Iterator,
+)
+
+import orjson
+
+# Custo aproximado de cada palavra na memória além dos caracteres: o
+# objeto str e o ponteiro na lista.
+WORD_OVERHEAD = 57
+
+
+async def iter_ndjson_words(chunks: AsyncIterator[bytes]) -> AsyncIterator[list[str]]:
+    """
+    Lê um body NDJSON (uma string JSON por linha) aos pedaços, retornando
+    as palavras de cada pedaço sem esperar o body inteiro. Linhas vazias
+    são ignoradas, qualquer linha que não seja uma string JSON gera
+    ValueError.
+    """
+    remainder = b""
+    async for chunk in chunks:
+        lines = (remainder + chunk).split(b"\n")
+        remainder = lines.pop()
+        if words := parse_ndjson_lines(lines):
+            yield words
+    if words := parse_ndjson_lines([remainder]):
+        yield words
+
+
+def parse_ndjson_lines(lines: list[bytes]) -> list[str]:
+    words = [orjson.loads(line) for line in lines if line.strip()]
+    if not all(isinstance(word, str) for word in words):
+        raise ValueError("Every NDJSON line must be a JSON string")
+    return words
+
+
+class ExternalSorter:
+    """
+    Ordena mais palavras do que cabem no orçamento de memória: quando o
+    buffer passa de memory_budget bytes ele é ordenado e gravado num
+    arquivo temporário (um run), e no final os runs são lidos juntos num
+    merge k-way, retornando as palavras enquanto o merge anda.
+
+    Com uma função de chave (collation), cada run guarda os pares
+    [chave, palavra], e o merge compara as chaves já calculadas.
+    """
+
+    def __init__(
+        self,
+        memory_budget: int,
+        reverse: bool = False,
+        key: Callable[[str], Any] | None = None,
+        temp_dir: str | None = None,
+    ) -> None:
+        self.memory_budget = memory_budget
+        self.reverse = reverse
+        self.key = key
+        self.temp_dir = temp_dir
+        self._buffer: list[str] = []
+        self._buffer_size = 0
+        self._runs: list[IO[bytes]] = []
+
+    @property
+    def runs(self) -> int:
+        return len(self._runs)
+
+    def extend(self, words: list[str]) -> bool:
+        """
+        Adiciona as palavras ao buffer, retornando True quando ele passou do
+        orçamento e precisa ser gravado com spill().
+        """
+        self._buffer.extend(words)
+        self._buffer_size += sum(map(len, words)) + len(words) * WORD_OVERHEAD
+        return self._buffer_size > self.memory_budget
+
+    def spill(self) -> None:
+        if not self._buffer:
+            return
+        if self.key is None:
+            self._buffer.sort(reverse=self.reverse)
+            items = self._buffer
+        else:
+            items = [(self.key(word), word) for word in self._buffer]
+            items.sort(key=itemgetter(0), reverse=self.reverse)
+        run = TemporaryFile(dir=self.temp_dir)
+        # O JSON escapa as quebras de linha de dentro das palavras.
+        run.writelines(orjson.dumps(item) + b"\n" for item in items)
+        run.seek(0)
+        self._runs.append(run)
+        self._buffer = []
+        self._buffer_size = 0
+
+    def iter_sorted(self) -> Iterator[str]:
+        try:
+            if not self._runs:
+                self._buffer.sort(key=self.key, reverse=self.reverse)
+                yield from self._buffer
+                return
+            self.spill()
+            runs = [map(orjson.loads, run) for run in self._runs]
+            if self.key is None:
+                yield from heapq.merge(*runs, reverse=self.reverse)
+                return
+            merged = heapq.merge(*runs, key=itemgetter(0), reverse=self.reverse)
+            yield from map(itemgetter(1), merged)
+        finally:
+            self.close()
+
+    def iter_ndjson(self, batch_size: int) -> Iterator[bytes]:
+        """
+        Retorna as palavras ordenadas em NDJSON, batch_size palavras por
+        pedaço.
+        """
+        batch = []
+        for word in self.iter_sorted():
+            batch.append(orjson.dumps(word) + b"\n")
+            if len(batch) >= batch_size:
+                yield b"".join(batch)
+                batch = []
+        if batch:
+            yield b"".join(batch)
+
+    def close(self) -> None:
+        for run in self._runs:
+            run.close()
+        self._runs = []
+        self._buffer = []
+        self._buffer_size = 0
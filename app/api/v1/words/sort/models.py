@@ -1,9 +1,23 @@
-from pydantic import BaseModel
+from typing import Literal
 
+from pydantic import (
+    BaseModel,
+    Field,
+)
 
-class SortWordsRequest(BaseModel):
-    words: list[str]
+Collation = Literal["default", "case_insensitive", "accent_insensitive", "natural"]
+
+
+class SortOptions(BaseModel):
     order: str
+    collation: Collation = "default"
+    limit: int | None = Field(default=None, ge=1)
+    offset: int = Field(default=0, ge=0)
+    unique: bool = False
+
+
+class SortWordsRequest(SortOptions):
+    words: list[str]
 
 
 class SortWordsResponse(BaseModel):
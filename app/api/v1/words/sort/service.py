@@ -1,12 +1,35 @@
+import heapq
 import logging
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Iterator,
+)
+
+from fastapi.concurrency import run_in_threadpool
 
+from app.api.v1.words.parallel import (
+    parallel_sort,
+    should_run_in_parallel,
+)
+from app.api.v1.words.sort.collation import (
+    DEFAULT,
+    get_collation_key,
+)
 from app.api.v1.words.sort.exceptions import SortWordsException
+from app.api.v1.words.sort.external_sort import (
+    ExternalSorter,
+    iter_ndjson_words,
+)
 from app.api.v1.words.sort.models import (
     SortWordsRequest,
     SortWordsResponse,
 )
+from app.utils.config import return_default_settings
 
 logger = logging.getLogger(__name__)
+settings = return_default_settings()
 
 
 class SortWordService:
@@ -18,13 +41,83 @@ class SortWordService:
         try:
             match sort_words.order:
                 case self.ASCENDING:
-                    sort_words.words.sort()
-                    return sort_words.words
+                    reverse = False
                 case self.DESCENDING:
-                    sort_words.words.sort(reverse=True)
-                    return sort_words.words
+                    reverse = True
                 case _:
                     return sort_words.words
+
+            key = get_collation_key(sort_words.collation)
+            words, offset = sort_words.words, sort_words.offset
+            if sort_words.unique:
+                # Remove as repetidas antes de ordenar (a comparação é exata,
+                # não pela collation).
+                words = list(dict.fromkeys(words))
+            if sort_words.limit is not None:
+                return self._top_k(words, offset, sort_words.limit, reverse, key)
+            words = self._sort(words, reverse=reverse, key=key)
+            return words[offset:] if offset else words
         except Exception as error:
             logger.error("Unmapped error in SortWordService", extra={"error": error})
             raise SortWordsException()
+
+    async def sort_words_stream(
+        self, chunks: AsyncIterator[bytes], order: str, collation: str = DEFAULT
+    ) -> Iterator[bytes]:
+        """
+        Ordena as palavras de um body NDJSON lido aos pedaços, gravando runs
+        ordenados em disco quando passa de WORDS_SORT_MEMORY_BUDGET. Retorna
+        o resultado em NDJSON, gerado pelo merge dos runs enquanto é enviado.
+        """
+        sorter = ExternalSorter(
+            settings.WORDS_SORT_MEMORY_BUDGET,
+            reverse=order == self.DESCENDING,
+            key=get_collation_key(collation),
+            temp_dir=settings.WORDS_SORT_TEMP_DIR,
+        )
+        try:
+            async for words in iter_ndjson_words(chunks):
+                if sorter.extend(words):
+                    await run_in_threadpool(sorter.spill)
+        except Exception as error:
+            sorter.close()
+            logger.error("Unmapped error in SortWordService", extra={"error": error})
+            raise SortWordsException()
+        return sorter.iter_ndjson(settings.WORDS_SORT_STREAM_BATCH_SIZE)
+
+    def _sort(
+        self,
+        words: list[str],
+        reverse: bool = False,
+        key: Callable[[str], Any] | None = None,
+    ) -> list[str]:
+        """
+        Com collation, o sort calcula a chave de cada palavra uma vez só e
+        compara as chaves prontas (decorate-sort-undecorate). O pool de
+        processos é usado só na ordem padrão, o merge dos shards teria que
+        calcular as chaves de novo.
+        """
+        if key is None and should_run_in_parallel(len(words)):
+            return parallel_sort(words, reverse=reverse)
+        words.sort(key=key, reverse=reverse)
+        return words
+
+    def _top_k(
+        self,
+        words: list[str],
+        offset: int,
+        limit: int,
+        reverse: bool = False,
+        key: Callable[[str], Any] | None = None,
+    ) -> list[str]:
+        """
+        Seleciona só as offset + limit primeiras palavras com um heap, em
+        O(n log k), sem ordenar a lista inteira.
+        """
+        total = offset + limit
+        if total >= len(words):
+            selected = self._sort(words, reverse=reverse, key=key)
+        else:
+            select = heapq.nlargest if reverse else heapq.nsmallest
+            selected = select(total, words, key=key)
+        return selected[offset:total]
@@ -1,20 +1,61 @@
+from typing import (
+    Annotated,
+    Literal,
+)
+
 from fastapi import (
     APIRouter,
+    Depends,
+    Query,
+    Request,
     status,
 )
-from fastapi.responses import JSONResponse
+from fastapi.responses import StreamingResponse
 
-from app.api.v1.words.sort.models import SortWordsRequest
+from app.api.v1.words.sort.models import (
+    Collation,
+    SortWordsRequest,
+)
 from app.api.v1.words.sort.service import SortWordService
+from app.utils.json_body import (
+    ORJSONFallbackResponse,
+    json_body,
+    json_body_openapi,
+)
 
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
 router = APIRouter(tags=["Words"])
 
 
 @router.post(
-    path="/words/sort", response_class=JSONResponse, status_code=status.HTTP_200_OK
+    path="/words/sort",
+    response_class=ORJSONFallbackResponse,
+    status_code=status.HTTP_200_OK,
+    openapi_extra=json_body_openapi(SortWordsRequest),
 )
-def sort_words(payload: SortWordsRequest) -> JSONResponse:
+def sort_words(
+    payload: Annotated[SortWordsRequest, Depends(json_body(SortWordsRequest))],
+) -> ORJSONFallbackResponse:
     """ """
     service = SortWordService()
     response = service.sort_words(payload)
-    return JSONResponse(content=response, status_code=status.HTTP_200_OK)
+    return ORJSONFallbackResponse(content=response, status_code=status.HTTP_200_OK)
+
+
+@router.post(
+    path="/words/sort/stream",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+)
+async def sort_words_stream(
+    request: Request,
+    order: Annotated[Literal["asc", "desc"], Query()] = "asc",
+    collation: Annotated[Collation, Query()] = "default",
+) -> StreamingResponse:
+    """
+    Sorts the words sent as NDJSON (one JSON string per line) and
+    streams them back as NDJSON, spilling to disk on huge inputs
+    """
+    service = SortWordService()
+    chunks = await service.sort_words_stream(request.stream(), order, collation)
+    return StreamingResponse(chunks, media_type=NDJSON_MEDIA_TYPE)
@@ -0,0 +1,79 @@
+from collections import OrderedDict
+from threading import Lock
+
+from app.utils.config import return_default_settings
+
+settings = return_default_settings()
+
+
+class VowelCountCache:
+    """
+    Cache LRU em memória (por worker) de palavra -> total de vogais,
+    compartilhado entre as requisições. Quando passa de maxsize, as
+    palavras usadas há mais tempo são descartadas; maxsize 0 desliga.
+    """
+
+    def __init__(self, maxsize: int) -> None:
+        self.maxsize = maxsize
+        self._entries: OrderedDict[str, int] = OrderedDict()
+        # O endpoint é síncrono e roda no threadpool do FastAPI.
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_many(self, words: dict[str, int | None]) -> list[str]:
+        """
+        Preenche as palavras encontradas no cache e retorna as que faltam.
+        """
+        missing = []
+        with self._lock:
+            entries = self._entries
+            for word in words:
+                if (total := entries.get(word)) is None:
+                    missing.append(word)
+                    continue
+                entries.move_to_end(word)
+                words[word] = total
+            self.hits += len(words) - len(missing)
+            self.misses += len(missing)
+        return missing
+
+    def set_many(self, words: list[str], totals: list[int]) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            entries = self._entries
+            if len(words) >= self.maxsize:
+                # Só as últimas maxsize palavras cabem, o resto sairia logo.
+                # As palavras novas vieram de misses, não estão no cache.
+                self.evictions += len(entries) + len(words) - self.maxsize
+                entries.clear()
+                start = len(words) - self.maxsize
+                entries.update(zip(words[start:], totals[start:]))
+                return
+            entries.update(zip(words, totals))
+            for word in words:
+                entries.move_to_end(word)
+            while len(entries) > self.maxsize:
+                entries.popitem(last=False)
+                self.evictions += 1
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+
+vowel_count_cache = VowelCountCache(maxsize=settings.VOWEL_COUNT_CACHE_SIZE)
@@ -1,18 +1,17 @@
 import logging
-from collections import Counter
-from types import SimpleNamespace
-
-from unidecode import unidecode
 
+from app.api.v1.words.parallel import (
+    parallel_count_vowels,
+    should_run_in_parallel,
+)
+from app.api.v1.words.vowel_count.cache import vowel_count_cache
 from app.api.v1.words.vowel_count.exceptions import VowelCountException
 from app.api.v1.words.vowel_count.models import VowelCountResponse
+from app.api.v1.words.vowel_count.utils import count_vowels
 
 logger = logging.getLogger(__name__)
 
 
-VOWELS = SimpleNamespace(A="a", E="e", I="i", O="o", U="u")
-
-
 class VowelCountService:
 
     def return_total_vowels(self, words: list[str]) -> VowelCountResponse:
@@ -22,21 +21,16 @@ class VowelCountService:
         :param words: list[str], contains a list of words to verify the
         total vowels existing in each word passed.
         """
-        response = {}
         try:
-            for word in words:
-                decode_word = unidecode(word)
-                word_count = Counter(decode_word)
-                count = sum(
-                    [
-                        word_count[VOWELS.A],
-                        word_count[VOWELS.E],
-                        word_count[VOWELS.I],
-                        word_count[VOWELS.O],
-                        word_count[VOWELS.U],
-                    ]
-                )
-                response.update({word: count})
+            # Palavras repetidas viram uma chave só e são contadas uma vez.
+            response = dict.fromkeys(words)
+            if missing := vowel_count_cache.get_many(response):
+                if should_run_in_parallel(len(missing)):
+                    totals = parallel_count_vowels(missing)
+                else:
+                    totals = count_vowels(missing)
+                vowel_count_cache.set_many(missing, totals)
+                response.update(zip(missing, totals))
         except Exception as error:
             logger.error("Unmapped error in VowelCountService", extra={"error": error})
             raise VowelCountException()
@@ -0,0 +1,69 @@
+from typing import Callable
+
+import numpy as np
+from unidecode import unidecode
+
+VOWELS = "aeiouAEIOU"
+# Tabela código -> 1 se o caractere ASCII é uma vogal.
+ASCII_VOWEL_TABLE = np.zeros(128, dtype=np.int64)
+ASCII_VOWEL_TABLE[np.frombuffer(VOWELS.encode("ascii"), dtype=np.uint8)] = 1
+WORD_SEPARATOR = "\x00"
+# Aceita palavras com surrogates soltos, que o JSON permite.
+ENCODING_ERRORS = "surrogatepass"
+
+
+def count_word_vowels(word: str) -> int:
+    decoded_word = unidecode(word)
+    return sum(decoded_word.count(vowel) for vowel in VOWELS)
+
+
+def count_vowels(words: list[str]) -> list[int]:
+    """
+    Conta as vogais (maiúsculas e minúsculas, sem acento) de várias
+    palavras de uma vez, sobre um único buffer com todas elas.
+    """
+    if not words:
+        return []
+    totals = count_joined_vowels(WORD_SEPARATOR.join(words), len(words))
+    if totals is None:
+        # Alguma palavra tem o separador dentro, conta uma por uma.
+        return [count_word_vowels(word) for word in words]
+    return totals.tolist()
+
+
+def count_joined_vowels(text: str, total_words: int) -> np.ndarray | None:
+    """
+    Conta as vogais de cada uma das total_words palavras de text, unidas
+    por WORD_SEPARATOR. Retorna None se o total de separadores não bate.
+    """
+    codes = np.frombuffer(text.encode("utf-32-le", ENCODING_ERRORS), dtype=np.uint32)
+    separators = np.flatnonzero(codes == 0)
+    if len(separators) != total_words - 1:
+        return None
+    vowels = count_per_code(codes, ASCII_VOWEL_TABLE, count_word_vowels)
+    starts = np.concatenate(([0], separators + 1))
+    return np.add.reduceat(vowels, starts)
+
+
+def count_per_code(
+    codes: np.ndarray, ascii_table: np.ndarray, count_word: Callable[[str], int]
+) -> np.ndarray:
+    """
+    Contagem de cada code point de codes: os ASCII pela tabela, e cada
+    caractere não ASCII distinto passa uma única vez por count_word (o
+    unidecode translitera caractere a caractere).
+
+    O array tem um item extra zerado no final, que garante que a última
+    palavra (mesmo vazia) tenha um intervalo válido no reduceat.
+    """
+    counts = np.zeros(len(codes) + 1, dtype=np.int64)
+    ascii_mask = codes < 128
+    counts[:-1][ascii_mask] = ascii_table[codes[ascii_mask]]
+    if not ascii_mask.all():
+        non_ascii_codes, positions = np.unique(codes[~ascii_mask], return_inverse=True)
+        non_ascii_counts = np.array(
+            [count_word(chr(code)) for code in non_ascii_codes.tolist()],
+            dtype=np.int64,
+        )
+        counts[:-1][~ascii_mask] = non_ascii_counts[positions]
+    return counts
@@ -1,15 +1,21 @@
 import logging
+from typing import Annotated
 
 from fastapi import (
     APIRouter,
+    Depends,
     status,
 )
-from fastapi.responses import JSONResponse
 
 from app.api.v1.words.vowel_count.exceptions import VowelCountException
 from app.api.v1.words.vowel_count.models import VowelCountRequest
 from app.api.v1.words.vowel_count.service import VowelCountService
 from app.exceptions.default_exceptions import InternalServerErrorException
+from app.utils.json_body import (
+    ORJSONFallbackResponse,
+    json_body,
+    json_body_openapi,
+)
 
 router = APIRouter(tags=["Words"])
 logger = logging.getLogger(__name__)
@@ -17,15 +23,18 @@ logger = logging.getLogger(__name__)
 
 @router.post(
     path="/words/vowel-count",
-    response_class=JSONResponse,
+    response_class=ORJSONFallbackResponse,
     status_code=status.HTTP_200_OK,
+    openapi_extra=json_body_openapi(VowelCountRequest),
 )
-def vowel_count(payload: VowelCountRequest) -> JSONResponse:
+def vowel_count(
+    payload: Annotated[VowelCountRequest, Depends(json_body(VowelCountRequest))],
+) -> ORJSONFallbackResponse:
     """ """
     service = VowelCountService()
     try:
         response = service.return_total_vowels(payload.words)
-        return JSONResponse(content=response, status_code=status.HTTP_200_OK)
+        return ORJSONFallbackResponse(content=response, status_code=status.HTTP_200_OK)
     except VowelCountException as error:
         raise error
     except Exception as error:
@@ -57,3 +57,17 @@ class MongoRepositoryTransactionsException(DefaultApiException):
         headers: Dict[str, str] | None = None,
     ) -> None:
         super().__init__(status_code, detail, headers)
+
+
+class ServiceUnavailableException(DefaultApiException):
+    def __init__(
+        self,
+        status_code: int = status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail: Any = {"error": "Service temporarily unavailable"},
+        headers: Dict[str, str] | None = None,
+    ) -> None:
+        super().__init__(status_code, detail, headers)
+
+
+class CircuitOpenException(ServiceUnavailableException):
+    pass
@@ -0,0 +1,67 @@
+import json
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from typing import Any
+
+import msgpack
+import orjson
+
+
+class RedisCodec(ABC):
+    """
+    Serializa os valores guardados no Redis, sempre como bytes.
+    """
+
+    name = ""
+
+    @abstractmethod
+    def encode(self, value: Any) -> bytes: ...
+
+    @abstractmethod
+    def decode(self, value: bytes) -> Any: ...
+
+
+class JsonCodec(RedisCodec):
+    name = "json"
+
+    def encode(self, value: Any) -> bytes:
+        return json.dumps(value).encode()
+
+    def decode(self, value: bytes) -> Any:
+        return json.loads(value)
+
+
+class OrjsonCodec(RedisCodec):
+    name = "orjson"
+
+    def encode(self, value: Any) -> bytes:
+        return orjson.dumps(value)
+
+    def decode(self, value: bytes) -> Any:
+        return orjson.loads(value)
+
+
+class MsgpackCodec(RedisCodec):
+    name = "msgpack"
+
+    def encode(self, value: Any) -> bytes:
+        return msgpack.packb(value, use_bin_type=True)
+
+    def decode(self, value: bytes) -> Any:
+        return msgpack.unpackb(value, raw=False)
+
+
+CODECS: dict[str, type[RedisCodec]] = {
+    JsonCodec.name: JsonCodec,
+    OrjsonCodec.name: OrjsonCodec,
+    MsgpackCodec.name: MsgpackCodec,
+}
+
+
+def get_codec(name: str) -> RedisCodec:
+    try:
+        return CODECS[name]()
+    except KeyError:
+        raise ValueError(f"Invalid redis codec: {name}")
@@ -1,24 +1,119 @@
 import logging
+from functools import wraps
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+)
 
-from pymongo import MongoClient
+from motor.motor_asyncio import (
+    AsyncIOMotorClient,
+    AsyncIOMotorCursor,
+    AsyncIOMotorDatabase,
+)
+from pymongo import (
+    ASCENDING,
+    IndexModel,
+    MongoClient,
+    ReplaceOne,
+)
 from pymongo.database import Database
+from pymongo.errors import (
+    ConnectionFailure,
+    ExecutionTimeout,
+    WTimeoutError,
+)
 
-from app.exceptions.default_exceptions import MongoRepositoryTransactionsException
+from app.exceptions.default_exceptions import (
+    CircuitOpenException,
+    MongoRepositoryTransactionsException,
+)
+from app.utils.circuit_breaker import get_circuit_breaker
 from app.utils.config import return_default_settings
 
 logger = logging.getLogger(__name__)
 settings = return_default_settings()
+# Só erros de conexão, timeout e do servidor abrem o circuito. Erros da
+# operação (ex.: DuplicateKeyError) mostram que o banco está respondendo.
+MONGO_FAILURES = (ConnectionFailure, ExecutionTimeout, WTimeoutError)
+mongo_circuit_breaker = get_circuit_breaker(
+    "mongo", settings.MONGO_SLOW_CALL_DURATION, MONGO_FAILURES
+)
 MAX_MONGO_TIMEOUT = 5000
 
 
+def build_connection_string() -> str:
+    return (
+        f"mongodb://{settings.MONGO_USER}:"
+        f"{settings.MONGO_PASSWORD}@localhost:"
+        f"{settings.MONGO_PORT}"
+        "/admin?authSource=admin&authMechanism=SCRAM-SHA-1"
+    )
+
+
+_mongo_client: AsyncIOMotorClient | None = None
+
+
+def get_mongo_client() -> AsyncIOMotorClient:
+    """
+    Retorna o client do processo, criando na primeira chamada.
+    O lifespan da aplicação cria o client no startup e fecha no shutdown,
+    os repositórios só pegam conexões emprestadas do pool dele.
+    """
+    global _mongo_client
+    if _mongo_client is None:
+        _mongo_client = AsyncIOMotorClient(
+            build_connection_string(),
+            serverSelectionTimeoutMS=settings.MONGO_SERVER_TIMEOUT_MS,
+            maxPoolSize=settings.MONGO_MAX_POOL_SIZE,
+            minPoolSize=settings.MONGO_MIN_POOL_SIZE,
+            maxIdleTimeMS=settings.MONGO_MAX_IDLE_TIME_MS,
+            waitQueueTimeoutMS=settings.MONGO_WAIT_QUEUE_TIMEOUT_MS,
+        )
+    return _mongo_client
+
+
+def close_mongo_client() -> None:
+    global _mongo_client
+    if _mongo_client is not None:
+        _mongo_client.close()
+        _mongo_client = None
+
+
+def mongo_operation(name: str):
+    """
+    Converte os erros da operação em MongoRepositoryTransactionsException,
+    menos o CircuitOpenException do breaker, repassado como 503.
+    """
+
+    def decorator(method: Callable[..., Awaitable[Any]]):
+        @wraps(method)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await method(*args, **kwargs)
+            except CircuitOpenException:
+                raise
+            except Exception as error:
+                logger.error(
+                    f"DB retornou erro - {name} | Erro: {error}",
+                    extra={"error": error},
+                )
+                raise MongoRepositoryTransactionsException()
+
+        return wrapper
+
+    return decorator
+
+
 class MongoRepository:
+    """
+    Repositório síncrono, usado fora da aplicação
+    (ex.: benchmarks em tests/performance).
+    """
+
     def __init__(self, server_timeout: int = MAX_MONGO_TIMEOUT) -> None:
-        self.CONNECTION_STRING = (
-            f"mongodb://{settings.MONGO_USER}:"
-            f"{settings.MONGO_PASSWORD}@localhost:"
-            f"{settings.MONGO_PORT}"
-            "/admin?authSource=admin&authMechanism=SCRAM-SHA-1"
-        )
+        self.CONNECTION_STRING = build_connection_string()
         # Create a connection using MongoClient.
         self.client = MongoClient(
             self.CONNECTION_STRING, serverSelectionTimeoutMS=server_timeout
@@ -38,10 +133,16 @@ class MongoRepository:
             raise MongoRepositoryTransactionsException()
         return response
 
-    def get_by_acronym(self, db_name: str, collection: str, acronym: str) -> dict:
+    def get_by_acronym(
+        self,
+        db_name: str,
+        collection: str,
+        acronym: str,
+        projection: dict | None = None,
+    ) -> dict:
         try:
             db = self._get_database(db_name)
-            response = db[collection].find_one({"acronym": acronym})
+            response = db[collection].find_one({"acronym": acronym}, projection)
         except Exception as error:
             logger.error(
                 f"DB retornou erro - GetByAcr | Erro: {error}", extra={"error": error}
@@ -146,3 +247,201 @@ class MongoRepository:
             )
             raise MongoRepositoryTransactionsException()
         return response
+
+    def create_indexes(
+        self, db_name: str, collection: str, indexes: list[IndexModel]
+    ) -> list[str]:
+        try:
+            db = self._get_database(db_name)
+            response = db[collection].create_indexes(indexes)
+        except Exception as error:
+            logger.error(
+                f"DB retornou erro - CreateIdx | Erro: {error}", extra={"error": error}
+            )
+            raise MongoRepositoryTransactionsException()
+        return response
+
+
+class AsyncMongoRepository:
+    """
+    Repositório assíncrono (Motor), usado pelas rotas da API.
+    """
+
+    def __init__(self, client: AsyncIOMotorClient | None = None) -> None:
+        self.client = client or get_mongo_client()
+
+    def _get_database(self, db_name: str) -> AsyncIOMotorDatabase:
+        return self.client[db_name]
+
+    async def _execute(self, operation: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Executa a operação pelo circuit breaker do Mongo: com o circuito
+        aberto a chamada falha na hora, sem esperar o timeout do banco.
+        """
+        return await mongo_circuit_breaker.call(operation)
+
+    @mongo_operation("GetById")
+    async def get_by_id(self, db_name: str, collection: str, id: str) -> dict:
+        db = self._get_database(db_name)
+        return await self._execute(lambda: db[collection].find_one({"id": id}))
+
+    @mongo_operation("GetByAcr")
+    async def get_by_acronym(
+        self,
+        db_name: str,
+        collection: str,
+        acronym: str,
+        projection: dict | None = None,
+    ) -> dict:
+        db = self._get_database(db_name)
+        return await self._execute(
+            lambda: db[collection].find_one({"acronym": acronym}, projection)
+        )
+
+    @mongo_operation("GetByAcrs")
+    async def get_by_acronyms(
+        self,
+        db_name: str,
+        collection: str,
+        acronyms: list[str],
+        projection: dict | None = None,
+    ) -> list:
+        db = self._get_database(db_name)
+        cursor = db[collection].find({"acronym": {"$in": acronyms}}, projection)
+        return await self._execute(lambda: cursor.to_list(length=None))
+
+    @mongo_operation("GetByAcr")
+    async def get_all_currency(self, db_name: str, collection: str) -> list:
+        db = self._get_database(db_name)
+        cursor = db[collection].find({})
+        return await self._execute(lambda: cursor.to_list(length=None))
+
+    @mongo_operation("GetPage")
+    async def get_page_by_acronym(
+        self,
+        db_name: str,
+        collection: str,
+        after: str | None,
+        limit: int,
+        projection: dict | None = None,
+    ) -> list:
+        """
+        Paginação por chave: devolve até limit documentos com a sigla maior
+        que after, na ordem do índice de acronym.
+        """
+        db = self._get_database(db_name)
+        cursor = (
+            db[collection]
+            .find({"acronym": {"$gt": after or ""}}, projection)
+            .sort("acronym", ASCENDING)
+            .limit(limit)
+        )
+        return await self._execute(lambda: cursor.to_list(length=limit))
+
+    async def iter_by_acronym(
+        self,
+        db_name: str,
+        collection: str,
+        after: str | None,
+        batch_size: int,
+        projection: dict | None = None,
+    ) -> AsyncIterator[list]:
+        """
+        Percorre a collection na ordem das siglas, devolvendo um lote de
+        documentos por vez sem carregar o cursor inteiro em memória.
+        """
+        db = self._get_database(db_name)
+        cursor = (
+            db[collection]
+            .find({"acronym": {"$gt": after or ""}}, projection)
+            .sort("acronym", ASCENDING)
+            .batch_size(batch_size)
+        )
+        while batch := await self._next_batch(cursor, batch_size):
+            yield batch
+
+    @mongo_operation("IterByAcr")
+    async def _next_batch(self, cursor: AsyncIOMotorCursor, batch_size: int) -> list:
+        return await self._execute(lambda: cursor.to_list(length=batch_size))
+
+    @mongo_operation("GetById")
+    async def get_cached_date(self, db_name: str, collection: str) -> dict:
+        db = self._get_database(db_name)
+        return await self._execute(
+            lambda: db[collection].find_one({"daily_time": True})
+        )
+
+    @mongo_operation("Create")
+    async def create(self, db_name: str, collection: str, data: dict):
+        db = self._get_database(db_name)
+        await self._execute(lambda: db[collection].insert_one(data))
+
+    @mongo_operation("DelById")
+    async def delete_by_id(self, db_name: str, collection: str, id: str) -> dict:
+        db = self._get_database(db_name)
+        return await self._execute(lambda: db[collection].delete_one({"id": id}))
+
+    @mongo_operation("DelByAcr")
+    async def delete_by_acronym(
+        self, db_name: str, collection: str, acronym: str
+    ) -> dict:
+        db = self._get_database(db_name)
+        return await self._execute(
+            lambda: db[collection].delete_one({"acronym": acronym})
+        )
+
+    @mongo_operation("UpdtById")
+    async def update_by_id(
+        self, db_name: str, collection: str, id: str, data: dict
+    ) -> dict:
+        db = self._get_database(db_name)
+        return await self._execute(
+            lambda: db[collection].update_one(filter={"id": id}, update=data)
+        )
+
+    @mongo_operation("UpdtByAcr")
+    async def update_or_create_by_acronym(
+        self, db_name: str, collection: str, acronym: str, data: dict
+    ) -> dict:
+        db = self._get_database(db_name)
+        return await self._execute(
+            lambda: db[collection].replace_one(
+                filter={"acronym": acronym}, replacement=data, upsert=True
+            )
+        )
+
+    @mongo_operation("BulkUpdtByAcr")
+    async def bulk_update_or_create_by_acronym(
+        self, db_name: str, collection: str, documents: list[dict]
+    ):
+        """
+        Upsert de várias moedas (pela sigla) em um único bulk_write.
+        """
+        db = self._get_database(db_name)
+        return await self._execute(
+            lambda: db[collection].bulk_write(
+                [
+                    ReplaceOne({"acronym": document["acronym"]}, document, upsert=True)
+                    for document in documents
+                ],
+                ordered=False,
+            )
+        )
+
+    @mongo_operation("UpdtByAcr")
+    async def update_or_create_date_cache(
+        self, db_name: str, collection: str, data: dict
+    ) -> dict:
+        db = self._get_database(db_name)
+        return await self._execute(
+            lambda: db[collection].replace_one(
+                filter={"daily_time": True}, replacement=data, upsert=True
+            )
+        )
+
+    @mongo_operation("CreateIdx")
+    async def create_indexes(
+        self, db_name: str, collection: str, indexes: list[IndexModel]
+    ) -> list[str]:
+        db = self._get_database(db_name)
+        return await self._execute(lambda: db[collection].create_indexes(indexes))
@@ -1,23 +1,231 @@
-import json
 import logging
 
 from redis import Redis
+from redis.asyncio import Redis as AsyncRedis
+from redis.asyncio.lock import Lock
+
+from app.repositories.codecs import (
+    RedisCodec,
+    get_codec,
+)
+from app.utils.config import return_default_settings
 
 logger = logging.getLogger(__name__)
-TWO_HOURS = 7200
+settings = return_default_settings()
+DEFAULT_TTL = settings.REDIS_CACHE_TTL
+# Grava as chaves só se a geração (KEYS[1]) ainda for ARGV[1].
+# KEYS[2..n] são as chaves e ARGV[3..n+1] os valores, ARGV[2] é o TTL.
+SET_IF_GENERATION_SCRIPT = """
+if (redis.call('GET', KEYS[1]) or '0') ~= ARGV[1] then
+    return 0
+end
+for index = 2, #KEYS do
+    redis.call('SET', KEYS[index], ARGV[index + 1], 'EX', ARGV[2])
+end
+return 1
+"""
 
+_redis_client: AsyncRedis | None = None
+_sync_redis_client: Redis | None = None
 
-class RedisRepository:
-    def __init__(self) -> None:
-        self.client = Redis(host="localhost", port=6379, decode_responses=True)
 
-    def create(self, key, value):
-        return self.client.set(key, json.dumps(value), ex=TWO_HOURS)
+def get_redis_client() -> AsyncRedis:
+    """
+    Retorna o client do processo, criando na primeira chamada.
+    O lifespan da aplicação cria o client no startup e fecha no shutdown,
+    os repositórios só pegam conexões emprestadas do pool dele.
+    """
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = AsyncRedis(host="localhost", port=6379)
+    return _redis_client
 
-    def get(self, key):
-        value = self.client.get(key)
+
+def get_sync_redis_client() -> Redis:
+    """
+    Client síncrono do processo, usado fora da aplicação.
+    """
+    global _sync_redis_client
+    if _sync_redis_client is None:
+        _sync_redis_client = Redis(host="localhost", port=6379)
+    return _sync_redis_client
+
+
+async def close_redis_client() -> None:
+    global _redis_client, _sync_redis_client
+    if _redis_client is not None:
+        await _redis_client.aclose()
+        _redis_client = None
+    if _sync_redis_client is not None:
+        _sync_redis_client.close()
+        _sync_redis_client = None
+
+
+class BaseRedisRepository:
+    """
+    Os valores são guardados como bytes, o codec (json, orjson ou msgpack)
+    é escolhido pelo REDIS_CODEC do Settings.
+    """
+
+    def __init__(self, codec: RedisCodec | None = None) -> None:
+        self.codec = codec or get_codec(settings.REDIS_CODEC)
+
+    def _decode(self, value: bytes | None):
+        if value is None:
+            return None
         try:
-            decoded_value = json.loads(value)
+            decoded_value = self.codec.decode(value)
         except Exception:
             return None
         return decoded_value
+
+
+class RedisRepository(BaseRedisRepository):
+    def __init__(self, codec: RedisCodec | None = None) -> None:
+        super().__init__(codec)
+        self.client = get_sync_redis_client()
+
+    def create(self, key, value, ttl: int = DEFAULT_TTL):
+        return self.client.set(key, self.codec.encode(value), ex=ttl)
+
+    def get(self, key):
+        value = self.client.get(key)
+        return self._decode(value)
+
+    def get_many(self, keys: list[str]) -> list:
+        """
+        Busca várias chaves com um único MGET, na mesma ordem das chaves.
+        """
+        values = self.client.mget(keys)
+        return [self._decode(value) for value in values]
+
+    def set_many(self, values: dict, ttl: int = DEFAULT_TTL) -> list:
+        """
+        Grava várias chaves com TTL em um único round-trip (pipeline).
+        """
+        with self.client.pipeline(transaction=False) as pipeline:
+            for key, value in values.items():
+                pipeline.set(key, self.codec.encode(value), ex=ttl)
+            return pipeline.execute()
+
+
+class AsyncRedisRepository(BaseRedisRepository):
+    def __init__(self, codec: RedisCodec | None = None) -> None:
+        super().__init__(codec)
+        self.client = get_redis_client()
+
+    async def create(self, key, value, ttl: int = DEFAULT_TTL):
+        return await self.client.set(key, self.codec.encode(value), ex=ttl)
+
+    async def get(self, key):
+        value = await self.client.get(key)
+        return self._decode(value)
+
+    async def get_many(self, keys: list[str]) -> list:
+        """
+        Busca várias chaves com um único MGET, na mesma ordem das chaves.
+        """
+        values = await self.client.mget(keys)
+        return [self._decode(value) for value in values]
+
+    async def set_many(self, values: dict, ttl: int = DEFAULT_TTL) -> list:
+        """
+        Grava várias chaves com TTL em um único round-trip (pipeline).
+        """
+        async with self.client.pipeline(transaction=False) as pipeline:
+            for key, value in values.items():
+                pipeline.set(key, self.codec.encode(value), ex=ttl)
+            return await pipeline.execute()
+
+    async def write_through(
+        self,
+        values: dict,
+        delete_keys: list[str],
+        ttl: int = DEFAULT_TTL,
+        generation_key: str | None = None,
+    ) -> list:
+        """
+        Grava os valores novos e remove as chaves derivadas no mesmo pipeline.
+        Com generation_key a geração também é incrementada na mesma transação,
+        invalidando os preenchimentos do cache que começaram antes.
+        """
+        async with self.client.pipeline(transaction=True) as pipeline:
+            for key, value in values.items():
+                pipeline.set(key, self.codec.encode(value), ex=ttl)
+            if delete_keys:
+                pipeline.delete(*delete_keys)
+            if generation_key:
+                pipeline.incr(generation_key)
+            return await pipeline.execute()
+
+    async def get_generation(self, generation_key: str) -> str:
+        """
+        Geração atual das chaves, lida antes de buscar os dados no banco.
+        """
+        generation = await self.client.get(generation_key)
+        return generation.decode() if generation is not None else "0"
+
+    async def set_many_if_generation(
+        self,
+        values: dict,
+        generation_key: str,
+        generation: str,
+        ttl: int = DEFAULT_TTL,
+    ) -> bool:
+        """
+        Como o set_many, mas só grava se nenhuma escrita (write_through com
+        a mesma generation_key) aconteceu desde que a geração foi lida, para
+        um dado velho do banco não sobrescrever o novo.
+        """
+        encoded = {key: self.codec.encode(value) for key, value in values.items()}
+        return await self.set_bytes_if_generation(
+            encoded, generation_key, generation, ttl
+        )
+
+    async def set_bytes_if_generation(
+        self,
+        values: dict[str, bytes],
+        generation_key: str,
+        generation: str,
+        ttl: int = DEFAULT_TTL,
+    ) -> bool:
+        if not values:
+            return True
+        script = self.client.register_script(SET_IF_GENERATION_SCRIPT)
+        written = await script(
+            keys=[generation_key, *values],
+            args=[generation, ttl, *values.values()],
+        )
+        return bool(written)
+
+    async def publish(self, channel: str, message) -> int:
+        return await self.client.publish(channel, self.codec.encode(message))
+
+    async def subscribe(self, channel: str):
+        """
+        Gerador com as mensagens (já decodificadas) publicadas no canal.
+        """
+        async with self.client.pubsub(ignore_subscribe_messages=True) as pubsub:
+            await pubsub.subscribe(channel)
+            async for message in pubsub.listen():
+                yield self._decode(message["data"])
+
+    async def get_bytes(self, key: str) -> bytes | None:
+        """
+        Lê o valor cru, sem passar pelo codec (ex.: bodies já serializados).
+        """
+        return await self.client.get(key)
+
+    async def set_bytes(self, key: str, value: bytes, ttl: int = DEFAULT_TTL):
+        return await self.client.set(key, value, ex=ttl)
+
+    async def delete(self, *keys: str) -> int:
+        return await self.client.delete(*keys)
+
+    def lock(self, key: str, timeout: float, blocking_timeout: float) -> Lock:
+        """
+        Lock distribuído entre os workers, usado como `async with`.
+        """
+        return self.client.lock(
+            f"lock:{key}", timeout=timeout, blocking_timeout=blocking_timeout
+        )
@@ -1,26 +1,131 @@
+import asyncio
 import logging
 
 from fastapi import status
 from httpx import (
+    AsyncBaseTransport,
+    AsyncClient,
     Client,
+    HTTPError,
+    Limits,
     Response,
+    Timeout,
 )
 
 from app.exceptions.default_exceptions import (
     ApiInvalidResponseException,
     CurrencyInvalidValuesException,
+    ServiceUnavailableException,
 )
+from app.utils.circuit_breaker import get_circuit_breaker
+from app.utils.config import return_default_settings
 
 logger = logging.getLogger(__name__)
+settings = return_default_settings()
+# Erros de rede, timeout e status 5xx (ApiInvalidResponseException
+# levantada dentro do breaker) abrem o circuito.
+awesome_api_circuit_breaker = get_circuit_breaker(
+    "awesomeapi",
+    settings.AWESOME_API_SLOW_CALL_DURATION,
+    (HTTPError, TimeoutError, ApiInvalidResponseException),
+)
 BASE_URL = "https://economia.awesomeapi.com.br"
+API_REQUEST_CURRENCYS = ["USD", "BRL", "EUR", "BTC", "ETH"]
+HTTP_TIMEOUT = 15
+
+
+_http_client: AsyncClient | None = None
+
+
+def build_http_client(transport: AsyncBaseTransport | None = None) -> AsyncClient:
+    """
+    Monta o client HTTP/2 com pool de conexões keep-alive para a AwesomeAPI.
+    O transport pode ser trocado (ex.: httpx.MockTransport) para rodar offline.
+    """
+    return AsyncClient(
+        http2=settings.AWESOME_API_HTTP2,
+        limits=Limits(
+            max_connections=settings.AWESOME_API_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.AWESOME_API_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.AWESOME_API_KEEPALIVE_EXPIRY,
+        ),
+        timeout=Timeout(
+            settings.AWESOME_API_READ_TIMEOUT,
+            connect=settings.AWESOME_API_CONNECT_TIMEOUT,
+        ),
+        transport=transport,
+    )
+
+
+def get_http_client() -> AsyncClient:
+    """
+    Retorna o client do processo, criado no startup pelo lifespan.
+    """
+    global _http_client
+    if _http_client is None:
+        _http_client = build_http_client()
+    return _http_client
+
+
+async def close_http_client() -> None:
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+def currency_values_url(first_currency: str, second_currency: str) -> str:
+    """
+    Valida as moedas aceitas pela api e monta a url da cotação.
+    """
+    valid_values = all(
+        [
+            first_currency in API_REQUEST_CURRENCYS,
+            second_currency in API_REQUEST_CURRENCYS,
+        ]
+    )
+    if not valid_values:
+        logger.error("Invalid currency values")
+        raise CurrencyInvalidValuesException()
+    return BASE_URL + f"/json/last/{first_currency.upper()}-{second_currency.upper()}"
+
+
+def mapped_currencys_url() -> str:
+    dolar = "USD"
+    brl = "BRL"
+    eur = "EUR"
+    btc = "BTC"
+    eth = "ETH"
+    return (
+        BASE_URL + f"/json/last/{brl}-{dolar},{eur}-{dolar},{btc}-{dolar},{eth}-{dolar}"
+    )
+
+
+def available_pairs_url() -> str:
+    return BASE_URL + "/json/available"
+
+
+def last_quotations_url(pairs: list[str]) -> str:
+    return BASE_URL + f"/json/last/{','.join(pairs)}"
+
+
+def validate_response(response: Response) -> dict:
+    if response.status_code != status.HTTP_200_OK:
+        logger.error("Api returned invalid status")
+        raise ApiInvalidResponseException()
+    return response.json()
 
 
 class AwesomeApiService:
+    """
+    Cliente síncrono, para uso fora da aplicação.
+    """
+
     def _execute(
         self, url: str, method: str, headers: str = None, params: str = None
     ) -> Response:
         """ """
-        with Client(timeout=15) as http_client:
+        with Client(timeout=HTTP_TIMEOUT) as http_client:
             request = http_client.build_request(
                 method, url, headers=headers, params=params
             )
@@ -29,38 +134,111 @@ class AwesomeApiService:
 
     def get_currency_values(self, first_currency: str, second_currency: str) -> dict:
         """ """
-        api_request_currencys = ["USD", "BRL", "EUR", "BTC", "ETH"]
-        valid_values = all(
-            [
-                first_currency in api_request_currencys,
-                second_currency in api_request_currencys,
-            ]
-        )
-        if not valid_values:
-            logger.error("Invalid currency values")
-            raise CurrencyInvalidValuesException()
-        url = (
-            BASE_URL + f"/json/last/{first_currency.upper()}-{second_currency.upper()}"
-        )
+        url = currency_values_url(first_currency, second_currency)
         response: Response = self._execute(method="GET", url=url)
-        if response.status_code != status.HTTP_200_OK:
-            logger.error("Api returned invalid status")
-            raise ApiInvalidResponseException()
-        return response.json()
+        return validate_response(response)
 
     def get_mapped_currencys(self) -> dict:
         """ """
-        dolar = "USD"
-        brl = "BRL"
-        eur = "EUR"
-        btc = "BTC"
-        eth = "ETH"
-        url = (
-            BASE_URL
-            + f"/json/last/{brl}-{dolar},{eur}-{dolar},{btc}-{dolar},{eth}-{dolar}"
+        response: Response = self._execute(method="GET", url=mapped_currencys_url())
+        return validate_response(response)
+
+
+class AsyncAwesomeApiService:
+    """
+    Cliente assíncrono, usado pelas rotas da API.
+    """
+
+    def __init__(self, http_client: AsyncClient | None = None) -> None:
+        self.http_client = http_client or get_http_client()
+
+    async def _execute(
+        self, url: str, method: str, headers: str = None, params: str = None
+    ) -> Response:
+        """
+        Passa pelo circuit breaker da AwesomeAPI e pelo orçamento de
+        latência. Erros de rede, timeout e status 5xx contam como falha.
+        """
+
+        async def send() -> Response:
+            async with asyncio.timeout(settings.AWESOME_API_LATENCY_BUDGET):
+                response = await self._send_hedged(method, url, headers, params)
+            if response.status_code >= status.HTTP_500_INTERNAL_SERVER_ERROR:
+                logger.error("Api returned server error")
+                raise ApiInvalidResponseException()
+            return response
+
+        try:
+            return await awesome_api_circuit_breaker.call(send)
+        except (HTTPError, TimeoutError) as error:
+            logger.error("Api unavailable", extra={"error": error})
+            raise ServiceUnavailableException()
+
+    async def _send_hedged(
+        self, method: str, url: str, headers: str = None, params: str = None
+    ) -> Response:
+        """
+        Se a primeira requisição passar do AWESOME_API_HEDGE_DELAY, uma
+        segunda igual é disparada e vale a resposta que chegar primeiro.
+        """
+
+        def send() -> asyncio.Task:
+            request = self.http_client.build_request(
+                method, url, headers=headers, params=params
+            )
+            return asyncio.create_task(self.http_client.send(request))
+
+        pending = {send()}
+        try:
+            if settings.AWESOME_API_HEDGE_DELAY > 0:
+                done, _ = await asyncio.wait(
+                    pending, timeout=settings.AWESOME_API_HEDGE_DELAY
+                )
+                if not done:
+                    pending.add(send())
+            while True:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                # Só falha quando nenhuma das requisições respondeu.
+                if not pending:
+                    return done.pop().result()
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def get_currency_values(
+        self, first_currency: str, second_currency: str
+    ) -> dict:
+        """ """
+        url = currency_values_url(first_currency, second_currency)
+        response: Response = await self._execute(method="GET", url=url)
+        return validate_response(response)
+
+    async def get_mapped_currencys(self) -> dict:
+        """ """
+        response: Response = await self._execute(
+            method="GET", url=mapped_currencys_url()
         )
-        response: Response = self._execute(method="GET", url=url)
-        if response.status_code != status.HTTP_200_OK:
-            logger.error("Api returned invalid status")
-            raise ApiInvalidResponseException()
-        return response.json()
+        return validate_response(response)
+
+    async def get_available_pairs(self) -> dict:
+        """
+        Todos os pares de moedas suportados pela api, ex.: {"BRL-USD": "..."}.
+        """
+        response: Response = await self._execute(
+            method="GET", url=available_pairs_url()
+        )
+        return validate_response(response)
+
+    async def get_last_quotations(self, pairs: list[str]) -> dict:
+        """
+        Última cotação de vários pares em uma única requisição.
+        """
+        response: Response = await self._execute(
+            method="GET", url=last_quotations_url(pairs)
+        )
+        return validate_response(response)
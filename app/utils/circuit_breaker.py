@@ -0,0 +1,154 @@
+import logging
+from collections import deque
+from enum import Enum
+from time import monotonic
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+)
+
+from app.exceptions.default_exceptions import CircuitOpenException
+from app.utils.config import return_default_settings
+
+logger = logging.getLogger(__name__)
+settings = return_default_settings()
+
+
+class CircuitState(str, Enum):
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Abre o circuito quando a taxa de chamadas com erro ou lentas (acima de
+    slow_call_duration) nas últimas window_size chamadas passa de
+    failure_rate. Aberto, as chamadas falham na hora; depois de
+    open_duration uma chamada de teste decide se o circuito fecha ou abre
+    de novo. Só os erros de failure_exceptions contam como falha, os
+    outros mostram que a dependência respondeu.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        slow_call_duration: float,
+        failure_exceptions: tuple[type[Exception], ...] = (Exception,),
+        failure_rate: float = settings.CIRCUIT_BREAKER_FAILURE_RATE,
+        window_size: int = settings.CIRCUIT_BREAKER_WINDOW_SIZE,
+        minimum_calls: int = settings.CIRCUIT_BREAKER_MINIMUM_CALLS,
+        open_duration: float = settings.CIRCUIT_BREAKER_OPEN_DURATION,
+    ) -> None:
+        self.name = name
+        self.slow_call_duration = slow_call_duration
+        self.failure_exceptions = failure_exceptions
+        self.failure_rate = failure_rate
+        self.minimum_calls = minimum_calls
+        self.open_duration = open_duration
+        # True para as chamadas com erro ou lentas.
+        self._calls: deque[bool] = deque(maxlen=window_size)
+        self._opened_at: float | None = None
+        self._probing = False
+
+    @property
+    def state(self) -> CircuitState:
+        if self._opened_at is None:
+            return CircuitState.CLOSED
+        if monotonic() - self._opened_at < self.open_duration:
+            return CircuitState.OPEN
+        return CircuitState.HALF_OPEN
+
+    def current_failure_rate(self) -> float:
+        if not self._calls:
+            return 0.0
+        return sum(self._calls) / len(self._calls)
+
+    def snapshot(self) -> dict:
+        return {
+            "state": self.state.value,
+            "failure_rate": round(self.current_failure_rate(), 3),
+            "calls": len(self._calls),
+        }
+
+    def reset(self) -> None:
+        self._calls.clear()
+        self._opened_at = None
+        self._probing = False
+
+    async def call(self, operation: Callable[[], Awaitable[Any]]) -> Any:
+        state = self.state
+        if state is CircuitState.OPEN or (
+            state is CircuitState.HALF_OPEN and self._probing
+        ):
+            raise CircuitOpenException(detail={"error": f"{self.name} unavailable"})
+
+        probe = state is CircuitState.HALF_OPEN
+        self._probing = probe
+        started_at = monotonic()
+        try:
+            result = await operation()
+        except self.failure_exceptions:
+            self._record(failed=True, probe=probe)
+            raise
+        except Exception:
+            self._record(failed=self._is_slow(started_at), probe=probe)
+            raise
+        finally:
+            if probe:
+                self._probing = False
+        self._record(failed=self._is_slow(started_at), probe=probe)
+        return result
+
+    def _is_slow(self, started_at: float) -> bool:
+        return monotonic() - started_at >= self.slow_call_duration
+
+    def _record(self, failed: bool, probe: bool) -> None:
+        if probe:
+            if failed:
+                self._open()
+            else:
+                logger.info(f"Circuit {self.name} closed")
+                self.reset()
+            return
+
+        self._calls.append(failed)
+        if (
+            self._opened_at is None
+            and len(self._calls) >= self.minimum_calls
+            and self.current_failure_rate() >= self.failure_rate
+        ):
+            self._open()
+
+    def _open(self) -> None:
+        logger.error(f"Circuit {self.name} opened")
+        self._opened_at = monotonic()
+        self._calls.clear()
+
+
+_circuit_breakers: dict[str, CircuitBreaker] = {}
+
+
+def get_circuit_breaker(
+    name: str,
+    slow_call_duration: float,
+    failure_exceptions: tuple[type[Exception], ...] = (Exception,),
+) -> CircuitBreaker:
+    """
+    Um breaker por dependência no processo, criado na primeira chamada.
+    """
+    if name not in _circuit_breakers:
+        _circuit_breakers[name] = CircuitBreaker(
+            name, slow_call_duration, failure_exceptions
+        )
+    return _circuit_breakers[name]
+
+
+def circuit_breakers_state() -> dict[str, dict]:
+    return {name: breaker.snapshot() for name, breaker in _circuit_breakers.items()}
+
+
+def reset_circuit_breakers() -> None:
+    for breaker in _circuit_breakers.values():
+        breaker.reset()
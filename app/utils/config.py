@@ -19,6 +19,81 @@ class Settings(BaseSettings):
     MONGO_USER: str = "root"
     MONGO_PASSWORD: str = "pass"
     MONGO_PORT: int = 27017
+    MONGO_SERVER_TIMEOUT_MS: int = 100
+    MONGO_MAX_POOL_SIZE: int = 100
+    MONGO_MIN_POOL_SIZE: int = 0
+    MONGO_MAX_IDLE_TIME_MS: int = 60000
+    MONGO_WAIT_QUEUE_TIMEOUT_MS: int = 1000
+    MONGO_CREATE_INDEXES: bool = True
+
+    # Redis
+    REDIS_CODEC: str = "orjson"  # json, orjson ou msgpack
+    # As mutações atualizam/invalidam o cache, então o TTL pode ser longo.
+    REDIS_CACHE_TTL: int = 86400  # segundos
+
+    # AwesomeAPI
+    AWESOME_API_HTTP2: bool = True
+    AWESOME_API_CONNECT_TIMEOUT: float = 2.0  # segundos
+    AWESOME_API_READ_TIMEOUT: float = 10.0  # segundos
+    AWESOME_API_MAX_CONNECTIONS: int = 20
+    AWESOME_API_MAX_KEEPALIVE_CONNECTIONS: int = 10
+    AWESOME_API_KEEPALIVE_EXPIRY: float = 60.0  # segundos
+    # Pares buscados por requisição na carga de todas as cotações.
+    AWESOME_API_PAIRS_PER_REQUEST: int = 50
+
+    # Hedge: uma segunda requisição é disparada se a primeira demorar mais
+    # que o delay, e a chamada toda tem que caber no orçamento de latência.
+    AWESOME_API_HEDGE_DELAY: float = 0.3  # segundos, 0 desliga
+    AWESOME_API_LATENCY_BUDGET: float = 3.0  # segundos
+
+    # Circuit breakers (Mongo e AwesomeAPI)
+    CIRCUIT_BREAKER_FAILURE_RATE: float = 0.5
+    CIRCUIT_BREAKER_WINDOW_SIZE: int = 20
+    CIRCUIT_BREAKER_MINIMUM_CALLS: int = 10
+    CIRCUIT_BREAKER_OPEN_DURATION: float = 30.0  # segundos
+    MONGO_SLOW_CALL_DURATION: float = 0.5  # segundos
+    AWESOME_API_SLOW_CALL_DURATION: float = 2.0  # segundos
+
+    # Single-flight nos cache misses
+    SINGLE_FLIGHT_REDIS_LOCK: bool = False
+    SINGLE_FLIGHT_LOCK_TIMEOUT: float = 5.0  # segundos
+    SINGLE_FLIGHT_LOCK_WAIT: float = 1.0  # segundos
+
+    # Cache do body já serializado do GET /currencies
+    CURRENCIES_RESPONSE_LOCAL_TTL: float = 300.0  # segundos
+    # Paginação e streaming NDJSON do GET /currencies
+    CURRENCIES_PAGE_SIZE: int = 100
+    CURRENCIES_MAX_PAGE_SIZE: int = 1000
+    CURRENCIES_STREAM_BATCH_SIZE: int = 500
+
+    # Tabela local de cotações
+    RATE_TABLE_REFRESH_INTERVAL: int = 60  # segundos
+    # Stale-while-revalidate: depois do soft TTL a cotação ainda é usada e
+    # recarregada em background, depois do hard TTL é buscada na hora.
+    RATE_SOFT_TTL: int = 120  # segundos
+    RATE_HARD_TTL: int = 3600  # segundos
+
+    # Cache LRU palavra -> total de vogais (por worker), 0 desliga
+    VOWEL_COUNT_CACHE_SIZE: int = 100000
+    # Listas de palavras a partir desse tamanho são divididas entre
+    # processos (sort e contagem de vogais), 0 desliga. Desligado por
+    # padrão: cada worker do uvicorn sobe o próprio pool, então só vale
+    # ligar com CPUs sobrando (ex.: 500000).
+    WORDS_PARALLEL_THRESHOLD: int = 0
+    WORDS_PARALLEL_WORKERS: int = 0  # 0 usa a quantidade de CPUs
+    # Body dos endpoints de palavras lido com orjson, sem o pydantic validar
+    # a lista de palavras item a item.
+    WORDS_FAST_JSON_BODY: bool = True
+    # Sort em NDJSON: passando do orçamento as palavras vão para arquivos
+    # temporários ordenados, que são juntados num merge no final.
+    WORDS_SORT_MEMORY_BUDGET: int = 64 * 1024 * 1024  # bytes
+    WORDS_SORT_STREAM_BATCH_SIZE: int = 1000
+    WORDS_SORT_TEMP_DIR: str | None = None  # None usa o diretório do sistema
+
+    # Carga das cotações da AwesomeAPI, feita por um worker por vez
+    CURRENCY_REFRESH_ENABLED: bool = True
+    CURRENCY_REFRESH_INTERVAL: int = 3600  # segundos
+    CURRENCY_REFRESH_JITTER: int = 60  # segundos
 
     class Config:
         env_file = ".env"
@@ -0,0 +1,144 @@
+import json
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    TypeVar,
+)
+
+import orjson
+from fastapi import Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
+from pydantic import (
+    BaseModel,
+    ValidationError,
+)
+
+from app.utils.config import return_default_settings
+
+settings = return_default_settings()
+ModelT = TypeVar("ModelT", bound=BaseModel)
+# Bodies menores são lidos no event loop, mandar para o threadpool custa mais.
+THREADPOOL_BODY_SIZE = 64 * 1024
+
+
+class ORJSONFallbackResponse(ORJSONResponse):
+    """
+    ORJSONResponse que volta para o json da stdlib (com os caracteres
+    escapados) quando o orjson recusa o conteúdo, ex.: palavras com
+    surrogates soltos, que o JSON permite.
+    """
+
+    def render(self, content: Any) -> bytes:
+        try:
+            return super().render(content)
+        except orjson.JSONEncodeError:
+            return json.dumps(content, separators=(",", ":")).encode("utf-8")
+
+
+def load_json(body: bytes) -> Any:
+    """
+    Lê o body com orjson. Ele recusa surrogates soltos ("\\ud800"), que o
+    JSON aceita, então nesse caso o body é lido de novo pela stdlib.
+    """
+    try:
+        return orjson.loads(body)
+    except orjson.JSONDecodeError as error:
+        try:
+            return json.loads(body)
+        except ValueError:
+            raise error
+
+
+def is_str_list(value: object) -> bool:
+    return type(value) is list and set(map(type, value)) <= {str}
+
+
+def validate_body(model: type[ModelT], payload: object) -> ModelT:
+    """
+    Valida o payload no model, com os erros no mesmo formato (422) que o
+    FastAPI usa para o body.
+    """
+    try:
+        return model.model_validate(payload)
+    except ValidationError as error:
+        raise RequestValidationError(
+            [
+                {**detail, "loc": ("body", *detail["loc"])}
+                for detail in error.errors(include_url=False)
+            ],
+            body=payload,
+        )
+
+
+def parse_json_body(
+    body: bytes, model: type[ModelT], list_field: str, fast: bool = True
+) -> ModelT:
+    """
+    Lê o body com orjson e valida o model. No modo fast, se list_field já
+    é uma lista de str (o caso normal), ela não passa pelo pydantic item a
+    item: o model é validado com a lista vazia e recebe a lista do body
+    depois. Qualquer outro caso passa pela validação completa, para o erro
+    sair igual.
+    """
+    try:
+        payload = load_json(body)
+    except orjson.JSONDecodeError as error:
+        raise RequestValidationError(
+            [
+                {
+                    "type": "json_invalid",
+                    "loc": ("body", error.pos),
+                    "msg": "JSON decode error",
+                    "input": {},
+                    "ctx": {"error": error.msg},
+                }
+            ],
+            body=error.doc,
+        )
+    if not (
+        fast and isinstance(payload, dict) and is_str_list(payload.get(list_field))
+    ):
+        return validate_body(model, payload)
+
+    try:
+        parsed = model.model_validate({**payload, list_field: []})
+    except ValidationError:
+        # Valida de novo com a lista, para o erro mostrar o body enviado.
+        return validate_body(model, payload)
+    setattr(parsed, list_field, payload[list_field])
+    return parsed
+
+
+def json_body(
+    model: type[ModelT], list_field: str = "words"
+) -> Callable[[Request], Awaitable[ModelT]]:
+    """
+    Dependência que substitui o parse do body do FastAPI (json + pydantic
+    em toda a lista) por parse_json_body, fora do event loop. Com
+    WORDS_FAST_JSON_BODY desligado o body é validado pelo pydantic inteiro.
+    """
+
+    async def parse(request: Request) -> ModelT:
+        body = await request.body()
+        arguments = (body, model, list_field, settings.WORDS_FAST_JSON_BODY)
+        if len(body) < THREADPOOL_BODY_SIZE:
+            return parse_json_body(*arguments)
+        return await run_in_threadpool(parse_json_body, *arguments)
+
+    return parse
+
+
+def json_body_openapi(model: type[BaseModel]) -> dict:
+    """
+    openapi_extra com o schema do body, que some da documentação quando o
+    body é lido por uma dependência.
+    """
+    return {
+        "requestBody": {
+            "content": {"application/json": {"schema": model.model_json_schema()}},
+            "required": True,
+        }
+    }
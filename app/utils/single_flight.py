@@ -0,0 +1,64 @@
+import asyncio
+import logging
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    """
+    Agrupa chamadas concorrentes com a mesma chave: só a primeira executa
+    o loader, as outras esperam e recebem o mesmo resultado (ou erro).
+
+    O loader roda na sua própria task e todas as chamadas esperam por ela
+    com shield, então o cancelamento de uma chamada (ex.: o cliente
+    desconectou) não cancela o loader nem as outras chamadas.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[str, asyncio.Task] = {}
+        self._tasks: set[asyncio.Task] = set()
+
+    def in_flight(self, key: str) -> bool:
+        return key in self._calls
+
+    def start(
+        self, key: str, loader: Callable[[], Awaitable[Any]]
+    ) -> asyncio.Task | None:
+        """
+        Executa o loader em background, sem esperar o resultado. Se já
+        existe uma chamada com a mesma chave nada é feito.
+        """
+        if self.in_flight(key):
+            return None
+        task = self._call(key, loader)
+        self._tasks.add(task)
+        task.add_done_callback(self._background_done)
+        return task
+
+    def _background_done(self, task: asyncio.Task) -> None:
+        self._tasks.discard(task)
+        if not task.cancelled() and (error := task.exception()) is not None:
+            logger.error("Error in background call", extra={"error": error})
+
+    def _call(self, key: str, loader: Callable[[], Awaitable[Any]]) -> asyncio.Task:
+        task = asyncio.ensure_future(loader())
+        self._calls[key] = task
+        task.add_done_callback(lambda done: self._call_done(key, done))
+        return task
+
+    def _call_done(self, key: str, task: asyncio.Task) -> None:
+        if self._calls.get(key) is task:
+            self._calls.pop(key)
+        if not task.cancelled():
+            # Marca o erro como lido caso ninguém esteja esperando.
+            task.exception()
+
+    async def do(self, key: str, loader: Callable[[], Awaitable[Any]]) -> Any:
+        if (task := self._calls.get(key)) is None:
+            task = self._call(key, loader)
+        return await asyncio.shield(task)
@@ -0,0 +1,90 @@
+"""
+Benchmark das buscas por sigla na collection de moedas, sem e com os
+índices criados no startup, enquanto a collection cresce até 100k
+documentos. Mostra também se a busca da cotação é coberta pelo índice
+(totalDocsExamined == 0).
+
+Precisa do Mongo do docker-compose rodando, usa um banco separado
+que é apagado no final.
+
+ex.: python -m tests.performance.mongo_indexes
+"""
+
+from random import (
+    choice,
+    seed,
+)
+from timeit import timeit
+
+from app.api.v1.currency_converter.indexes import (
+    CURRENCY_INDEXES,
+    RATE_PROJECTION,
+)
+from app.api.v1.currency_converter.models import Currency
+from app.repositories.mongo_repository import MongoRepository
+
+BENCHMARK_DATABASE = "currency_benchmark"
+BENCHMARK_COLLECTION = "currencys"
+COLLECTION_SIZES = [1_000, 10_000, 100_000]
+ITERATIONS = 200
+
+
+def build_currencies(total: int) -> list[dict]:
+    return [
+        Currency(
+            acronym=f"C{index:06d}",
+            name=f"Currency {index}",
+            dolar_price_reference=(index + 1) / 7,
+        ).model_dump()
+        for index in range(total)
+    ]
+
+
+def lookup_time(repository: MongoRepository, acronyms: list[str], **kwargs) -> float:
+    elapsed = timeit(
+        lambda: repository.get_by_acronym(
+            BENCHMARK_DATABASE, BENCHMARK_COLLECTION, choice(acronyms), **kwargs
+        ),
+        number=ITERATIONS,
+    )
+    return elapsed / ITERATIONS * 1e6
+
+
+def docs_examined(repository: MongoRepository, acronym: str) -> int:
+    collection = repository.client[BENCHMARK_DATABASE][BENCHMARK_COLLECTION]
+    explain = collection.find({"acronym": acronym}, RATE_PROJECTION).explain()
+    return explain["executionStats"]["totalDocsExamined"]
+
+
+def run() -> None:
+    seed(0)
+    repository = MongoRepository()
+    collection = repository.client[BENCHMARK_DATABASE][BENCHMARK_COLLECTION]
+    print(
+        f"{'documents':>10}{'scan (us)':>14}{'index (us)':>14}"
+        f"{'covered (us)':>14}{'docs examined':>15}"
+    )
+    try:
+        for total in COLLECTION_SIZES:
+            collection.drop()
+            currencies = build_currencies(total)
+            collection.insert_many(currencies)
+            acronyms = [currency["acronym"] for currency in currencies]
+
+            scan_time = lookup_time(repository, acronyms)
+            repository.create_indexes(
+                BENCHMARK_DATABASE, BENCHMARK_COLLECTION, CURRENCY_INDEXES
+            )
+            index_time = lookup_time(repository, acronyms)
+            covered_time = lookup_time(repository, acronyms, projection=RATE_PROJECTION)
+            print(
+                f"{total:>10}{scan_time:>14.2f}{index_time:>14.2f}"
+                f"{covered_time:>14.2f}"
+                f"{docs_examined(repository, choice(acronyms)):>15}"
+            )
+    finally:
+        repository.client.drop_database(BENCHMARK_DATABASE)
+
+
+if __name__ == "__main__":
+    run()
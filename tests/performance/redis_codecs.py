@@ -0,0 +1,52 @@
+"""
+Benchmark dos codecs do Redis (json, orjson e msgpack).
+
+Mede o custo de encode/decode e o tamanho do payload para uma moeda
+e para a lista usada no GET /currencies.
+
+ex.: python -m tests.performance.redis_codecs
+"""
+
+from timeit import timeit
+
+from app.api.v1.currency_converter.models import Currency
+from app.repositories.codecs import (
+    CODECS,
+    get_codec,
+)
+
+ITERATIONS = 2000
+TOTAL_CURRENCIES = 200
+
+
+def build_payloads() -> dict:
+    currencies = [
+        Currency(
+            acronym=f"C{index:03d}",
+            name=f"Currency {index}",
+            dolar_price_reference=index / 7,
+        ).model_dump()
+        for index in range(TOTAL_CURRENCIES)
+    ]
+    return {"single currency": currencies[0], "all_currencys": currencies}
+
+
+def run() -> None:
+    for payload_name, payload in build_payloads().items():
+        print(f"\n{payload_name} ({ITERATIONS} iterations)")
+        print(f"{'codec':<10}{'encode (us)':>14}{'decode (us)':>14}{'bytes':>10}")
+        for name in CODECS:
+            codec = get_codec(name)
+            encoded = codec.encode(payload)
+            encode_time = timeit(lambda: codec.encode(payload), number=ITERATIONS)
+            decode_time = timeit(lambda: codec.decode(encoded), number=ITERATIONS)
+            print(
+                f"{name:<10}"
+                f"{encode_time / ITERATIONS * 1e6:>14.2f}"
+                f"{decode_time / ITERATIONS * 1e6:>14.2f}"
+                f"{len(encoded):>10}"
+            )
+
+
+if __name__ == "__main__":
+    run()
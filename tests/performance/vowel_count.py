@@ -0,0 +1,79 @@
+"""
+Benchmark da contagem de vogais do /words/vowel-count: a versão antiga
+(unidecode + Counter por palavra) contra a contagem em lote com NumPy,
+com palavras todas diferentes e com um vocabulário pequeno repetido
+(onde o cache LRU do serviço é usado).
+
+ex.: python -m tests.performance.vowel_count
+"""
+
+from collections import Counter
+from random import (
+    choice,
+    randint,
+    seed,
+)
+from time import perf_counter
+
+from unidecode import unidecode
+
+from app.api.v1.words.vowel_count.cache import vowel_count_cache
+from app.api.v1.words.vowel_count.service import VowelCountService
+
+TOTAL_WORDS = 1_000_000
+VOCABULARY_SIZE = 5_000
+LETTERS = "abcdefghijklmnopqrstuvwxyzáéíóúãõçABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+
+def build_words(total: int) -> list[str]:
+    seed(0)
+    return [
+        "".join(choice(LETTERS) for _ in range(randint(3, 12))) for _ in range(total)
+    ]
+
+
+def legacy_total_vowels(words: list[str]) -> dict:
+    response = {}
+    for word in words:
+        word_count = Counter(unidecode(word))
+        response[word] = sum(word_count[vowel] for vowel in "aeiou")
+    return response
+
+
+def measure(function, words: list[str]) -> float:
+    started_at = perf_counter()
+    function(words)
+    return perf_counter() - started_at
+
+
+def compare(title: str, words: list[str]) -> None:
+    service = VowelCountService()
+    vowel_count_cache.clear()
+    legacy_time = measure(legacy_total_vowels, words)
+    bulk_time = measure(service.return_total_vowels, words)
+    # Segunda chamada com o cache já preenchido.
+    cached_time = measure(service.return_total_vowels, words)
+    print(title)
+    print(f"{'engine':<10}{'seconds':>10}{'words/s':>14}{'speedup':>10}")
+    for name, elapsed in (
+        ("legacy", legacy_time),
+        ("bulk", bulk_time),
+        ("cached", cached_time),
+    ):
+        print(
+            f"{name:<10}{elapsed:>10.3f}{len(words) / elapsed:>14.0f}"
+            f"{legacy_time / elapsed:>9.1f}x"
+        )
+    print(f"cache: {vowel_count_cache.stats()}\n")
+
+
+def run() -> None:
+    words = build_words(TOTAL_WORDS)
+    compare("palavras distintas", words)
+    vocabulary = words[:VOCABULARY_SIZE]
+    repeated = [vocabulary[index % VOCABULARY_SIZE] for index in range(TOTAL_WORDS)]
+    compare(f"vocabulário de {VOCABULARY_SIZE} palavras", repeated)
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,56 @@
+"""
+Benchmark do /words/analyze: uma requisição com os estágios sort e
+vowel_count contra as duas requisições separadas (/words/sort e
+/words/vowel-count), incluindo o parse do body JSON de cada uma.
+
+ex.: python -m tests.performance.words_analyze
+"""
+
+from time import perf_counter
+
+import orjson
+
+from app.api.v1.words.analyze.models import AnalyzeWordsRequest
+from app.api.v1.words.analyze.service import AnalyzeWordsService
+from app.api.v1.words.sort.models import SortWordsRequest
+from app.api.v1.words.sort.service import SortWordService
+from app.api.v1.words.vowel_count.cache import vowel_count_cache
+from app.api.v1.words.vowel_count.models import VowelCountRequest
+from app.api.v1.words.vowel_count.service import VowelCountService
+from tests.performance.vowel_count import build_words
+
+TOTAL_WORDS = 1_000_000
+
+
+def separate_requests(words: list[str]) -> None:
+    body = orjson.dumps({"words": words, "order": "asc"})
+    SortWordService().sort_words(SortWordsRequest.model_validate_json(body))
+    body = orjson.dumps({"words": words})
+    request = VowelCountRequest.model_validate_json(body)
+    VowelCountService().return_total_vowels(request.words)
+
+
+def analyze_request(words: list[str]) -> None:
+    body = orjson.dumps({"words": words, "stages": ["sort", "vowel_count"]})
+    AnalyzeWordsService().analyze_words(AnalyzeWordsRequest.model_validate_json(body))
+
+
+def measure(function, words: list[str]) -> float:
+    vowel_count_cache.clear()
+    started_at = perf_counter()
+    function(words)
+    return perf_counter() - started_at
+
+
+def run() -> None:
+    words = build_words(TOTAL_WORDS)
+    separate_time = measure(separate_requests, words)
+    analyze_time = measure(analyze_request, words)
+    print(f"{TOTAL_WORDS} palavras, sort + vowel_count")
+    print(f"{'separate':<10}{separate_time:>10.3f}s")
+    print(f"{'analyze':<10}{analyze_time:>10.3f}s")
+    print(f"speedup: {separate_time / analyze_time:.1f}x")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,58 @@
+"""
+Benchmark das collations do /words/sort: custo de calcular as chaves
+(uma vez por palavra, cresce linear com o total de palavras) e do sort
+inteiro, contra um sort que recalcula a chave em cada comparação.
+
+ex.: python -m tests.performance.words_collation
+"""
+
+from functools import cmp_to_key
+from time import perf_counter
+
+from app.api.v1.words.sort.collation import COLLATION_KEYS
+from tests.performance.vowel_count import build_words
+
+SIZES = (250_000, 500_000, 1_000_000)
+COMPARISON_SIZE = 100_000
+
+
+def measure(function) -> float:
+    started_at = perf_counter()
+    function()
+    return perf_counter() - started_at
+
+
+def compare_in_every_comparison(key):
+    def compare(first: str, second: str) -> int:
+        first_key, second_key = key(first), key(second)
+        return (first_key > second_key) - (first_key < second_key)
+
+    return cmp_to_key(compare)
+
+
+def run() -> None:
+    all_words = build_words(max(SIZES))
+    print(f"{'collation':<20}{'words':>10}{'keys s':>10}{'ns/word':>10}{'sort s':>10}")
+    for name, key in COLLATION_KEYS.items():
+        for size in SIZES:
+            words = all_words[:size]
+            keys_time = measure(lambda: [key(word) for word in words])
+            sort_time = measure(lambda: sorted(words, key=key))
+            print(
+                f"{name:<20}{size:>10}{keys_time:>10.3f}"
+                f"{keys_time / size * 1e9:>10.0f}{sort_time:>10.3f}"
+            )
+
+    words = all_words[:COMPARISON_SIZE]
+    print(f"\n{COMPARISON_SIZE} palavras, chave calculada em cada comparação")
+    print(f"{'collation':<20}{'once s':>10}{'per cmp s':>10}")
+    for name, key in COLLATION_KEYS.items():
+        once_time = measure(lambda: sorted(words, key=key))
+        every_time = measure(
+            lambda: sorted(words, key=compare_in_every_comparison(key))
+        )
+        print(f"{name:<20}{once_time:>10.3f}{every_time:>10.3f}")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,83 @@
+"""
+Benchmark do POST /words/sort/stream: pico de memória e tempo do sort
+externo (runs em disco + merge) com orçamentos de memória diferentes,
+lendo o NDJSON aos pedaços como vem do body da requisição.
+
+Cada orçamento roda num processo novo para o pico de memória ser dele.
+
+ex.: python -m tests.performance.words_external_sort
+"""
+
+import asyncio
+import resource
+from concurrent.futures import ProcessPoolExecutor
+from io import BytesIO
+from multiprocessing import get_context
+from random import (
+    choice,
+    randint,
+    seed,
+)
+from time import perf_counter
+
+import orjson
+
+from app.api.v1.words.sort.external_sort import (
+    ExternalSorter,
+    iter_ndjson_words,
+)
+from tests.performance.vowel_count import LETTERS
+
+TOTAL_WORDS = 2_000_000
+CHUNK_SIZE = 64 * 1024
+BUDGETS = (1024**3, 64 * 1024**2, 8 * 1024**2)
+
+
+def build_body() -> bytes:
+    # Escrito palavra a palavra para a lista inteira não entrar no pico.
+    seed(0)
+    body = BytesIO()
+    for _ in range(TOTAL_WORDS):
+        word = "".join(choice(LETTERS) for _ in range(randint(3, 12)))
+        body.write(orjson.dumps(word) + b"\n")
+    return body.getvalue()
+
+
+async def iter_body(body: bytes):
+    for start in range(0, len(body), CHUNK_SIZE):
+        stop = start + CHUNK_SIZE
+        yield body[start:stop]
+
+
+async def sort_body(body: bytes, memory_budget: int) -> int:
+    sorter = ExternalSorter(memory_budget)
+    async for words in iter_ndjson_words(iter_body(body)):
+        if sorter.extend(words):
+            sorter.spill()
+    runs = sorter.runs
+    for _ in sorter.iter_ndjson(1000):
+        pass
+    return runs
+
+
+def measure(memory_budget: int) -> tuple[float, int, float]:
+    body = build_body()
+    rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    started_at = perf_counter()
+    runs = asyncio.run(sort_body(body, memory_budget))
+    elapsed = perf_counter() - started_at
+    rss_after = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return elapsed, runs, (rss_after - rss_before) / 1024
+
+
+def run() -> None:
+    print(f"{TOTAL_WORDS} palavras")
+    print(f"{'budget MB':>10}{'runs':>8}{'seconds':>10}{'peak MB':>10}")
+    for memory_budget in BUDGETS:
+        with ProcessPoolExecutor(1, mp_context=get_context("spawn")) as pool:
+            elapsed, runs, peak = pool.submit(measure, memory_budget).result()
+        print(f"{memory_budget / 1024**2:>10.0f}{runs:>8}{elapsed:>10.2f}{peak:>10.0f}")
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,104 @@
+"""
+Benchmark do parse do body e da resposta dos endpoints de palavras: os
+endpoints como eram (body validado pelo pydantic e JSONResponse) contra
+o caminho rápido (orjson + ORJSONResponse), chamando o app ASGI direto,
+sem rede. O trabalho do serviço é o mesmo nos dois.
+
+ex.: python -m tests.performance.words_json
+"""
+
+import asyncio
+from time import perf_counter
+
+import orjson
+from fastapi import (
+    FastAPI,
+    status,
+)
+from fastapi.responses import JSONResponse
+
+from app.api.v1.words.sort.models import SortWordsRequest
+from app.api.v1.words.sort.service import SortWordService
+from app.api.v1.words.vowel_count.cache import vowel_count_cache
+from app.api.v1.words.vowel_count.models import VowelCountRequest
+from app.api.v1.words.vowel_count.service import VowelCountService
+from app.main import app
+from app.utils.middlewares import ResponseTimeMiddleware
+from tests.performance.vowel_count import build_words
+
+SIZES = ((100, 2000), (10_000, 50), (1_000_000, 3))
+legacy_app = FastAPI()
+legacy_app.add_middleware(ResponseTimeMiddleware)
+
+
+@legacy_app.post("/api/v1/words/sort")
+def legacy_sort_words(payload: SortWordsRequest) -> JSONResponse:
+    response = SortWordService().sort_words(payload)
+    return JSONResponse(content=response, status_code=status.HTTP_200_OK)
+
+
+@legacy_app.post("/api/v1/words/vowel-count")
+def legacy_vowel_count(payload: VowelCountRequest) -> JSONResponse:
+    response = VowelCountService().return_total_vowels(payload.words)
+    return JSONResponse(content=response, status_code=status.HTTP_200_OK)
+
+
+async def post(asgi_app, path: str, body: bytes) -> None:
+    messages = [{"type": "http.request", "body": body, "more_body": False}]
+    sent = []
+
+    async def receive() -> dict:
+        return messages.pop() if messages else {"type": "http.disconnect"}
+
+    async def send(message: dict) -> None:
+        sent.append(message)
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"content-type", b"application/json")],
+        "client": ("benchmark", 0),
+        "server": ("benchmark", 80),
+    }
+    await asgi_app(scope, receive, send)
+    assert sent[0]["status"] == status.HTTP_200_OK
+
+
+async def requests_per_second(asgi_app, path: str, body: bytes, total: int) -> float:
+    started_at = perf_counter()
+    for _ in range(total):
+        await post(asgi_app, path, body)
+    return total / (perf_counter() - started_at)
+
+
+async def run() -> None:
+    print(
+        f"{'endpoint':<14}{'words':>10}{'before r/s':>12}{'after r/s':>12}{'gain':>8}"
+    )
+    for size, total in SIZES:
+        words = build_words(size)
+        # Sem ordenação (order inválida devolve a lista) e com o cache de
+        # vogais cheio, para medir só o parse e a resposta.
+        for path, body in (
+            ("/api/v1/words/sort", orjson.dumps({"words": words, "order": "none"})),
+            ("/api/v1/words/vowel-count", orjson.dumps({"words": words})),
+        ):
+            vowel_count_cache.clear()
+            await post(app, path, body)
+            before = await requests_per_second(legacy_app, path, body, total)
+            after = await requests_per_second(app, path, body, total)
+            print(
+                f"{path.rsplit('/', 1)[-1]:<14}{size:>10}{before:>12.1f}"
+                f"{after:>12.1f}{after / before:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    asyncio.run(run())
@@ -0,0 +1,52 @@
+"""
+Benchmark do modo paralelo do /words/sort e /words/vowel-count: a lista
+inteira processada no worker contra os shards no pool de processos.
+
+ex.: python -m tests.performance.words_parallel
+"""
+
+from time import perf_counter
+
+from app.api.v1.words.parallel import (
+    close_process_pool,
+    get_process_pool,
+    parallel_count_vowels,
+    parallel_sort,
+    pool_size,
+)
+from app.api.v1.words.vowel_count.utils import count_vowels
+from tests.performance.vowel_count import build_words
+
+TOTAL_WORDS = 2_000_000
+
+
+def measure(function, *args) -> float:
+    started_at = perf_counter()
+    function(*args)
+    return perf_counter() - started_at
+
+
+def run() -> None:
+    words = build_words(TOTAL_WORDS)
+    # Sobe os processos antes de medir.
+    list(get_process_pool().map(abs, range(pool_size())))
+    results = (
+        ("sort", measure(sorted, words), measure(parallel_sort, words)),
+        (
+            "vowel-count",
+            measure(count_vowels, words),
+            measure(parallel_count_vowels, words),
+        ),
+    )
+    close_process_pool()
+    print(f"{pool_size()} processos, {TOTAL_WORDS} palavras")
+    print(f"{'operation':<14}{'serial':>10}{'parallel':>10}{'speedup':>10}")
+    for name, serial_time, parallel_time in results:
+        print(
+            f"{name:<14}{serial_time:>10.3f}{parallel_time:>10.3f}"
+            f"{serial_time / parallel_time:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    run()
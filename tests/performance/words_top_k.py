@@ -0,0 +1,36 @@
+"""
+Benchmark do limit/offset do /words/sort: seleção das primeiras palavras
+com heap (O(n log k)) contra ordenar a lista inteira e cortar.
+
+ex.: python -m tests.performance.words_top_k
+"""
+
+from time import perf_counter
+
+from app.api.v1.words.sort.models import SortWordsRequest
+from app.api.v1.words.sort.service import SortWordService
+from tests.performance.vowel_count import build_words
+
+TOTAL_WORDS = 1_000_000
+LIMITS = (10, 100, 1_000, 10_000)
+
+
+def measure(words: list[str], **fields) -> float:
+    request = SortWordsRequest(words=list(words), order="asc", **fields)
+    started_at = perf_counter()
+    SortWordService().sort_words(request)
+    return perf_counter() - started_at
+
+
+def run() -> None:
+    words = build_words(TOTAL_WORDS)
+    full_sort_time = measure(words)
+    print(f"{TOTAL_WORDS} palavras, sort completo: {full_sort_time:.3f}s")
+    print(f"{'limit':>8}{'top-k s':>10}{'speedup':>10}")
+    for limit in LIMITS:
+        top_k_time = measure(words, limit=limit)
+        print(f"{limit:>8}{top_k_time:>10.3f}{full_sort_time / top_k_time:>9.1f}x")
+
+
+if __name__ == "__main__":
+    run()
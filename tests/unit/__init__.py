@@ -1,6 +1,21 @@
-from unittest import TestCase
+from unittest import (
+    IsolatedAsyncioTestCase,
+    TestCase,
+)
+
+from app.api.v1.words.vowel_count.cache import vowel_count_cache
+from app.utils.circuit_breaker import reset_circuit_breakers
 
 
 class DefaultTestCase(TestCase):
     def setUp(self) -> None:
+        reset_circuit_breakers()
+        vowel_count_cache.clear()
+        return super().setUp()
+
+
+class DefaultAsyncTestCase(IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        reset_circuit_breakers()
+        vowel_count_cache.clear()
         return super().setUp()
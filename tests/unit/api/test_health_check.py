@@ -10,13 +10,32 @@ from app.api.v1.api_health import (
     check_health,
     return_docs,
 )
+from app.api.v1.words.vowel_count.cache import vowel_count_cache
+from app.repositories.mongo_repository import mongo_circuit_breaker
+from app.services.awesomeapi import awesome_api_circuit_breaker
 from tests.unit import DefaultTestCase
 
 
 class HealthCheckTestCase(DefaultTestCase):
 
     def setUp(self) -> None:
-        self.health_check_response = {"status": "OK"}
+        closed_breaker = {"state": "closed", "failure_rate": 0.0, "calls": 0}
+        self.health_check_response = {
+            "status": "OK",
+            "circuit_breakers": {
+                "mongo": closed_breaker,
+                "awesomeapi": closed_breaker,
+            },
+            "caches": {
+                "vowel_count": {
+                    "size": 0,
+                    "maxsize": vowel_count_cache.maxsize,
+                    "hits": 0,
+                    "misses": 0,
+                    "evictions": 0,
+                }
+            },
+        }
         return super().setUp()
 
     def test_health_check(self):
@@ -29,3 +48,12 @@ class HealthCheckTestCase(DefaultTestCase):
         response = return_docs()
         self.assertTrue(isinstance(response, RedirectResponse))
         self.assertTrue(response.status_code == status.HTTP_307_TEMPORARY_REDIRECT)
+
+    def test_health_check_shows_open_breaker(self):
+        mongo_circuit_breaker._open()
+        response = check_health()
+        breakers = json.loads(response.body)["circuit_breakers"]
+        self.assertEqual(breakers["mongo"]["state"], "open")
+        self.assertEqual(
+            breakers["awesomeapi"]["state"], awesome_api_circuit_breaker.state
+        )
@@ -0,0 +1,486 @@
+import asyncio
+from time import time
+from unittest.mock import (
+    AsyncMock,
+    Mock,
+    patch,
+)
+
+from redis.exceptions import LockError
+
+from app.api.v1.currency_converter.indexes import (
+    CURRENCY_INDEXES,
+    DATE_INDEXES,
+    RATE_PROJECTION,
+)
+from app.api.v1.currency_converter.invalidation import CURRENCY_INVALIDATION_CHANNEL
+from app.api.v1.currency_converter.models import Currency
+from app.api.v1.currency_converter.rate_table import rate_table
+from app.api.v1.currency_converter.service import (
+    CURRENCY_GENERATION,
+    CurrencyConverterService,
+    currency_single_flight,
+)
+from app.api.v1.currency_converter.tasks import (
+    CURRENCY_REFRESH_LOCK,
+    ensure_currency_indexes,
+    refresh_currencies_as_leader,
+    refresh_currencies_periodically,
+    settings,
+)
+from app.exceptions.default_exceptions import (
+    ApiInvalidResponseException,
+    CircuitOpenException,
+    MongoRepositoryTransactionsException,
+    ServiceUnavailableException,
+)
+from app.repositories.mongo_repository import (
+    AsyncMongoRepository,
+    mongo_circuit_breaker,
+)
+from app.repositories.redis_repository import AsyncRedisRepository
+from app.services.awesomeapi import (
+    AsyncAwesomeApiService,
+    build_http_client,
+)
+from tests.unit import DefaultAsyncTestCase
+from tests.unit.test_utils import AwesomeApiMockTransport
+
+
+class CurrencyServiceSingleFlightTestCase(DefaultAsyncTestCase):
+
+    def setUp(self) -> None:
+        rate_table.clear()
+        self.currency = Currency(
+            acronym="BRL", name="Real", dolar_price_reference=0.2
+        ).model_dump()
+        return super().setUp()
+
+    async def _slow_get_by_acronym(self, *_):
+        await asyncio.sleep(0.01)
+        return self.currency
+
+    @patch.object(
+        AsyncRedisRepository, "get_generation", new=AsyncMock(return_value="0")
+    )
+    @patch.object(AsyncRedisRepository, "set_many_if_generation")
+    @patch.object(AsyncRedisRepository, "get_many")
+    @patch.object(AsyncMongoRepository, "get_by_acronym")
+    async def test_concurrent_misses_load_each_currency_once(
+        self, mock_get_by_acronym: Mock, redis_mock_get: Mock, redis_mock_create: Mock
+    ):
+        redis_mock_get.return_value = [None]
+        mock_get_by_acronym.side_effect = self._slow_get_by_acronym
+        service = CurrencyConverterService()
+
+        responses = await asyncio.gather(
+            *[service.currency_exchange("BRL", "BRL", 10) for _ in range(20)]
+        )
+
+        self.assertEqual(set(responses), {"10.000000"})
+        mock_get_by_acronym.assert_called_once()
+        redis_mock_create.assert_called_once()
+
+    @patch.object(
+        AsyncRedisRepository, "get_generation", new=AsyncMock(return_value="0")
+    )
+    @patch.object(AsyncAwesomeApiService, "get_currency_values")
+    @patch.object(AsyncRedisRepository, "get_many")
+    @patch.object(AsyncMongoRepository, "get_by_acronym")
+    async def test_concurrent_api_fallbacks_call_upstream_once(
+        self, mock_get_by_acronym: Mock, redis_mock_get: Mock, mock_api: Mock
+    ):
+        async def slow_api_response(*_):
+            await asyncio.sleep(0.01)
+            return {"USDBRL": {"bid": "5"}}
+
+        redis_mock_get.return_value = [None, None]
+        mock_get_by_acronym.side_effect = MongoRepositoryTransactionsException
+        mock_api.side_effect = slow_api_response
+        service = CurrencyConverterService()
+
+        responses = await asyncio.gather(
+            *[service.currency_exchange("USD", "BRL", 10) for _ in range(5)]
+        )
+
+        self.assertEqual(set(responses), {"50.00"})
+        mock_api.assert_called_once_with("USD", "BRL")
+
+    @patch("app.api.v1.currency_converter.service.settings")
+    @patch.object(AsyncRedisRepository, "lock")
+    @patch.object(AsyncRedisRepository, "get_many")
+    @patch.object(AsyncMongoRepository, "get_by_acronym")
+    async def test_redis_lock_rechecks_cache_filled_by_other_worker(
+        self,
+        mock_get_by_acronym: Mock,
+        redis_mock_get: Mock,
+        redis_mock_lock: Mock,
+        mock_settings: Mock,
+    ):
+        mock_settings.SINGLE_FLIGHT_REDIS_LOCK = True
+        redis_mock_get.side_effect = [[None], [self.currency]]
+        redis_mock_lock.return_value = AsyncMock()
+        redis_mock_lock.return_value.acquire.return_value = True
+        service = CurrencyConverterService()
+
+        response = await service.currency_exchange("BRL", "BRL", 10)
+
+        self.assertEqual(response, "10.000000")
+        mock_get_by_acronym.assert_not_called()
+        redis_mock_lock.return_value.release.assert_called_once()
+
+    @patch("app.api.v1.currency_converter.service.settings")
+    @patch.object(AsyncRedisRepository, "lock")
+    @patch.object(
+        AsyncRedisRepository, "get_generation", new=AsyncMock(return_value="0")
+    )
+    @patch.object(AsyncRedisRepository, "set_many_if_generation")
+    @patch.object(AsyncRedisRepository, "get_many")
+    @patch.object(AsyncMongoRepository, "get_by_acronym")
+    async def test_redis_lock_not_acquired_loads_from_database(
+        self,
+        mock_get_by_acronym: Mock,
+        redis_mock_get: Mock,
+        redis_mock_create: Mock,
+        redis_mock_lock: Mock,
+        mock_settings: Mock,
+    ):
+        mock_settings.SINGLE_FLIGHT_REDIS_LOCK = True
+        redis_mock_get.return_value = [None]
+        redis_mock_lock.return_value = AsyncMock()
+        redis_mock_lock.return_value.acquire.return_value = False
+        mock_get_by_acronym.return_value = self.currency
+        service = CurrencyConverterService()
+
+        response = await service.currency_exchange("BRL", "BRL", 10)
+
+        self.assertEqual(response, "10.000000")
+        mock_get_by_acronym.assert_called_once()
+        redis_mock_lock.return_value.release.assert_not_called()
+
+    async def test_redis_repository_lock(self):
+        repository = AsyncRedisRepository()
+        lock = repository.lock("BRL", timeout=5, blocking_timeout=1)
+
+        self.assertEqual(lock.name, "lock:BRL")
+        self.assertEqual(lock.timeout, 5)
+        self.assertEqual(lock.blocking_timeout, 1)
+
+
+class CurrencyServiceIndexesTestCase(DefaultAsyncTestCase):
+
+    def setUp(self) -> None:
+        rate_table.clear()
+        return super().setUp()
+
+    @patch.object(AsyncMongoRepository, "create_indexes")
+    async def test_ensure_currency_indexes(self, mock_create_indexes: Mock):
+        mock_create_indexes.return_value = ["acronym_unique"]
+        self.assertEqual(
+            await ensure_currency_indexes(), ["acronym_unique", "acronym_unique"]
+        )
+        mock_create_indexes.assert_any_call(
+            "currency_db", "currencys", CURRENCY_INDEXES
+        )
+        mock_create_indexes.assert_any_call("currency_db", "daily_time", DATE_INDEXES)
+
+        mock_create_indexes.side_effect = MongoRepositoryTransactionsException
+        self.assertEqual(await ensure_currency_indexes(), [])
+
+    @patch.object(
+        AsyncRedisRepository, "get_generation", new=AsyncMock(return_value="0")
+    )
+    @patch.object(AsyncRedisRepository, "set_many_if_generation")
+    @patch.object(AsyncRedisRepository, "get_many")
+    @patch.object(AsyncMongoRepository, "get_by_acronym")
+    async def test_exchange_loads_only_the_rate(
+        self, mock_get_by_acronym: Mock, redis_mock_get: Mock, redis_mock_set: Mock
+    ):
+        redis_mock_get.return_value = [None]
+        mock_get_by_acronym.return_value = {
+            "acronym": "BRL",
+            "dolar_price_reference": 0.2,
+        }
+        service = CurrencyConverterService()
+
+        self.assertEqual(await service.currency_exchange("BRL", "BRL", 10), "10.000000")
+        mock_get_by_acronym.assert_called_once_with(
+            "currency_db", "currencys", "BRL", RATE_PROJECTION
+        )
+        redis_mock_set.assert_called_once_with(
+            {"BRL": {"acronym": "BRL", "dolar_price_reference": 0.2}},
+            CURRENCY_GENERATION,
+            "0",
+        )
+
+
+class CurrencyServiceRefreshFromApiTestCase(DefaultAsyncTestCase):
+
+    def setUp(self) -> None:
+        rate_table.clear()
+        self.quotations = {
+            f"{acronym}-USD": {
+                "code": acronym,
+                "name": f"{acronym} name/Dólar Americano",
+                "bid": str(bid),
+            }
+            for acronym, bid in (("BRL", 0.2), ("EUR", 1.1), ("BTC", 60000))
+        }
+        self.quotations["USD-BRL"] = {"code": "USD", "bid": "5"}
+        # Sigla maior que a aceita pelo model, é ignorada.
+        self.quotations["BRLPTAX-USD"] = {"code": "BRLPTAX", "bid": "0.2"}
+        return super().setUp()
+
+    @patch("app.api.v1.currency_converter.service.settings")
+    @patch.object(AsyncRedisRepository, "publish")
+    @patch.object(AsyncRedisRepository, "write_through")
+    @patch.object(AsyncMongoRepository, "update_or_create_date_cache")
+    @patch.object(AsyncMongoRepository, "bulk_update_or_create_by_acronym")
+    async def test_refresh_currencies_from_api(
+        self,
+        mock_bulk: Mock,
+        mock_date_cache: Mock,
+        redis_mock_write_through: Mock,
+        redis_mock_publish: Mock,
+        mock_settings: Mock,
+    ):
+        mock_settings.AWESOME_API_PAIRS_PER_REQUEST = 2
+        transport = AwesomeApiMockTransport(self.quotations)
+        async with build_http_client(transport=transport) as http_client:
+            service = CurrencyConverterService()
+            service.awesome_service = AsyncAwesomeApiService(http_client)
+            self.assertEqual(await service.refresh_currencies_from_api(), 4)
+
+        # /json/available e dois lotes de pares cotados em dólar.
+        self.assertEqual(
+            [request.url.path for request in transport.requests],
+            [
+                "/json/available",
+                "/json/last/BRL-USD,BRLPTAX-USD",
+                "/json/last/BTC-USD,EUR-USD",
+            ],
+        )
+        currencies = mock_bulk.call_args.args[2]
+        self.assertEqual(
+            {
+                currency["acronym"]: currency["dolar_price_reference"]
+                for currency in currencies
+            },
+            {"USD": 1, "BRL": 0.2, "BTC": 60000, "EUR": 1.1},
+        )
+        self.assertEqual(currencies[1]["name"], "BRL name")
+        date_cache = mock_date_cache.call_args.args[2]
+        self.assertTrue(date_cache["daily_time"])
+        self.assertEqual(date_cache["total_currencies"], 4)
+        values, delete_keys = redis_mock_write_through.call_args.args
+        self.assertEqual(sorted(values), ["BRL", "BTC", "EUR", "USD"])
+        self.assertEqual(delete_keys, ["all_currencys", "response:all_currencys"])
+        self.assertEqual(
+            redis_mock_write_through.call_args.kwargs,
+            {"generation_key": CURRENCY_GENERATION},
+        )
+        # As cotações novas vão para a tabela local e para os outros workers.
+        self.assertEqual(rate_table.get("BTC"), 60000)
+        channel, message = redis_mock_publish.call_args.args
+        self.assertEqual(channel, CURRENCY_INVALIDATION_CHANNEL)
+        self.assertEqual(message["rates"]["EUR"], 1.1)
+
+    @patch.object(AsyncRedisRepository, "publish")
+    @patch.object(AsyncRedisRepository, "write_through")
+    @patch.object(AsyncMongoRepository, "update_or_create_date_cache")
+    @patch.object(AsyncMongoRepository, "bulk_update_or_create_by_acronym")
+    @patch.object(AsyncAwesomeApiService, "get_last_quotations")
+    @patch.object(AsyncAwesomeApiService, "get_available_pairs")
+    async def test_refresh_skips_failed_chunks(
+        self,
+        mock_available_pairs: Mock,
+        mock_last_quotations: Mock,
+        mock_bulk: Mock,
+        *_,
+    ):
+        mock_available_pairs.return_value = {"BRL-USD": "", "EUR-USD": ""}
+        mock_last_quotations.side_effect = ApiInvalidResponseException
+        service = CurrencyConverterService()
+
+        self.assertEqual(await service.refresh_currencies_from_api(), 1)
+        self.assertEqual(mock_bulk.call_args.args[2][0]["acronym"], "USD")
+
+
+class CurrencyRefreshLeaderTestCase(DefaultAsyncTestCase):
+
+    @patch.object(CurrencyConverterService, "refresh_currencies_from_api")
+    @patch.object(AsyncRedisRepository, "lock")
+    async def test_only_the_lock_owner_refreshes(
+        self, redis_mock_lock: Mock, mock_refresh: Mock
+    ):
+        redis_mock_lock.return_value = AsyncMock()
+        redis_mock_lock.return_value.acquire.return_value = True
+        mock_refresh.return_value = 10
+
+        self.assertTrue(await refresh_currencies_as_leader())
+        redis_mock_lock.assert_called_once_with(
+            CURRENCY_REFRESH_LOCK,
+            timeout=settings.CURRENCY_REFRESH_INTERVAL,
+            blocking_timeout=0,
+        )
+        # O lock expira sozinho, segurando os outros workers no intervalo.
+        redis_mock_lock.return_value.release.assert_not_called()
+
+        redis_mock_lock.return_value.acquire.return_value = False
+        self.assertFalse(await refresh_currencies_as_leader())
+        mock_refresh.assert_called_once()
+
+    @patch.object(CurrencyConverterService, "refresh_currencies_from_api")
+    @patch.object(AsyncRedisRepository, "lock")
+    async def test_refresh_error_is_logged(
+        self, redis_mock_lock: Mock, mock_refresh: Mock
+    ):
+        redis_mock_lock.return_value = AsyncMock()
+        redis_mock_lock.return_value.acquire.return_value = True
+        mock_refresh.side_effect = ApiInvalidResponseException
+
+        self.assertFalse(await refresh_currencies_as_leader())
+        # Sem esperar o intervalo, outro worker já pode tentar de novo.
+        redis_mock_lock.return_value.release.assert_called_once()
+
+        redis_mock_lock.return_value.release.side_effect = LockError
+        self.assertFalse(await refresh_currencies_as_leader())
+
+        redis_mock_lock.return_value.acquire.side_effect = ConnectionError
+        self.assertFalse(await refresh_currencies_as_leader())
+        self.assertEqual(mock_refresh.call_count, 2)
+
+    @patch("app.api.v1.currency_converter.tasks.refresh_currencies_as_leader")
+    async def test_refresh_currencies_periodically(self, mock_refresh: Mock):
+        mock_refresh.side_effect = [True, asyncio.CancelledError]
+
+        with self.assertRaises(asyncio.CancelledError):
+            await refresh_currencies_periodically(0, 0)
+        self.assertEqual(mock_refresh.call_count, 2)
+
+
+class CurrencyServiceStaleWhileRevalidateTestCase(DefaultAsyncTestCase):
+
+    def setUp(self) -> None:
+        rate_table.clear()
+        return super().setUp()
+
+    def _load_rates_with_age(self, rates: dict, age: float):
+        with patch("app.api.v1.currency_converter.rate_table.time") as mock_time:
+            mock_time.return_value = time() - age
+            rate_table.load(rates)
+
+    @patch.object(
+        AsyncRedisRepository, "get_generation", new=AsyncMock(return_value="0")
+    )
+    @patch.object(AsyncRedisRepository, "set_many_if_generation")
+    @patch.object(AsyncMongoRepository, "get_by_acronym")
+    async def test_stale_rate_is_served_and_revalidated(
+        self, mock_get_by_acronym: Mock, redis_mock_set: Mock
+    ):
+        self._load_rates_with_age({"USD": 1, "BRL": 0.2}, settings.RATE_SOFT_TTL + 5)
+        mock_get_by_acronym.side_effect = lambda *args: {
+            "acronym": args[2],
+            "dolar_price_reference": 0.25 if args[2] == "BRL" else 1,
+        }
+        service = CurrencyConverterService()
+
+        # Responde na hora com a cotação antiga.
+        self.assertEqual(await service.currency_exchange("BRL", "USD", 10), "2.000000")
+        self.assertGreaterEqual(service.rate_age, settings.RATE_SOFT_TTL)
+        mock_get_by_acronym.assert_not_called()
+
+        await asyncio.gather(*currency_single_flight._tasks)
+        self.assertEqual(mock_get_by_acronym.call_count, 2)
+        self.assertEqual(rate_table.get("BRL"), 0.25)
+        self.assertLess(rate_table.age("BRL"), settings.RATE_SOFT_TTL)
+
+    @patch.object(
+        AsyncRedisRepository, "get_generation", new=AsyncMock(return_value="0")
+    )
+    @patch.object(AsyncRedisRepository, "set_many_if_generation")
+    @patch.object(AsyncRedisRepository, "get_many")
+    @patch.object(AsyncMongoRepository, "get_by_acronym")
+    async def test_rate_older_than_hard_ttl_is_loaded_in_the_request(
+        self, mock_get_by_acronym: Mock, redis_mock_get: Mock, redis_mock_set: Mock
+    ):
+        self._load_rates_with_age({"BRL": 0.2}, settings.RATE_HARD_TTL + 5)
+        redis_mock_get.return_value = [None]
+        mock_get_by_acronym.return_value = {
+            "acronym": "BRL",
+            "dolar_price_reference": 0.25,
+        }
+        service = CurrencyConverterService()
+
+        self.assertEqual(await service.currency_exchange("BRL", "BRL", 10), "10.000000")
+        mock_get_by_acronym.assert_called_once()
+        self.assertEqual(service.rate_age, 0)
+        self.assertEqual(rate_table.get("BRL"), 0.25)
+
+    @patch.object(AsyncMongoRepository, "get_by_acronym")
+    async def test_revalidation_error_keeps_the_stale_rate(
+        self, mock_get_by_acronym: Mock
+    ):
+        self._load_rates_with_age({"BRL": 0.2}, settings.RATE_SOFT_TTL + 5)
+        mock_get_by_acronym.side_effect = MongoRepositoryTransactionsException
+        service = CurrencyConverterService()
+
+        self.assertEqual(await service.currency_exchange("BRL", "BRL", 10), "10.000000")
+        await asyncio.gather(*currency_single_flight._tasks, return_exceptions=True)
+        self.assertEqual(rate_table.get("BRL"), 0.2)
+
+
+class CurrencyServiceLastKnownGoodTestCase(DefaultAsyncTestCase):
+
+    def setUp(self) -> None:
+        rate_table.clear()
+        return super().setUp()
+
+    @patch.object(
+        AsyncRedisRepository, "get_generation", new=AsyncMock(return_value="0")
+    )
+    @patch.object(AsyncAwesomeApiService, "get_currency_values")
+    @patch.object(AsyncRedisRepository, "get_many")
+    @patch.object(AsyncMongoRepository, "get_by_acronym")
+    async def test_falls_back_to_last_known_rates(
+        self, mock_get_by_acronym: Mock, redis_mock_get: Mock, mock_api: Mock
+    ):
+        redis_mock_get.side_effect = lambda keys: [None] * len(keys)
+        with patch("app.api.v1.currency_converter.rate_table.time") as mock_time:
+            mock_time.return_value = time() - settings.RATE_HARD_TTL - 10
+            rate_table.load({"USD": 1, "BRL": 0.2})
+        mock_get_by_acronym.side_effect = MongoRepositoryTransactionsException
+        mock_api.side_effect = ServiceUnavailableException
+        service = CurrencyConverterService()
+
+        self.assertEqual(await service.currency_exchange("BRL", "USD", 10), "2.000000")
+        self.assertGreater(service.rate_age, settings.RATE_HARD_TTL)
+
+        # Sem cotação conhecida o erro da api é repassado.
+        with self.assertRaises(ServiceUnavailableException):
+            await service.currency_exchange("EUR", "USD", 10)
+
+    @patch.object(AsyncMongoRepository, "_get_database")
+    async def test_open_mongo_breaker_fails_fast(self, bd_mock: Mock):
+        mongo_circuit_breaker._open()
+
+        # O 503 do circuito aberto não vira o 500 de erro do banco.
+        with self.assertRaises(CircuitOpenException) as context_error:
+            await AsyncMongoRepository().get_by_acronym("db", "collection", "BRL")
+        self.assertEqual(context_error.exception.status_code, 503)
+        bd_mock.return_value.__getitem__.return_value.find_one.assert_not_called()
+
+    @patch.object(
+        AsyncRedisRepository, "get_generation", new=AsyncMock(return_value="0")
+    )
+    @patch.object(AsyncAwesomeApiService, "get_currency_values")
+    @patch.object(AsyncRedisRepository, "get_many")
+    async def test_open_mongo_breaker_falls_back_to_the_api(
+        self, redis_mock_get: Mock, mock_api: Mock
+    ):
+        mongo_circuit_breaker._open()
+        redis_mock_get.return_value = [None, None]
+        mock_api.return_value = {"USDBRL": {"bid": "5"}}
+        service = CurrencyConverterService()
+
+        self.assertEqual(await service.currency_exchange("USD", "BRL", 10), "50.00")
@@ -1,5 +1,6 @@
 import json
 from unittest.mock import (
+    AsyncMock,
     Mock,
     patch,
 )
@@ -13,81 +14,114 @@ from app.api.v1.currency_converter.exceptions import (
     GenericApiException,
     ValidateAcronymException,
 )
-from app.api.v1.currency_converter.models import Currency
+from app.api.v1.currency_converter.indexes import RATE_PROJECTION
+from app.api.v1.currency_converter.models import (
+    Currency,
+    CurrencyExchangeBatchRequest,
+)
+from app.api.v1.currency_converter.rate_table import rate_table
+from app.api.v1.currency_converter.response_cache import (
+    build_etag,
+    response_cache,
+)
+from app.api.v1.currency_converter.service import CURRENCY_GENERATION
 from app.api.v1.currency_converter.views import (
     create_currency,
     currency_exchange,
+    currency_exchange_batch,
     delete_currency_by_acronym,
     get_all_currency,
     get_currency,
 )
 from app.exceptions.default_exceptions import (
     ApiInvalidResponseException,
+    CircuitOpenException,
     MongoRepositoryTransactionsException,
 )
-from tests.unit import DefaultTestCase
+from app.repositories.mongo_repository import mongo_circuit_breaker
+from tests.unit import DefaultAsyncTestCase
 
 default_date_format = "%d/%m/%Y"
 
 
-class CurrencyViewsTestCase(DefaultTestCase):
+class CurrencyViewsTestCase(DefaultAsyncTestCase):
 
     def setUp(self) -> None:
+        rate_table.clear()
+        response_cache.clear()
         return super().setUp()
 
-    @patch("app.repositories.redis_repository.RedisRepository.create")
-    @patch("app.repositories.redis_repository.RedisRepository.get")
-    @patch("app.repositories.mongo_repository.MongoRepository.get_by_acronym")
-    def test_get_currency(
+    @patch(
+        "app.repositories.redis_repository.AsyncRedisRepository.get_generation",
+        new=AsyncMock(return_value="0"),
+    )
+    @patch(
+        "app.repositories.redis_repository.AsyncRedisRepository.set_many_if_generation"
+    )
+    @patch("app.repositories.redis_repository.AsyncRedisRepository.get_many")
+    @patch("app.repositories.mongo_repository.AsyncMongoRepository.get_by_acronym")
+    async def test_get_currency(
         self, mock_get_by_acronym: Mock, redis_mock_get: Mock, redis_mock_create: Mock
     ):
 
-        redis_mock_get.return_value = False
+        redis_mock_get.return_value = [None, None]
         redis_mock_create.return_value = False
         return_mock = Currency(
             acronym="TEST", name="TESTE-NAME", dolar_price_reference=10
         )
         mock_get_by_acronym.return_value = return_mock.model_dump()
 
-        response: JSONResponse = currency_exchange(from_="USD", to="BRL", amount=200)
+        response: JSONResponse = await currency_exchange(
+            from_="USD", to="BRL", amount=200
+        )
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(json.loads(response.body), {"converted_value": "200.000000"})
 
-    @patch("app.repositories.redis_repository.RedisRepository.get")
-    @patch("app.repositories.mongo_repository.MongoRepository.get_by_acronym")
-    @patch("app.services.awesomeapi.AwesomeApiService._execute")
-    def test_get_currency_passing_in_the_api(
+    @patch(
+        "app.repositories.redis_repository.AsyncRedisRepository.get_generation",
+        new=AsyncMock(return_value="0"),
+    )
+    @patch("app.repositories.redis_repository.AsyncRedisRepository.get_many")
+    @patch("app.repositories.mongo_repository.AsyncMongoRepository.get_by_acronym")
+    @patch("app.services.awesomeapi.AsyncAwesomeApiService._execute")
+    async def test_get_currency_passing_in_the_api(
         self, mock_currency_api: Mock, mock_get_by_acronym: Mock, redis_mock: Mock
     ):
-        redis_mock.return_value = False
+        redis_mock.return_value = [None, None]
         mock_get_by_acronym.side_effect = MongoRepositoryTransactionsException
         mock_currency_api.return_value = Response(
             status.HTTP_200_OK, content='{"USDBRL": {"bid": 1}}'
         )
-        response: JSONResponse = currency_exchange(from_="USD", to="BRL", amount=200)
+        response: JSONResponse = await currency_exchange(
+            from_="USD", to="BRL", amount=200
+        )
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(json.loads(response.body), {"converted_value": "200.00"})
 
-    @patch("app.repositories.redis_repository.RedisRepository.get")
-    @patch("app.repositories.mongo_repository.MongoRepository.get_by_acronym")
-    @patch("app.services.awesomeapi.AwesomeApiService._execute")
-    def test_get_currency_passing_in_the_api_and_return_it_invalid_response(
+    @patch(
+        "app.repositories.redis_repository.AsyncRedisRepository.get_generation",
+        new=AsyncMock(return_value="0"),
+    )
+    @patch("app.repositories.redis_repository.AsyncRedisRepository.get_many")
+    @patch("app.repositories.mongo_repository.AsyncMongoRepository.get_by_acronym")
+    @patch("app.services.awesomeapi.AsyncAwesomeApiService._execute")
+    async def test_get_currency_passing_in_the_api_and_return_it_invalid_response(
         self, mock_currency_api: Mock, mock_get_by_acronym: Mock, redis_mock: Mock
     ):
-        redis_mock.return_value = False
+        redis_mock.return_value = [None, None]
         mock_get_by_acronym.side_effect = MongoRepositoryTransactionsException
         mock_currency_api.return_value = Response(
             status.HTTP_400_BAD_REQUEST, content='{"error": "bad-request"}'
         )
         with self.assertRaises(ApiInvalidResponseException) as context_error:
-            currency_exchange(from_="USD", to="BRL", amount=200)
+            await currency_exchange(from_="USD", to="BRL", amount=200)
         self.assertEqual(context_error.exception.status_code, status.HTTP_403_FORBIDDEN)
         self.assertEqual(
             context_error.exception.detail, {"error": "Invalid values for the api"}
         )
 
-    @patch("app.repositories.mongo_repository.MongoRepository.get_by_acronym")
-    def test_get_currency_raise_generic_error(self, mock_get_by_acronym: Mock):
+    @patch("app.repositories.mongo_repository.AsyncMongoRepository.get_by_acronym")
+    async def test_get_currency_raise_generic_error(self, mock_get_by_acronym: Mock):
 
         return_value = Currency(
             acronym="TEST", name="TESTE-NAME", dolar_price_reference=10
@@ -95,7 +129,7 @@ class CurrencyViewsTestCase(DefaultTestCase):
         mock_get_by_acronym.side_effect = return_value
 
         with self.assertRaises(GenericApiException) as context_error:
-            currency_exchange(from_="USD", to="BRL", amount=200)
+            await currency_exchange(from_="USD", to="BRL", amount=200)
         self.assertEqual(
             context_error.exception.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR
         )
@@ -103,35 +137,46 @@ class CurrencyViewsTestCase(DefaultTestCase):
             context_error.exception.detail, {"error": "Some error ocurred!"}
         )
 
-    @patch("app.repositories.mongo_repository.MongoRepository.get_by_acronym")
-    def test_get_one_currency(self, mock_get_by_acronym: Mock):
+    @patch("app.repositories.mongo_repository.AsyncMongoRepository.get_by_acronym")
+    async def test_get_one_currency(self, mock_get_by_acronym: Mock):
 
         return_value = Currency(
             acronym="TEST", name="TESTE-NAME", dolar_price_reference=10
         ).model_dump()
         mock_get_by_acronym.return_value = return_value
 
-        response: JSONResponse = get_currency(acronym="USD")
+        response: JSONResponse = await get_currency(acronym="USD")
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(json.loads(response.body), return_value)
 
-    @patch("app.repositories.mongo_repository.MongoRepository.get_by_acronym")
-    def test_get_currency_not_found_value(self, mock_get_by_acronym: Mock):
+    @patch("app.repositories.mongo_repository.AsyncMongoRepository.get_by_acronym")
+    async def test_get_currency_not_found_value(self, mock_get_by_acronym: Mock):
 
         mock_get_by_acronym.return_value = None
-        response: JSONResponse = get_currency(acronym="USD")
+        response: JSONResponse = await get_currency(acronym="USD")
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
         self.assertEqual(json.loads(response.body), {})
 
-    @patch("app.repositories.mongo_repository.MongoRepository.get_by_acronym")
-    def test_get_currency_repository_raises_unexpected_error(
+    @patch("app.repositories.mongo_repository.AsyncMongoRepository._get_database")
+    async def test_get_currency_with_open_mongo_breaker(self, bd_mock: Mock):
+        mongo_circuit_breaker._open()
+
+        with self.assertRaises(CircuitOpenException) as context_error:
+            await get_currency(acronym="USD")
+        self.assertEqual(
+            context_error.exception.status_code, status.HTTP_503_SERVICE_UNAVAILABLE
+        )
+        bd_mock.return_value.__getitem__.return_value.find_one.assert_not_called()
+
+    @patch("app.repositories.mongo_repository.AsyncMongoRepository.get_by_acronym")
+    async def test_get_currency_repository_raises_unexpected_error(
         self, mock_get_by_acronym: Mock
     ):
 
         mock_get_by_acronym.side_effect = Exception("test error")
 
         with self.assertRaises(GenericApiException) as context_error:
-            get_currency(acronym="USD")
+            await get_currency(acronym="USD")
         self.assertEqual(
             context_error.exception.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR
         )
@@ -139,30 +184,139 @@ class CurrencyViewsTestCase(DefaultTestCase):
             context_error.exception.detail, {"error": "Some error ocurred!"}
         )
 
-    @patch("app.repositories.redis_repository.RedisRepository.get")
-    @patch("app.repositories.mongo_repository.MongoRepository.get_all_currency")
-    def test_get_all_currency(self, redis_mock: Mock, mock_get_by_acronym: Mock):
+    @patch(
+        "app.repositories.redis_repository.AsyncRedisRepository.get_generation",
+        new=AsyncMock(return_value="0"),
+    )
+    @patch(
+        "app.repositories.redis_repository.AsyncRedisRepository."
+        "set_bytes_if_generation"
+    )
+    @patch("app.repositories.redis_repository.AsyncRedisRepository.get_bytes")
+    @patch("app.repositories.redis_repository.AsyncRedisRepository.get")
+    @patch("app.repositories.mongo_repository.AsyncMongoRepository.get_all_currency")
+    async def test_get_all_currency(
+        self,
+        mock_get_all_currency: Mock,
+        redis_mock: Mock,
+        redis_mock_get_bytes: Mock,
+        redis_mock_set_bytes: Mock,
+    ):
 
-        redis_mock.return_value = False
+        redis_mock_get_bytes.return_value = None
         return_value = Currency(
             acronym="TEST", name="TESTE-NAME", dolar_price_reference=10
         ).model_dump()
         return_value = [return_value]
-        mock_get_by_acronym.return_value = return_value
+        redis_mock.return_value = return_value
 
-        response: JSONResponse = get_all_currency()
+        response = await get_all_currency()
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(json.loads(response.body), return_value)
+        self.assertEqual(response.headers["etag"], build_etag(response.body))
+        redis_mock_set_bytes.assert_called_once_with(
+            {"response:all_currencys": response.body}, CURRENCY_GENERATION, "0"
+        )
+        mock_get_all_currency.assert_not_called()
+
+        # A segunda chamada usa o body guardado no processo.
+        second_response = await get_all_currency()
+        self.assertEqual(second_response.body, response.body)
+        redis_mock_get_bytes.assert_called_once()
 
-    @patch("app.repositories.mongo_repository.MongoRepository.get_all_currency")
-    def test_get_all_currency_and_repository_raises_unexpected_error(
+    @patch(
+        "app.repositories.redis_repository.AsyncRedisRepository.get_generation",
+        new=AsyncMock(return_value="0"),
+    )
+    @patch(
+        "app.repositories.redis_repository.AsyncRedisRepository."
+        "set_many_if_generation",
+        new=AsyncMock(return_value=False),
+    )
+    @patch(
+        "app.repositories.redis_repository.AsyncRedisRepository."
+        "set_bytes_if_generation",
+        new=AsyncMock(return_value=False),
+    )
+    @patch(
+        "app.repositories.redis_repository.AsyncRedisRepository.get_bytes",
+        new=AsyncMock(return_value=None),
+    )
+    @patch(
+        "app.repositories.redis_repository.AsyncRedisRepository.get",
+        new=AsyncMock(return_value=None),
+    )
+    @patch("app.repositories.mongo_repository.AsyncMongoRepository.get_all_currency")
+    async def test_get_all_currency_body_is_not_cached_after_concurrent_write(
+        self, mock_get_all_currency: Mock
+    ):
+        # A geração mudou durante a leitura do banco, nada fica em cache.
+        mock_get_all_currency.return_value = []
+
+        response = await get_all_currency()
+        self.assertEqual(response.body, b"[]")
+        self.assertIsNone(response_cache.get("response:all_currencys"))
+
+        await get_all_currency()
+        self.assertEqual(mock_get_all_currency.call_count, 2)
+
+    @patch("app.repositories.redis_repository.AsyncRedisRepository.get_bytes")
+    async def test_get_all_currency_from_redis_body_and_not_modified(
+        self, redis_mock_get_bytes: Mock
+    ):
+        body = b'[{"acronym":"USD"}]'
+        redis_mock_get_bytes.return_value = body
+
+        response = await get_all_currency()
+        self.assertEqual(response.body, body)
+        etag = response.headers["etag"]
+
+        not_modified = await get_all_currency(if_none_match=etag)
+        self.assertEqual(not_modified.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(not_modified.body, b"")
+        self.assertEqual(not_modified.headers["etag"], etag)
+
+        other_etag = await get_all_currency(if_none_match='"other"')
+        self.assertEqual(other_etag.status_code, status.HTTP_200_OK)
+
+    @patch("app.repositories.redis_repository.AsyncRedisRepository.publish")
+    @patch("app.repositories.redis_repository.AsyncRedisRepository.write_through")
+    @patch("app.repositories.redis_repository.AsyncRedisRepository.get_bytes")
+    @patch("app.repositories.mongo_repository.AsyncMongoRepository.create")
+    async def test_create_currency_invalidates_currency_list(
+        self,
+        mock_repository_create: Mock,
+        redis_mock_get_bytes: Mock,
+        redis_mock_write_through: Mock,
+        redis_mock_publish: Mock,
+    ):
+        redis_mock_get_bytes.side_effect = [b"[]", b'[{"acronym":"TEST"}]']
+        first_response = await get_all_currency()
+
+        payload = Currency(acronym="TEST", name="TESTE-NAME", dolar_price_reference=10)
+        await create_currency(payload.acronym, payload)
+        redis_mock_write_through.assert_called_once_with(
+            {"TEST": payload.model_dump()},
+            ["all_currencys", "response:all_currencys"],
+            generation_key=CURRENCY_GENERATION,
+        )
+        redis_mock_publish.assert_called_once()
+
+        second_response = await get_all_currency()
+        self.assertEqual(second_response.body, b'[{"acronym":"TEST"}]')
+        self.assertNotEqual(
+            first_response.headers["etag"], second_response.headers["etag"]
+        )
+
+    @patch("app.repositories.mongo_repository.AsyncMongoRepository.get_all_currency")
+    async def test_get_all_currency_and_repository_raises_unexpected_error(
         self, mock_get_by_acronym: Mock
     ):
 
         mock_get_by_acronym.side_effect = Exception("test error")
 
         with self.assertRaises(GenericApiException) as context_error:
-            get_all_currency()
+            await get_all_currency()
         self.assertEqual(
             context_error.exception.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR
         )
@@ -170,18 +324,72 @@ class CurrencyViewsTestCase(DefaultTestCase):
             context_error.exception.detail, {"error": "Some error ocurred!"}
         )
 
-    @patch("app.repositories.mongo_repository.MongoRepository.create")
-    def test_create_currency(self, mock_repository_create: Mock):
+    @patch("app.repositories.mongo_repository.AsyncMongoRepository.get_page_by_acronym")
+    async def test_get_all_currency_page(self, mock_get_page: Mock):
+        currencies = [
+            Currency(
+                acronym=acronym, name=acronym, dolar_price_reference=1
+            ).model_dump()
+            for acronym in ("CAD", "EUR")
+        ]
+        mock_get_page.return_value = currencies
+
+        response: JSONResponse = await get_all_currency(after="brl", limit=2)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            json.loads(response.body), {"currencies": currencies, "next": "EUR"}
+        )
+        mock_get_page.assert_called_once_with(
+            "currency_db", "currencys", "BRL", 2, {"_id": 0}
+        )
+
+        mock_get_page.return_value = currencies[:1]
+        response = await get_all_currency(after="EUR")
+        self.assertEqual(json.loads(response.body)["next"], None)
+        self.assertEqual(mock_get_page.call_args.args[3], 100)
+
+    @patch("app.repositories.mongo_repository.AsyncMongoRepository.iter_by_acronym")
+    async def test_get_all_currency_stream(self, mock_iter_by_acronym: Mock):
+        currencies = [
+            Currency(
+                acronym=acronym, name=acronym, dolar_price_reference=1
+            ).model_dump()
+            for acronym in ("BRL", "CAD", "EUR")
+        ]
+
+        async def batches(*_):
+            yield currencies[:2]
+            yield currencies[2:]
+
+        mock_iter_by_acronym.side_effect = batches
+
+        response = await get_all_currency(stream=True)
+        self.assertEqual(response.media_type, "application/x-ndjson")
+        chunks = [chunk async for chunk in response.body_iterator]
+        self.assertEqual(len(chunks), 2)
+        self.assertEqual(
+            [json.loads(line) for line in b"".join(chunks).splitlines()], currencies
+        )
+
+    @patch("app.repositories.mongo_repository.AsyncMongoRepository._get_database")
+    async def test_get_all_currency_stream_raises_before_sending(self, bd_mock: Mock):
+        bd_mock.side_effect = Exception("test error")
+
+        with self.assertRaises(GenericApiException):
+            await get_all_currency(stream=True)
+
+    @patch("app.repositories.mongo_repository.AsyncMongoRepository.create")
+    async def test_create_currency(self, mock_repository_create: Mock):
 
         payload = Currency(acronym="TEST", name="TESTE-NAME", dolar_price_reference=10)
         mock_repository_create.return_value = None
 
-        response: JSONResponse = create_currency(payload.acronym, payload)
+        response: JSONResponse = await create_currency(payload.acronym, payload)
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         self.assertEqual(json.loads(response.body), {"id": payload.id})
 
-    @patch("app.repositories.mongo_repository.MongoRepository.create")
-    def test_create_currency_repository_raises_unexpected_error(
+    @patch("app.repositories.mongo_repository.AsyncMongoRepository.create")
+    async def test_create_currency_repository_raises_unexpected_error(
         self, mock_repository_create: Mock
     ):
 
@@ -189,7 +397,7 @@ class CurrencyViewsTestCase(DefaultTestCase):
         payload = Currency(acronym="TEST", name="TESTE-NAME", dolar_price_reference=10)
 
         with self.assertRaises(CurrencyServiceException) as context_error:
-            create_currency(payload.acronym, payload)
+            await create_currency(payload.acronym, payload)
         self.assertEqual(
             context_error.exception.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR
         )
@@ -197,12 +405,14 @@ class CurrencyViewsTestCase(DefaultTestCase):
             context_error.exception.detail, {"error": "Error to create currency"}
         )
 
-    @patch("app.repositories.mongo_repository.MongoRepository.create")
-    def test_create_model_raises_validate_error(self, mock_repository_create: Mock):
+    @patch("app.repositories.mongo_repository.AsyncMongoRepository.create")
+    async def test_create_model_raises_validate_error(
+        self, mock_repository_create: Mock
+    ):
 
         mock_repository_create.side_effect = Exception("test error")
         with self.assertRaises(ValidateAcronymException) as context_error:
-            create_currency(
+            await create_currency(
                 Currency(
                     acronym="TEST-ACRONYNM", name="TESTE-NAME", dolar_price_reference=10
                 )
@@ -217,7 +427,7 @@ class CurrencyViewsTestCase(DefaultTestCase):
     @patch(
         "app.api.v1.currency_converter.service.CurrencyConverterService.create_currency"
     )
-    def test_create_currency_endpoint_raises_unexpected_error(
+    async def test_create_currency_endpoint_raises_unexpected_error(
         self, mock_repository_create: Mock
     ):
 
@@ -225,7 +435,7 @@ class CurrencyViewsTestCase(DefaultTestCase):
         payload = Currency(acronym="TEST", name="TESTE-NAME", dolar_price_reference=10)
 
         with self.assertRaises(GenericApiException) as context_error:
-            create_currency(payload.acronym, payload)
+            await create_currency(payload.acronym, payload)
         self.assertEqual(
             context_error.exception.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR
         )
@@ -236,7 +446,7 @@ class CurrencyViewsTestCase(DefaultTestCase):
     @patch(
         "app.api.v1.currency_converter.service.CurrencyConverterService.delete_currency"
     )
-    def test_delete_currency_endpoint_raises_unexpected_error(
+    async def test_delete_currency_endpoint_raises_unexpected_error(
         self, mock_delete_repository: Mock
     ):
 
@@ -244,7 +454,7 @@ class CurrencyViewsTestCase(DefaultTestCase):
         payload = Currency(acronym="TEST", name="TESTE-NAME", dolar_price_reference=10)
 
         with self.assertRaises(GenericApiException) as context_error:
-            delete_currency_by_acronym(payload.acronym)
+            await delete_currency_by_acronym(payload.acronym)
         self.assertEqual(
             context_error.exception.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR
         )
@@ -252,23 +462,25 @@ class CurrencyViewsTestCase(DefaultTestCase):
             context_error.exception.detail, {"error": "Some error ocurred!"}
         )
 
-    @patch("app.repositories.mongo_repository.MongoRepository.delete_by_acronym")
-    def test_delete_currency_by_acronym(self, mock_repository_delete_by_acronym: Mock):
+    @patch("app.repositories.mongo_repository.AsyncMongoRepository.delete_by_acronym")
+    async def test_delete_currency_by_acronym(
+        self, mock_repository_delete_by_acronym: Mock
+    ):
         mock_repository_delete_by_acronym.return_value = None
 
-        response: JSONResponse = delete_currency_by_acronym(acronym="USD")
+        response: JSONResponse = await delete_currency_by_acronym(acronym="USD")
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(json.loads(response.body), {"acronym": "USD"})
 
-    @patch("app.repositories.mongo_repository.MongoRepository.delete_by_acronym")
-    def test_delete_currency_by_acronym_and_repository_raises_unexpected_error(
+    @patch("app.repositories.mongo_repository.AsyncMongoRepository.delete_by_acronym")
+    async def test_delete_currency_by_acronym_and_repository_raises_unexpected_error(
         self, mock_repository_delete: Mock
     ):
 
         mock_repository_delete.side_effect = Exception("test error")
 
         with self.assertRaises(CurrencyServiceException) as context_error:
-            delete_currency_by_acronym(acronym="USD")
+            await delete_currency_by_acronym(acronym="USD")
         self.assertEqual(
             context_error.exception.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR
         )
@@ -282,17 +494,132 @@ class CurrencyViewsTestCase(DefaultTestCase):
             "delete_currency"
         )
     )
-    def test_delete_currency_by_acronym_and_flow_raises_unexpected_error(
+    async def test_delete_currency_by_acronym_and_flow_raises_unexpected_error(
         self, mock_delete_currency_by_name: Mock
     ):
 
         mock_delete_currency_by_name.side_effect = Exception("test error")
 
         with self.assertRaises(GenericApiException) as context_error:
-            delete_currency_by_acronym(acronym="USD")
+            await delete_currency_by_acronym(acronym="USD")
         self.assertEqual(
             context_error.exception.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR
         )
         self.assertEqual(
             context_error.exception.detail, {"error": "Some error ocurred!"}
         )
+
+    @patch("app.repositories.mongo_repository.AsyncMongoRepository.get_by_acronyms")
+    async def test_currency_exchange_batch(self, mock_get_by_acronyms: Mock):
+        rate_table.load({"USD": 1, "BRL": 0.19, "EUR": 1.08})
+        conversions = [
+            ("USD", "BRL", 200),
+            ("brl", "eur", 13.37),
+            ("EUR", "USD", 0.5),
+            ("USD", "BRL", 1),
+        ]
+        payload = CurrencyExchangeBatchRequest.model_validate(
+            {
+                "conversions": [
+                    {"from": from_, "to": to, "amount": amount}
+                    for from_, to, amount in conversions
+                ]
+            }
+        )
+
+        response: JSONResponse = await currency_exchange_batch(payload)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+        expected_values = []
+        for from_, to, amount in conversions:
+            single_response = await currency_exchange(from_=from_, to=to, amount=amount)
+            expected_values.append(json.loads(single_response.body)["converted_value"])
+        self.assertEqual(
+            json.loads(response.body), {"converted_values": expected_values}
+        )
+        self.assertEqual(response.headers["age"], "0")
+        self.assertEqual(single_response.headers["age"], "0")
+        mock_get_by_acronyms.assert_not_called()
+
+    @patch(
+        "app.repositories.redis_repository.AsyncRedisRepository.get_generation",
+        new=AsyncMock(return_value="0"),
+    )
+    @patch(
+        "app.repositories.redis_repository.AsyncRedisRepository.set_many_if_generation"
+    )
+    @patch("app.repositories.redis_repository.AsyncRedisRepository.get_many")
+    @patch("app.repositories.mongo_repository.AsyncMongoRepository.get_by_acronyms")
+    async def test_currency_exchange_batch_loads_missing_acronyms_once(
+        self, mock_get_by_acronyms: Mock, redis_mock_get: Mock, redis_mock_set: Mock
+    ):
+        rate_table.load({"USD": 1})
+        eur = Currency(acronym="EUR", name="Euro", dolar_price_reference=1.25)
+        brl = {"acronym": "BRL", "dolar_price_reference": 0.2}
+        redis_mock_get.side_effect = lambda keys: [
+            eur.model_dump() if key == "EUR" else None for key in keys
+        ]
+        mock_get_by_acronyms.return_value = [brl]
+        payload = CurrencyExchangeBatchRequest.model_validate(
+            {
+                "conversions": [
+                    {"from": "BRL", "to": "USD", "amount": 10},
+                    {"from": "USD", "to": "BRL", "amount": 1},
+                    {"from": "EUR", "to": "BRL", "amount": 1},
+                ]
+            }
+        )
+
+        response: JSONResponse = await currency_exchange_batch(payload)
+        self.assertEqual(
+            json.loads(response.body),
+            {"converted_values": ["2.000000", "5.000000", "6.250000"]},
+        )
+        redis_mock_get.assert_called_once()
+        self.assertEqual(sorted(redis_mock_get.call_args.args[0]), ["BRL", "EUR"])
+        mock_get_by_acronyms.assert_called_once_with(
+            "currency_db", "currencys", ["BRL"], RATE_PROJECTION
+        )
+        redis_mock_set.assert_called_once_with({"BRL": brl}, CURRENCY_GENERATION, "0")
+        self.assertEqual(rate_table.get("BRL"), 0.2)
+        self.assertEqual(rate_table.get("EUR"), 1.25)
+
+    @patch(
+        "app.repositories.redis_repository.AsyncRedisRepository.get_generation",
+        new=AsyncMock(return_value="0"),
+    )
+    @patch(
+        "app.repositories.redis_repository.AsyncRedisRepository.set_many_if_generation"
+    )
+    @patch("app.repositories.redis_repository.AsyncRedisRepository.get_many")
+    @patch("app.repositories.mongo_repository.AsyncMongoRepository.get_by_acronyms")
+    async def test_currency_exchange_batch_with_unknown_acronym(
+        self, mock_get_by_acronyms: Mock, redis_mock_get: Mock, redis_mock_set: Mock
+    ):
+        rate_table.load({"USD": 1})
+        redis_mock_get.return_value = [None]
+        mock_get_by_acronyms.return_value = []
+        payload = CurrencyExchangeBatchRequest.model_validate(
+            {"conversions": [{"from": "USD", "to": "XXX", "amount": 10}]}
+        )
+
+        with self.assertRaises(CurrencyServiceException) as context_error:
+            await currency_exchange_batch(payload)
+        self.assertEqual(context_error.exception.status_code, status.HTTP_404_NOT_FOUND)
+        self.assertEqual(
+            context_error.exception.detail,
+            {"error": "Currencies not found", "acronyms": ["XXX"]},
+        )
+
+    @patch(
+        "app.api.v1.currency_converter.service.CurrencyConverterService."
+        "currency_exchange_batch"
+    )
+    async def test_currency_exchange_batch_raises_unexpected_error(
+        self, mock_currency_exchange_batch: Mock
+    ):
+        mock_currency_exchange_batch.side_effect = Exception("test error")
+        payload = CurrencyExchangeBatchRequest(conversions=[])
+
+        with self.assertRaises(GenericApiException):
+            await currency_exchange_batch(payload)
@@ -0,0 +1,146 @@
+import asyncio
+from unittest.mock import (
+    AsyncMock,
+    Mock,
+    patch,
+)
+
+from app.api.v1.currency_converter.invalidation import (
+    CURRENCY_INVALIDATION_CHANNEL,
+    WORKER_ID,
+    apply_invalidation,
+    build_invalidation_message,
+    build_snapshot_message,
+)
+from app.api.v1.currency_converter.models import Currency
+from app.api.v1.currency_converter.rate_table import rate_table
+from app.api.v1.currency_converter.response_cache import (
+    ALL_CURRENCIES_RESPONSE,
+    response_cache,
+)
+from app.api.v1.currency_converter.service import (
+    CURRENCY_GENERATION,
+    CurrencyConverterService,
+)
+from app.api.v1.currency_converter.tasks import listen_currency_invalidations
+from app.repositories.mongo_repository import AsyncMongoRepository
+from app.repositories.redis_repository import AsyncRedisRepository
+from tests.unit import DefaultAsyncTestCase
+
+
+class CurrencyInvalidationTestCase(DefaultAsyncTestCase):
+
+    def setUp(self) -> None:
+        rate_table.load({"USD": 1, "BRL": 0.2})
+        response_cache.set(ALL_CURRENCIES_RESPONSE, b"[]")
+        self.currency = Currency(
+            acronym="BRL", name="Real", dolar_price_reference=0.25
+        ).model_dump()
+        return super().setUp()
+
+    def _message_from_other_worker(self, acronym: str, currency: dict | None):
+        message = build_invalidation_message(acronym, currency)
+        message["origin"] = "other-worker"
+        return message
+
+    async def test_apply_invalidation_from_other_worker(self):
+        self.assertTrue(
+            apply_invalidation(self._message_from_other_worker("BRL", self.currency))
+        )
+        self.assertEqual(rate_table.get("BRL"), 0.25)
+        self.assertIsNone(response_cache.get(ALL_CURRENCIES_RESPONSE))
+
+        self.assertTrue(
+            apply_invalidation(self._message_from_other_worker("BRL", None))
+        )
+        self.assertIsNone(rate_table.get("BRL"))
+
+    async def test_apply_snapshot_from_other_worker(self):
+        message = build_snapshot_message({"BRL": 0.25, "EUR": 1.1})
+        self.assertFalse(apply_invalidation(message))
+
+        message["origin"] = "other-worker"
+        self.assertTrue(apply_invalidation(message))
+        self.assertEqual(rate_table.snapshot(), {"USD": 1, "BRL": 0.25, "EUR": 1.1})
+        self.assertIsNone(response_cache.get(ALL_CURRENCIES_RESPONSE))
+
+    async def test_apply_invalidation_ignores_own_messages(self):
+        message = build_invalidation_message("BRL", self.currency)
+        self.assertEqual(message["origin"], WORKER_ID)
+        self.assertFalse(apply_invalidation(message))
+        self.assertFalse(apply_invalidation(None))
+        self.assertEqual(rate_table.get("BRL"), 0.2)
+        self.assertIsNotNone(response_cache.get(ALL_CURRENCIES_RESPONSE))
+
+    @patch.object(AsyncRedisRepository, "publish")
+    @patch.object(AsyncRedisRepository, "write_through")
+    @patch.object(AsyncMongoRepository, "update_or_create_by_acronym", new=AsyncMock())
+    async def test_update_currency_writes_through_and_publishes(
+        self,
+        redis_mock_write_through: Mock,
+        redis_mock_publish: Mock,
+    ):
+        service = CurrencyConverterService()
+        await service.update_currency(Currency.model_validate(self.currency))
+
+        redis_mock_write_through.assert_called_once_with(
+            {"BRL": self.currency},
+            ["all_currencys", ALL_CURRENCIES_RESPONSE],
+            generation_key=CURRENCY_GENERATION,
+        )
+        redis_mock_publish.assert_called_once_with(
+            CURRENCY_INVALIDATION_CHANNEL,
+            build_invalidation_message("BRL", self.currency),
+        )
+        self.assertEqual(rate_table.get("BRL"), 0.25)
+        self.assertIsNone(response_cache.get(ALL_CURRENCIES_RESPONSE))
+
+    @patch.object(AsyncRedisRepository, "publish")
+    @patch.object(AsyncRedisRepository, "write_through")
+    @patch.object(AsyncMongoRepository, "delete_by_acronym", new=AsyncMock())
+    async def test_delete_currency_evicts_the_acronym_key(
+        self,
+        redis_mock_write_through: Mock,
+        redis_mock_publish: Mock,
+    ):
+        service = CurrencyConverterService()
+        await service.delete_currency("brl")
+
+        redis_mock_write_through.assert_called_once_with(
+            {},
+            ["all_currencys", ALL_CURRENCIES_RESPONSE, "BRL"],
+            generation_key=CURRENCY_GENERATION,
+        )
+        self.assertTrue(redis_mock_publish.call_args.args[1]["deleted"])
+
+    @patch.object(AsyncRedisRepository, "write_through")
+    @patch.object(AsyncMongoRepository, "update_or_create_by_acronym", new=AsyncMock())
+    async def test_cache_error_does_not_fail_the_mutation(
+        self, redis_mock_write_through: Mock
+    ):
+        redis_mock_write_through.side_effect = Exception("redis error")
+        service = CurrencyConverterService()
+
+        self.assertTrue(
+            await service.update_currency(Currency.model_validate(self.currency))
+        )
+
+    @patch("app.api.v1.currency_converter.tasks.asyncio.sleep")
+    @patch.object(AsyncRedisRepository, "subscribe")
+    async def test_listen_currency_invalidations(
+        self, redis_mock_subscribe: Mock, mock_sleep: Mock
+    ):
+        messages = [self._message_from_other_worker("BRL", self.currency)]
+
+        async def subscribe(channel: str):
+            self.assertEqual(channel, CURRENCY_INVALIDATION_CHANNEL)
+            for message in messages:
+                yield message
+            raise ConnectionError("redis closed")
+
+        redis_mock_subscribe.side_effect = subscribe
+        mock_sleep.side_effect = asyncio.CancelledError
+
+        with self.assertRaises(asyncio.CancelledError):
+            await listen_currency_invalidations()
+        self.assertEqual(rate_table.get("BRL"), 0.25)
@@ -0,0 +1,119 @@
+import json
+from unittest.mock import (
+    Mock,
+    patch,
+)
+
+import numpy as np
+from fastapi import status
+from fastapi.responses import JSONResponse
+
+from app.api.v1.currency_converter.exceptions import GenericApiException
+from app.api.v1.currency_converter.matrix import ConversionMatrix
+from app.api.v1.currency_converter.models import Currency
+from app.api.v1.currency_converter.rate_table import rate_table
+from app.api.v1.currency_converter.utils import amount_from_bd_response
+from app.api.v1.currency_converter.views import get_currency_matrix
+from tests.unit import (
+    DefaultAsyncTestCase,
+    DefaultTestCase,
+)
+
+
+class ConversionMatrixTestCase(DefaultTestCase):
+
+    def setUp(self) -> None:
+        self.rates = {"USD": 1.0, "BRL": 0.19, "EUR": 1.08, "BTC": 67000.0}
+        self.conversion_matrix = ConversionMatrix()
+        self.conversion_matrix.rebuild(self.rates)
+        return super().setUp()
+
+    def _assert_same_as_rebuild(self, rates: dict) -> None:
+        expected = ConversionMatrix()
+        expected.rebuild(rates)
+        self.assertEqual(sorted(self.conversion_matrix.acronyms), expected.acronyms)
+        for from_ in rates:
+            for to in rates:
+                self.assertEqual(
+                    self.conversion_matrix.get(from_, to), expected.get(from_, to)
+                )
+
+    def test_matrix_matches_amount_from_bd_response(self):
+        for from_, from_value in self.rates.items():
+            for to, to_value in self.rates.items():
+                self.assertEqual(
+                    f"{self.conversion_matrix.get(from_, to) * 1:.6f}",
+                    amount_from_bd_response(from_value, to_value, 1),
+                )
+        self.assertIsNone(self.conversion_matrix.get("USD", "XXX"))
+
+    def test_set_rate_updates_row_and_column(self):
+        self.conversion_matrix.set_rate("BRL", 0.2)
+        self.rates["BRL"] = 0.2
+        self._assert_same_as_rebuild(self.rates)
+
+    def test_set_rate_with_new_acronym(self):
+        self.conversion_matrix.set_rate("ETH", 3500.0)
+        self.rates["ETH"] = 3500.0
+        self.assertEqual(self.conversion_matrix.matrix.shape, (5, 5))
+        self._assert_same_as_rebuild(self.rates)
+
+    def test_remove_acronym(self):
+        self.conversion_matrix.remove("EUR")
+        self.conversion_matrix.remove("EUR")
+        self.rates.pop("EUR")
+        self.assertEqual(self.conversion_matrix.matrix.shape, (3, 3))
+        self._assert_same_as_rebuild(self.rates)
+
+    def test_to_dict_replaces_invalid_values(self):
+        self.conversion_matrix.rebuild({"USD": 1.0, "ZERO": 0.0})
+        response = self.conversion_matrix.to_dict()
+
+        self.assertEqual(response["acronyms"], ["USD", "ZERO"])
+        self.assertEqual(response["matrix"], [[1.0, None], [0.0, None]])
+        self.assertFalse(np.isfinite(self.conversion_matrix.matrix).all())
+
+
+class CurrencyMatrixViewTestCase(DefaultAsyncTestCase):
+
+    def setUp(self) -> None:
+        rate_table.clear()
+        return super().setUp()
+
+    @patch("app.repositories.mongo_repository.AsyncMongoRepository.get_all_currency")
+    async def test_get_currency_matrix(self, mock_get_all_currency: Mock):
+        rate_table.load({"USD": 1, "BRL": 0.2})
+        rate_table.set("EUR", 1)
+
+        response: JSONResponse = await get_currency_matrix()
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(
+            json.loads(response.body),
+            {
+                "acronyms": ["BRL", "USD", "EUR"],
+                "matrix": [[1.0, 0.2, 0.2], [5.0, 1.0, 1.0], [5.0, 1.0, 1.0]],
+                "version": rate_table.version,
+            },
+        )
+        mock_get_all_currency.assert_not_called()
+
+    @patch("app.repositories.mongo_repository.AsyncMongoRepository.get_all_currency")
+    async def test_get_currency_matrix_loads_empty_rate_table(
+        self, mock_get_all_currency: Mock
+    ):
+        mock_get_all_currency.return_value = [
+            Currency(acronym="USD", name="Dolar", dolar_price_reference=1).model_dump()
+        ]
+
+        response: JSONResponse = await get_currency_matrix()
+        self.assertEqual(json.loads(response.body)["matrix"], [[1.0]])
+        mock_get_all_currency.assert_called_once()
+
+    @patch("app.repositories.mongo_repository.AsyncMongoRepository.get_all_currency")
+    async def test_get_currency_matrix_raises_unexpected_error(
+        self, mock_get_all_currency: Mock
+    ):
+        mock_get_all_currency.side_effect = Exception("test error")
+
+        with self.assertRaises(GenericApiException):
+            await get_currency_matrix()
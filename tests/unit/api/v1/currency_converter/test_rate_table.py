@@ -0,0 +1,148 @@
+import asyncio
+from unittest.mock import (
+    AsyncMock,
+    Mock,
+    patch,
+)
+
+from app.api.v1.currency_converter.models import Currency
+from app.api.v1.currency_converter.rate_table import (
+    RateTable,
+    rate_table,
+)
+from app.api.v1.currency_converter.service import CurrencyConverterService
+from app.api.v1.currency_converter.tasks import (
+    load_rate_table,
+    refresh_rate_table_periodically,
+)
+from app.exceptions.default_exceptions import MongoRepositoryTransactionsException
+from app.repositories.mongo_repository import AsyncMongoRepository
+from tests.unit import DefaultAsyncTestCase
+
+
+class RateTableTestCase(DefaultAsyncTestCase):
+
+    def setUp(self) -> None:
+        rate_table.clear()
+        self.currencies = [
+            Currency(acronym="USD", name="Dolar", dolar_price_reference=1).model_dump(),
+            Currency(
+                acronym="BRL", name="Real", dolar_price_reference=0.2
+            ).model_dump(),
+            Currency(
+                acronym="XPT", name="None", dolar_price_reference=None
+            ).model_dump(),
+        ]
+        return super().setUp()
+
+    def test_rate_table_update_keeps_other_rates(self):
+        table = RateTable()
+        table.load({"USD": 1, "BRL": 0.2})
+        self.assertEqual(table.update({"BRL": "0.25", "EUR": 1.1}), 2)
+        self.assertEqual(table.snapshot(), {"USD": 1, "BRL": 0.25, "EUR": 1.1})
+        self.assertAlmostEqual(table.matrix.get("EUR", "BRL"), 4.4)
+
+    @patch("app.api.v1.currency_converter.rate_table.time")
+    def test_rate_table_age(self, mock_time: Mock):
+        table = RateTable()
+        mock_time.return_value = 1000.0
+        table.load({"USD": 1})
+        mock_time.return_value = 1030.0
+        table.set("BRL", 0.2)
+        mock_time.return_value = 1045.0
+
+        self.assertEqual(table.age("USD"), 45)
+        self.assertEqual(table.age("BRL"), 15)
+        self.assertIsNone(table.age("EUR"))
+        table.discard("BRL")
+        self.assertIsNone(table.age("BRL"))
+
+    def test_rate_table_versioning(self):
+        table = RateTable()
+        self.assertEqual(table.load({"USD": 1, "BRL": "0.2"}), 1)
+        self.assertEqual(table.get("BRL"), 0.2)
+        self.assertEqual(table.set("EUR", 1.1), 2)
+        self.assertEqual(table.discard("EUR"), 3)
+        self.assertEqual(table.discard("EUR"), 3)
+        self.assertIsNone(table.get("EUR"))
+        self.assertEqual(table.snapshot(), {"USD": 1.0, "BRL": 0.2})
+        table.clear()
+        self.assertEqual(table.snapshot(), {})
+        self.assertEqual(table.version, 4)
+
+    @patch("app.repositories.mongo_repository.AsyncMongoRepository.get_all_currency")
+    async def test_load_rate_table(self, mock_get_all_currency: Mock):
+        mock_get_all_currency.return_value = self.currencies
+        version = await load_rate_table()
+
+        self.assertEqual(version, rate_table.version)
+        self.assertEqual(rate_table.snapshot(), {"USD": 1.0, "BRL": 0.2})
+
+    @patch("app.repositories.mongo_repository.AsyncMongoRepository.get_all_currency")
+    async def test_load_rate_table_keeps_values_when_database_fails(
+        self, mock_get_all_currency: Mock
+    ):
+        rate_table.set("USD", 1)
+        mock_get_all_currency.side_effect = MongoRepositoryTransactionsException
+        version = await load_rate_table()
+
+        self.assertEqual(version, rate_table.version)
+        self.assertEqual(rate_table.snapshot(), {"USD": 1.0})
+
+    @patch("app.repositories.redis_repository.AsyncRedisRepository.get_many")
+    @patch("app.repositories.mongo_repository.AsyncMongoRepository.get_by_acronym")
+    async def test_currency_exchange_uses_rate_table_without_io(
+        self, mock_get_by_acronym: Mock, redis_mock_get: Mock
+    ):
+        rate_table.load({"USD": 1, "BRL": 0.2})
+        service = CurrencyConverterService()
+        response = await service.currency_exchange("BRL", "USD", 100)
+
+        self.assertEqual(response, "20.000000")
+        mock_get_by_acronym.assert_not_called()
+        redis_mock_get.assert_not_called()
+
+    @patch(
+        "app.repositories.redis_repository.AsyncRedisRepository.get_generation",
+        new=AsyncMock(return_value="0"),
+    )
+    @patch(
+        "app.repositories.redis_repository.AsyncRedisRepository.set_many_if_generation"
+    )
+    @patch("app.repositories.redis_repository.AsyncRedisRepository.get_many")
+    async def test_currency_exchange_fills_rate_table_on_miss(
+        self, redis_mock_get: Mock, redis_mock_create: Mock
+    ):
+        rate_table.set("USD", 1)
+        redis_mock_get.return_value = [self.currencies[1]]
+        service = CurrencyConverterService()
+        response = await service.currency_exchange("BRL", "USD", 100)
+
+        self.assertEqual(response, "20.000000")
+        self.assertEqual(rate_table.get("BRL"), 0.2)
+        redis_mock_get.assert_called_once_with(["BRL"])
+        redis_mock_create.assert_not_called()
+
+    @patch.object(AsyncMongoRepository, "delete_by_acronym", new=AsyncMock())
+    @patch.object(AsyncMongoRepository, "update_or_create_by_acronym", new=AsyncMock())
+    async def test_mutations_update_rate_table(self):
+        service = CurrencyConverterService()
+        await service.update_currency(
+            Currency(acronym="BRL", name="Real", dolar_price_reference=0.3)
+        )
+        self.assertEqual(rate_table.get("BRL"), 0.3)
+
+        await service.delete_currency("brl")
+        self.assertIsNone(rate_table.get("BRL"))
+
+    @patch("app.api.v1.currency_converter.tasks.load_rate_table")
+    @patch("app.api.v1.currency_converter.tasks.asyncio.sleep")
+    async def test_refresh_rate_table_periodically(
+        self, mock_sleep: Mock, mock_load: Mock
+    ):
+        mock_load.side_effect = [1, asyncio.CancelledError]
+
+        with self.assertRaises(asyncio.CancelledError):
+            await refresh_rate_table_periodically(10)
+        mock_sleep.assert_called_with(10)
+        self.assertEqual(mock_load.call_count, 2)
@@ -0,0 +1,42 @@
+from unittest.mock import (
+    Mock,
+    patch,
+)
+
+from app.api.v1.currency_converter.response_cache import (
+    ResponseCache,
+    build_etag,
+    etag_matches,
+)
+from tests.unit import DefaultTestCase
+
+
+class ResponseCacheTestCase(DefaultTestCase):
+
+    def test_etag_matches(self):
+        etag = build_etag(b"[]")
+        self.assertTrue(etag.startswith('"') and etag.endswith('"'))
+        self.assertTrue(etag_matches(etag, etag))
+        self.assertTrue(etag_matches(etag, f'"other", W/{etag}'))
+        self.assertTrue(etag_matches(etag, "*"))
+        self.assertFalse(etag_matches(etag, '"other"'))
+        self.assertFalse(etag_matches(etag, None))
+
+    @patch("app.api.v1.currency_converter.response_cache.monotonic")
+    def test_entries_expire_after_ttl(self, mock_monotonic: Mock):
+        cache = ResponseCache(ttl=5)
+        mock_monotonic.return_value = 100
+        cached = cache.set("key", b"[]")
+
+        mock_monotonic.return_value = 105
+        self.assertEqual(cache.get("key"), cached)
+        mock_monotonic.return_value = 106
+        self.assertIsNone(cache.get("key"))
+        self.assertIsNone(cache.get("key"))
+
+    def test_invalidate(self):
+        cache = ResponseCache(ttl=5)
+        cache.set("key", b"[]")
+        cache.invalidate("key")
+        cache.invalidate("key")
+        self.assertIsNone(cache.get("key"))
@@ -0,0 +1,127 @@
+import json
+from unittest.mock import (
+    Mock,
+    patch,
+)
+
+from fastapi import status
+from fastapi.responses import JSONResponse
+from pydantic import ValidationError
+
+from app.api.v1.words.analyze.exceptions import AnalyzeWordsException
+from app.api.v1.words.analyze.models import AnalyzeWordsRequest
+from app.api.v1.words.analyze.service import AnalyzeWordsService
+from app.api.v1.words.analyze.stages import (
+    AnalysisContext,
+    ConsonantCountStage,
+    count_word_consonants,
+)
+from app.api.v1.words.analyze.views import analyze_words
+from app.api.v1.words.vowel_count.exceptions import VowelCountException
+from app.exceptions.default_exceptions import InternalServerErrorException
+from tests.unit import DefaultTestCase
+
+
+class AnalyzeWordsTestCase(DefaultTestCase):
+
+    def setUp(self) -> None:
+        self.words = ["robin", "Batman", "", "açaí", "robin"]
+        return super().setUp()
+
+    def analyze(self, **fields) -> dict:
+        response = analyze_words(AnalyzeWordsRequest(words=self.words, **fields))
+        self.assertTrue(isinstance(response, JSONResponse))
+        self.assertTrue(response.status_code == status.HTTP_200_OK)
+        return json.loads(response.body)
+
+    def test_analyze_all_stages(self):
+        self.assertEqual(
+            self.analyze(),
+            {
+                "sort": ["", "Batman", "açaí", "robin", "robin"],
+                "vowel_count": {"robin": 2, "Batman": 2, "": 0, "açaí": 3},
+                "consonant_count": {"robin": 3, "Batman": 4, "": 0, "açaí": 1},
+                "length_histogram": {"0": 1, "4": 1, "5": 2, "6": 1},
+                "char_frequency": {
+                    "B": 1,
+                    "a": 4,
+                    "b": 2,
+                    "i": 2,
+                    "m": 1,
+                    "n": 3,
+                    "o": 2,
+                    "r": 2,
+                    "t": 1,
+                    "ç": 1,
+                    "í": 1,
+                },
+            },
+        )
+        # Os estágios não mudam a lista usada pelos outros.
+        self.assertEqual(self.words[0], "robin")
+
+    def test_analyze_chosen_stages_with_sort_options(self):
+        response = self.analyze(
+            stages=["length_histogram", "sort", "sort"],
+            sort={"order": "desc", "unique": True, "limit": 2},
+        )
+        self.assertEqual(list(response), ["length_histogram", "sort"])
+        self.assertEqual(response["sort"], ["robin", "açaí"])
+
+    def test_analyze_words_with_lone_surrogate(self):
+        request = AnalyzeWordsRequest(
+            words=["a\ud800e", "bc"], stages=["vowel_count", "consonant_count"]
+        )
+        response = AnalyzeWordsService().analyze_words(request)
+        self.assertEqual(response["vowel_count"], {"a\ud800e": 2, "bc": 0})
+        self.assertEqual(response["consonant_count"], {"a\ud800e": 0, "bc": 2})
+
+        self.words = request.words
+        self.assertEqual(self.analyze(stages=["vowel_count"])["vowel_count"]["bc"], 0)
+
+    def test_analyze_empty_words(self):
+        self.words = []
+        self.assertEqual(
+            self.analyze(),
+            {
+                "sort": [],
+                "vowel_count": {},
+                "consonant_count": {},
+                "length_histogram": {},
+                "char_frequency": {},
+            },
+        )
+
+    def test_consonants_match_the_per_word_count(self):
+        self.words = ["", "Straße", "", "Ñandú", "xyz", "Æsir", ""]
+        context = AnalysisContext(AnalyzeWordsRequest(words=self.words))
+        self.assertEqual(
+            ConsonantCountStage().run(context),
+            {word: count_word_consonants(word) for word in self.words},
+        )
+
+    def test_analyze_invalid_payload(self):
+        with self.assertRaises(ValidationError):
+            AnalyzeWordsRequest(words=["a"], stages=[])
+        with self.assertRaises(ValidationError):
+            AnalyzeWordsRequest(words=["a"], stages=["unknown"])
+
+    @patch("app.api.v1.words.analyze.stages.count_per_code")
+    def test_analyze_unmapped_error(self, count_per_code_mock: Mock):
+        count_per_code_mock.side_effect = Exception("error_exception")
+        with self.assertRaises(AnalyzeWordsException) as context_error:
+            self.analyze(stages=["consonant_count"])
+
+        self.assertEqual(
+            context_error.exception.status_code, status.HTTP_400_BAD_REQUEST
+        )
+
+    @patch("app.api.v1.words.vowel_count.service.count_vowels")
+    def test_analyze_keeps_stage_exceptions(self, count_vowels_mock: Mock):
+        count_vowels_mock.side_effect = Exception("error_exception")
+        with self.assertRaises(VowelCountException):
+            self.analyze(stages=["vowel_count"])
+
+    def test_analyze_with_invalid_payload(self):
+        with self.assertRaises(InternalServerErrorException):
+            analyze_words({})
@@ -0,0 +1,80 @@
+import json
+from unittest.mock import Mock
+
+from app.api.v1.words.sort.collation import (
+    accent_insensitive_key,
+    case_insensitive_key,
+    get_collation_key,
+    natural_key,
+)
+from app.api.v1.words.sort.external_sort import ExternalSorter
+from app.api.v1.words.sort.models import SortWordsRequest
+from app.api.v1.words.sort.views import sort_words
+from tests.unit import DefaultTestCase
+
+
+class CollationTestCase(DefaultTestCase):
+
+    def setUp(self) -> None:
+        self.words = ["zebra", "Árvore", "casa", "Casa", "arvore", "Beco", "água"]
+        return super().setUp()
+
+    def sort(self, order: str, collation: str, words: list[str]) -> list:
+        request = SortWordsRequest(words=list(words), order=order, collation=collation)
+        return json.loads(sort_words(request).body)
+
+    def test_default_collation_keeps_code_point_order(self):
+        self.assertIsNone(get_collation_key("default"))
+        self.assertEqual(self.sort("asc", "default", self.words), sorted(self.words))
+
+    def test_case_insensitive(self):
+        self.assertEqual(
+            self.sort("asc", "case_insensitive", self.words),
+            ["arvore", "Beco", "Casa", "casa", "zebra", "água", "Árvore"],
+        )
+
+    def test_accent_insensitive(self):
+        self.assertEqual(
+            self.sort("asc", "accent_insensitive", self.words),
+            ["água", "arvore", "Árvore", "Beco", "Casa", "casa", "zebra"],
+        )
+        self.assertEqual(
+            self.sort("desc", "accent_insensitive", self.words),
+            ["zebra", "casa", "Casa", "Beco", "Árvore", "arvore", "água"],
+        )
+
+    def test_natural(self):
+        words = ["item10", "item2", "item02", "item1b", "item", "10", "9"]
+        self.assertEqual(
+            self.sort("asc", "natural", words),
+            ["9", "10", "item", "item1b", "item02", "item2", "item10"],
+        )
+
+    def test_keys_break_ties_with_the_word(self):
+        self.assertEqual(case_insensitive_key("Casa"), ("casa", "Casa"))
+        self.assertEqual(accent_insensitive_key("Água"), ("agua", "Água"))
+        self.assertEqual(
+            natural_key("a007b12"), (["a", (1, "7"), "b", (2, "12"), ""], "a007b12")
+        )
+
+    def test_external_sort_with_collation_spills_keys(self):
+        key = Mock(side_effect=accent_insensitive_key)
+        sorter = ExternalSorter(memory_budget=150, key=key)
+        for word in self.words:
+            if sorter.extend([word]):
+                sorter.spill()
+        self.assertGreater(sorter.runs, 1)
+        self.assertEqual(
+            list(sorter.iter_sorted()),
+            sorted(self.words, key=accent_insensitive_key),
+        )
+        # A chave de cada palavra é calculada uma vez só, inclusive no merge.
+        self.assertEqual(key.call_count, len(self.words))
+
+    def test_external_sort_with_natural_collation(self):
+        words = ["x10", "x9", "x100", "x1"]
+        sorter = ExternalSorter(memory_budget=0, reverse=True, key=natural_key)
+        for word in words:
+            sorter.extend([word])
+            sorter.spill()
+        self.assertEqual(list(sorter.iter_sorted()), ["x100", "x10", "x9", "x1"])
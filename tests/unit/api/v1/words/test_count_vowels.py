@@ -9,6 +9,10 @@ from fastapi.responses import JSONResponse
 
 from app.api.v1.words.vowel_count.exceptions import VowelCountException
 from app.api.v1.words.vowel_count.models import VowelCountRequest
+from app.api.v1.words.vowel_count.utils import (
+    count_vowels,
+    count_word_vowels,
+)
 from app.api.v1.words.vowel_count.views import vowel_count
 from app.exceptions.default_exceptions import InternalServerErrorException
 from tests.unit import DefaultTestCase
@@ -61,9 +65,31 @@ class CountVowelsTestCase(DefaultTestCase):
             context_error.exception.status_code, status.HTTP_500_INTERNAL_SERVER_ERROR
         )
 
-    @patch("app.api.v1.words.vowel_count.service.sum")
-    def test_vowel_count_service_raises_a_error(self, sum_mock: Mock):
-        sum_mock.side_effect = Exception("error_exception")
+    def test_vowel_count_uppercase_and_accents(self):
+        self.count_vowels_request.update(
+            {"words": ["BATMAN", "Coração", "açaí", "", "batman", "BATMAN"]}
+        )
+        response = vowel_count(
+            VowelCountRequest.model_validate(self.count_vowels_request)
+        )
+        self.assertEqual(
+            json.loads(response.body),
+            {"BATMAN": 2, "Coração": 4, "açaí": 3, "": 0, "batman": 2},
+        )
+
+    def test_count_vowels_with_separator_inside_a_word(self):
+        words = ["a\x00e", "xyz", "Ióu"]
+        self.assertEqual(count_vowels(words), [2, 0, 3])
+        self.assertEqual(count_vowels(words), [count_word_vowels(w) for w in words])
+        self.assertEqual(count_vowels([]), [])
+
+    def test_count_vowels_with_lone_surrogate(self):
+        words = ["a\ud800e", "ió"]
+        self.assertEqual(count_vowels(words), [2, 2])
+
+    @patch("app.api.v1.words.vowel_count.service.count_vowels")
+    def test_vowel_count_service_raises_a_error(self, count_vowels_mock: Mock):
+        count_vowels_mock.side_effect = Exception("error_exception")
         with self.assertRaises(VowelCountException) as context_error:
             vowel_count(VowelCountRequest.model_validate(self.count_vowels_request))
 
@@ -0,0 +1,85 @@
+from unittest.mock import (
+    Mock,
+    patch,
+)
+
+from fastapi import status
+
+from app.api.v1.words.sort import service as sort_service
+from app.api.v1.words.sort.exceptions import SortWordsException
+from app.api.v1.words.sort.external_sort import (
+    ExternalSorter,
+    iter_ndjson_words,
+)
+from app.api.v1.words.sort.views import sort_words_stream
+from tests.unit import DefaultAsyncTestCase
+
+
+async def iter_chunks(*chunks: bytes):
+    for chunk in chunks:
+        yield chunk
+
+
+class ExternalSortTestCase(DefaultAsyncTestCase):
+
+    def setUp(self) -> None:
+        self.words = ["robin", "batman", "coringa", "lanterna\nverde", "diana", "a"]
+        return super().setUp()
+
+    async def test_iter_ndjson_words_across_chunks(self):
+        chunks = iter_chunks(b'"robin"\n"bat', b'man"\n\n"cor', b'inga"')
+        batches = [words async for words in iter_ndjson_words(chunks)]
+        self.assertEqual(batches, [["robin"], ["batman"], ["coringa"]])
+
+    async def test_iter_ndjson_words_rejects_non_string_lines(self):
+        with self.assertRaises(ValueError):
+            [words async for words in iter_ndjson_words(iter_chunks(b'"a"\n1\n'))]
+        with self.assertRaises(ValueError):
+            [words async for words in iter_ndjson_words(iter_chunks(b"robin\n"))]
+
+    def test_sort_in_memory(self):
+        sorter = ExternalSorter(memory_budget=10_000)
+        self.assertFalse(sorter.extend(self.words))
+        self.assertEqual(list(sorter.iter_sorted()), sorted(self.words))
+        self.assertEqual(sorter.runs, 0)
+
+    def test_spills_runs_and_merges(self):
+        for reverse in (False, True):
+            sorter = ExternalSorter(memory_budget=100, reverse=reverse)
+            for word in self.words:
+                if sorter.extend([word]):
+                    sorter.spill()
+            self.assertEqual(sorter.runs, 3)
+            self.assertEqual(
+                list(sorter.iter_sorted()), sorted(self.words, reverse=reverse)
+            )
+            self.assertEqual(sorter.runs, 0)
+
+    def test_iter_ndjson_batches(self):
+        sorter = ExternalSorter(memory_budget=100)
+        sorter.extend(["b", "c", "a"])
+        sorter.spill()
+        self.assertEqual(list(sorter.iter_ndjson(2)), [b'"a"\n"b"\n', b'"c"\n'])
+
+    async def test_sort_words_stream_view(self):
+        request = Mock()
+        request.stream.return_value = iter_chunks(
+            b'"robin"\n"batman"\n', b'"coringa"\n"diana"'
+        )
+        with patch.object(sort_service.settings, "WORDS_SORT_MEMORY_BUDGET", 130):
+            response = await sort_words_stream(request, order="desc")
+            body = b"".join([chunk async for chunk in response.body_iterator])
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.media_type, "application/x-ndjson")
+        self.assertEqual(body, b'"robin"\n"diana"\n"coringa"\n"batman"\n')
+
+    async def test_sort_words_stream_with_invalid_body(self):
+        request = Mock()
+        request.stream.return_value = iter_chunks(b'{"words": []}\n')
+        with self.assertRaises(SortWordsException) as context_error:
+            await sort_words_stream(request, order="asc")
+
+        self.assertEqual(
+            context_error.exception.status_code, status.HTTP_400_BAD_REQUEST
+        )
@@ -0,0 +1,131 @@
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from unittest.mock import (
+    Mock,
+    patch,
+)
+
+from app.api.v1.words import parallel
+from app.api.v1.words.parallel import (
+    close_process_pool,
+    encode_shards,
+    get_process_pool,
+    merge_sorted_runs,
+    parallel_count_vowels,
+    parallel_enabled,
+    parallel_sort,
+    should_run_in_parallel,
+    warm_up_process_pool,
+)
+from app.api.v1.words.sort.models import SortWordsRequest
+from app.api.v1.words.sort.service import SortWordService
+from app.api.v1.words.vowel_count.service import VowelCountService
+from tests.unit import DefaultTestCase
+
+
+class ParallelWordsTestCase(DefaultTestCase):
+
+    def setUp(self) -> None:
+        self.words = ["robin", "Coração", "batman", "", "açaí", "lobo", "diana"]
+        settings_patch = patch.multiple(
+            parallel.settings, WORDS_PARALLEL_THRESHOLD=3, WORDS_PARALLEL_WORKERS=3
+        )
+        settings_patch.start()
+        self.addCleanup(settings_patch.stop)
+        # Threads no lugar de processos, o código dos shards é o mesmo.
+        pool_patch = patch(
+            "app.api.v1.words.parallel.get_process_pool",
+            return_value=ThreadPoolExecutor(max_workers=3),
+        )
+        pool_patch.start()
+        self.addCleanup(pool_patch.stop)
+        return super().setUp()
+
+    def test_parallel_is_off_by_default(self):
+        fields = type(parallel.settings).model_fields
+        self.assertEqual(fields["WORDS_PARALLEL_THRESHOLD"].default, 0)
+        self.assertTrue(parallel_enabled())
+        with patch.object(parallel.settings, "WORDS_PARALLEL_THRESHOLD", 0):
+            self.assertFalse(parallel_enabled())
+
+    def test_should_run_in_parallel(self):
+        self.assertFalse(should_run_in_parallel(2))
+        self.assertTrue(should_run_in_parallel(3))
+        with patch.object(parallel.settings, "WORDS_PARALLEL_THRESHOLD", 0):
+            self.assertFalse(should_run_in_parallel(3))
+        with patch.object(parallel.settings, "WORDS_PARALLEL_WORKERS", 1):
+            self.assertFalse(should_run_in_parallel(3))
+
+    def test_encode_shards(self):
+        shards = encode_shards(self.words, 3)
+        self.assertEqual([size for _, size in shards], [3, 3, 1])
+        self.assertEqual(shards[0][0], "robin\x00Coração\x00batman".encode())
+        self.assertIsNone(encode_shards(["a\x00b", "c"], 2))
+
+    def test_parallel_count_vowels(self):
+        self.assertEqual(parallel_count_vowels(self.words), [2, 4, 2, 0, 3, 2, 3])
+        self.assertEqual(parallel_count_vowels(["a\x00e", "i"]), [2, 1])
+
+    def test_parallel_sort(self):
+        self.assertEqual(parallel_sort(self.words), sorted(self.words))
+        self.assertEqual(
+            parallel_sort(self.words, reverse=True),
+            sorted(self.words, reverse=True),
+        )
+        self.assertEqual(parallel_sort(["b\x00", "a"]), ["a", "b\x00"])
+
+    def test_broken_pool_falls_back_to_serial(self):
+        broken_pool = Mock()
+        broken_pool.map.side_effect = BrokenProcessPool
+        parallel._process_pool = broken_pool
+
+        with patch(
+            "app.api.v1.words.parallel.get_process_pool", return_value=broken_pool
+        ):
+            self.assertEqual(parallel_sort(self.words), sorted(self.words))
+            self.assertEqual(parallel_count_vowels(self.words), [2, 4, 2, 0, 3, 2, 3])
+
+        # O pool quebrado é descartado, o próximo get_process_pool cria outro.
+        self.assertIsNone(parallel._process_pool)
+        broken_pool.shutdown.assert_called_once_with(wait=False, cancel_futures=True)
+
+    def test_merge_sorted_runs(self):
+        runs = [["a", "c", "e"], ["b", "d"], ["a", "f"]]
+        self.assertEqual(merge_sorted_runs(runs), ["a", "a", "b", "c", "d", "e", "f"])
+
+    def test_services_use_the_pool_above_threshold(self):
+        request = SortWordsRequest(words=list(self.words), order="desc")
+        self.assertEqual(
+            SortWordService().sort_words(request), sorted(self.words, reverse=True)
+        )
+        self.assertEqual(
+            VowelCountService().return_total_vowels(self.words),
+            {
+                "robin": 2,
+                "Coração": 4,
+                "batman": 2,
+                "": 0,
+                "açaí": 3,
+                "lobo": 2,
+                "diana": 3,
+            },
+        )
+
+
+class ProcessPoolTestCase(DefaultTestCase):
+
+    def tearDown(self) -> None:
+        close_process_pool()
+        return super().tearDown()
+
+    @patch.multiple(parallel.settings, WORDS_PARALLEL_WORKERS=2)
+    def test_shards_run_in_processes(self):
+        words = ["robin", "batman", "coringa", "diana", "açaí"]
+        self.assertIs(get_process_pool(), get_process_pool())
+        self.assertEqual(parallel_sort(words), sorted(words))
+        self.assertEqual(parallel_count_vowels(words), [2, 2, 3, 3, 3])
+
+    @patch.multiple(parallel.settings, WORDS_PARALLEL_WORKERS=2)
+    def test_warm_up_starts_the_pool(self):
+        warm_up_process_pool()
+        self.assertTrue(get_process_pool()._processes)
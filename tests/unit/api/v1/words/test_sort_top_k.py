@@ -0,0 +1,63 @@
+import json
+from unittest.mock import (
+    Mock,
+    patch,
+)
+
+from pydantic import ValidationError
+
+from app.api.v1.words.sort.models import SortWordsRequest
+from app.api.v1.words.sort.views import sort_words
+from tests.unit import DefaultTestCase
+
+
+class SortWordsTopKTestCase(DefaultTestCase):
+
+    def setUp(self) -> None:
+        self.words = ["robin", "batman", "coringa", "batman", "diana", "lobo", "robin"]
+        return super().setUp()
+
+    def sort(self, **fields) -> list:
+        request = SortWordsRequest(words=list(self.words), **fields)
+        return json.loads(sort_words(request).body)
+
+    def test_limit_and_offset(self):
+        self.assertEqual(
+            self.sort(order="asc", limit=3), ["batman", "batman", "coringa"]
+        )
+        self.assertEqual(
+            self.sort(order="asc", limit=2, offset=2), ["coringa", "diana"]
+        )
+        self.assertEqual(self.sort(order="desc", limit=2), ["robin", "robin"])
+        self.assertEqual(self.sort(order="asc", offset=5), ["robin", "robin"])
+        self.assertEqual(self.sort(order="asc", limit=5, offset=6), ["robin"])
+        self.assertEqual(self.sort(order="asc", limit=5, offset=10), [])
+
+    def test_unique(self):
+        self.assertEqual(
+            self.sort(order="asc", unique=True),
+            ["batman", "coringa", "diana", "lobo", "robin"],
+        )
+        self.assertEqual(
+            self.sort(order="desc", unique=True, limit=2, offset=1),
+            ["lobo", "diana"],
+        )
+
+    def test_limit_with_collation(self):
+        self.words = ["Zebra", "árvore", "Casa", "abacaxi"]
+        self.assertEqual(
+            self.sort(order="asc", collation="accent_insensitive", limit=2),
+            ["abacaxi", "árvore"],
+        )
+
+    @patch("app.api.v1.words.sort.service.heapq.nsmallest")
+    def test_limit_uses_heap_selection(self, nsmallest_mock: Mock):
+        nsmallest_mock.return_value = ["batman", "batman"]
+        self.assertEqual(self.sort(order="asc", limit=2), ["batman", "batman"])
+        nsmallest_mock.assert_called_once_with(2, self.words, key=None)
+
+    def test_invalid_limit_and_offset(self):
+        with self.assertRaises(ValidationError):
+            SortWordsRequest(words=self.words, order="asc", limit=0)
+        with self.assertRaises(ValidationError):
+            SortWordsRequest(words=self.words, order="asc", offset=-1)
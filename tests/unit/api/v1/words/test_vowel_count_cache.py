@@ -0,0 +1,75 @@
+from unittest.mock import (
+    Mock,
+    patch,
+)
+
+from app.api.v1.words.vowel_count.cache import (
+    VowelCountCache,
+    vowel_count_cache,
+)
+from app.api.v1.words.vowel_count.service import VowelCountService
+from app.api.v1.words.vowel_count.utils import count_vowels
+from tests.unit import DefaultTestCase
+
+
+class VowelCountCacheTestCase(DefaultTestCase):
+
+    def test_get_many_fills_hits_and_returns_misses(self):
+        cache = VowelCountCache(maxsize=10)
+        cache.set_many(["batman"], [2])
+        words = {"batman": None, "robin": None}
+
+        self.assertEqual(cache.get_many(words), ["robin"])
+        self.assertEqual(words, {"batman": 2, "robin": None})
+        self.assertEqual(cache.stats()["hits"], 1)
+        self.assertEqual(cache.stats()["misses"], 1)
+
+    def test_evicts_least_recently_used(self):
+        cache = VowelCountCache(maxsize=2)
+        cache.set_many(["batman", "robin"], [2, 2])
+        cache.get_many({"batman": None})
+        cache.set_many(["coringa"], [3])
+
+        self.assertEqual(cache.get_many({"robin": None}), ["robin"])
+        self.assertEqual(cache.get_many({"batman": None, "coringa": None}), [])
+        self.assertEqual(
+            cache.stats(),
+            {"size": 2, "maxsize": 2, "hits": 3, "misses": 1, "evictions": 1},
+        )
+
+    def test_set_many_bigger_than_maxsize_keeps_the_last_words(self):
+        cache = VowelCountCache(maxsize=2)
+        cache.set_many(["batman"], [2])
+        cache.set_many(["robin", "coringa", "diana"], [2, 3, 3])
+
+        self.assertEqual(
+            cache.get_many({"batman": None, "robin": None}), ["batman", "robin"]
+        )
+        self.assertEqual(cache.get_many({"coringa": None, "diana": None}), [])
+        self.assertEqual(cache.stats()["evictions"], 2)
+
+    def test_maxsize_zero_disables_cache(self):
+        cache = VowelCountCache(maxsize=0)
+        cache.set_many(["batman"], [2])
+        self.assertEqual(cache.get_many({"batman": None}), ["batman"])
+        self.assertEqual(cache.stats()["size"], 0)
+
+    @patch(
+        "app.api.v1.words.vowel_count.service.count_vowels",
+        side_effect=count_vowels,
+    )
+    def test_service_counts_each_word_once(self, count_vowels_mock: Mock):
+        service = VowelCountService()
+        response = service.return_total_vowels(["batman", "robin", "batman"])
+        self.assertEqual(response, {"batman": 2, "robin": 2})
+        count_vowels_mock.assert_called_once_with(["batman", "robin"])
+
+        response = service.return_total_vowels(["robin", "coringa"])
+        self.assertEqual(response, {"robin": 2, "coringa": 3})
+        count_vowels_mock.assert_called_with(["coringa"])
+
+        response = service.return_total_vowels(["batman", "coringa"])
+        self.assertEqual(response, {"batman": 2, "coringa": 3})
+        self.assertEqual(count_vowels_mock.call_count, 2)
+        self.assertEqual(vowel_count_cache.stats()["hits"], 3)
+        self.assertEqual(vowel_count_cache.stats()["misses"], 3)
@@ -1,21 +1,39 @@
+import asyncio
 from unittest.mock import (
     Mock,
     patch,
 )
 
 from fastapi import status
-from httpcore import Request
 from httpx import (
+    AsyncClient,
     Client,
+    MockTransport,
+    Request,
     Response,
 )
 
 from app.exceptions.default_exceptions import (
     ApiInvalidResponseException,
+    CircuitOpenException,
     CurrencyInvalidValuesException,
+    ServiceUnavailableException,
 )
-from app.services.awesomeapi import AwesomeApiService
-from tests.unit import DefaultTestCase
+from app.services.awesomeapi import (
+    AsyncAwesomeApiService,
+    AwesomeApiService,
+    awesome_api_circuit_breaker,
+    build_http_client,
+    close_http_client,
+    get_http_client,
+    settings,
+)
+from app.utils.circuit_breaker import CircuitState
+from tests.unit import (
+    DefaultAsyncTestCase,
+    DefaultTestCase,
+)
+from tests.unit.test_utils import AwesomeApiMockTransport
 
 default_date_format = "%d/%m/%Y"
 
@@ -88,3 +106,131 @@ class AwesomeApiServiceTestCase(DefaultTestCase):
         self.assertEqual(
             context_error.exception.detail, {"error": "Invalid values for the api"}
         )
+
+
+class AsyncAwesomeApiServiceTestCase(DefaultAsyncTestCase):
+
+    @patch.object(AsyncClient, "send")
+    async def test_get_currency_values(self, mock_http_send: Mock):
+
+        mock_http_send.return_value = Response(
+            status_code=status.HTTP_200_OK, content='{"test":"testing"}'
+        )
+        service = AsyncAwesomeApiService()
+        response = await service.get_currency_values("USD", "BRL")
+
+        self.assertEqual(response, {"test": "testing"})
+        request = mock_http_send.call_args.args[0]
+        self.assertEqual(request.url.path, "/json/last/USD-BRL")
+
+    async def test_get_currency_values_raise_exception_when_receive_invalid_values(
+        self,
+    ):
+        service = AsyncAwesomeApiService()
+
+        with self.assertRaises(CurrencyInvalidValuesException) as context_error:
+            await service.get_currency_values("USD", "BBB")
+        self.assertEqual(context_error.exception.status_code, status.HTTP_403_FORBIDDEN)
+
+    @patch.object(AsyncClient, "send")
+    async def test_get_mapped_currencys_raise_exception_when_receive_invalid_status(
+        self, mock_http_send: Mock
+    ):
+
+        mock_http_send.return_value = Response(
+            status_code=status.HTTP_404_NOT_FOUND, content='{"detail":"Not found"}'
+        )
+        service = AsyncAwesomeApiService()
+
+        with self.assertRaises(ApiInvalidResponseException) as context_error:
+            await service.get_mapped_currencys()
+        self.assertEqual(context_error.exception.status_code, status.HTTP_403_FORBIDDEN)
+
+    async def test_get_currency_values_with_mock_transport(self):
+        transport = AwesomeApiMockTransport({"USD-BRL": {"bid": "5.10"}})
+        async with build_http_client(transport=transport) as http_client:
+            service = AsyncAwesomeApiService(http_client)
+            first_response = await service.get_currency_values("USD", "BRL")
+            second_response = await service.get_currency_values("USD", "BRL")
+
+        self.assertEqual(first_response, {"USDBRL": {"bid": "5.10"}})
+        self.assertEqual(first_response, second_response)
+        self.assertEqual(len(transport.requests), 2)
+        self.assertEqual(transport.requests[0].url.host, "economia.awesomeapi.com.br")
+
+    async def test_get_available_pairs_and_last_quotations(self):
+        transport = AwesomeApiMockTransport(
+            {"BRL-USD": {"bid": "0.2"}, "EUR-USD": {"bid": "1.1"}}
+        )
+        async with build_http_client(transport=transport) as http_client:
+            service = AsyncAwesomeApiService(http_client)
+            available_pairs = await service.get_available_pairs()
+            quotations = await service.get_last_quotations(["BRL-USD", "EUR-USD"])
+
+        self.assertEqual(list(available_pairs), ["BRL-USD", "EUR-USD"])
+        self.assertEqual(
+            quotations, {"BRLUSD": {"bid": "0.2"}, "EURUSD": {"bid": "1.1"}}
+        )
+        self.assertEqual(transport.requests[1].url.path, "/json/last/BRL-USD,EUR-USD")
+
+    async def test_slow_request_is_hedged(self):
+        calls = []
+
+        async def handler(request: Request) -> Response:
+            calls.append(request)
+            if len(calls) == 1:
+                await asyncio.sleep(1)
+            return Response(status.HTTP_200_OK, json={"call": len(calls)})
+
+        async with build_http_client(transport=MockTransport(handler)) as http_client:
+            service = AsyncAwesomeApiService(http_client)
+            with patch.object(settings, "AWESOME_API_HEDGE_DELAY", 0.01):
+                response = await service.get_mapped_currencys()
+
+        self.assertEqual(response, {"call": 2})
+        self.assertEqual(len(calls), 2)
+
+    async def test_latency_budget_and_server_errors_open_the_breaker(self):
+        async def handler(request: Request) -> Response:
+            if request.url.path == "/json/available":
+                await asyncio.sleep(1)
+            return Response(status.HTTP_502_BAD_GATEWAY)
+
+        async with build_http_client(transport=MockTransport(handler)) as http_client:
+            service = AsyncAwesomeApiService(http_client)
+            # Só a chamada lenta usa o orçamento curto, os 502 voltam na hora.
+            with patch.multiple(
+                settings, AWESOME_API_HEDGE_DELAY=0, AWESOME_API_LATENCY_BUDGET=0.01
+            ):
+                with self.assertRaises(ServiceUnavailableException):
+                    await service.get_available_pairs()
+            for _ in range(settings.CIRCUIT_BREAKER_MINIMUM_CALLS - 1):
+                with self.assertRaises(ApiInvalidResponseException):
+                    await service.get_mapped_currencys()
+
+            self.assertEqual(awesome_api_circuit_breaker.state, CircuitState.OPEN)
+            with self.assertRaises(CircuitOpenException):
+                await service.get_mapped_currencys()
+
+    async def test_get_mapped_currencys_with_mock_transport_invalid_status(self):
+        transport = AwesomeApiMockTransport({}, status_code=status.HTTP_502_BAD_GATEWAY)
+        async with build_http_client(transport=transport) as http_client:
+            service = AsyncAwesomeApiService(http_client)
+            with self.assertRaises(ApiInvalidResponseException):
+                await service.get_mapped_currencys()
+
+    async def test_services_share_the_process_http_client(self):
+        await close_http_client()
+        http_client = get_http_client()
+
+        self.assertIs(AsyncAwesomeApiService().http_client, http_client)
+        self.assertIs(get_http_client(), http_client)
+        self.assertEqual(
+            http_client.timeout.connect, settings.AWESOME_API_CONNECT_TIMEOUT
+        )
+        self.assertEqual(http_client.timeout.read, settings.AWESOME_API_READ_TIMEOUT)
+
+        await close_http_client()
+        await close_http_client()
+        self.assertTrue(http_client.is_closed)
+        self.assertIsNot(get_http_client(), http_client)
@@ -0,0 +1,54 @@
+from app.api.v1.currency_converter.models import Currency
+from app.repositories.codecs import (
+    CODECS,
+    JsonCodec,
+    MsgpackCodec,
+    OrjsonCodec,
+    RedisCodec,
+    get_codec,
+)
+from tests.unit import DefaultTestCase
+
+
+class RedisCodecsTestCase(DefaultTestCase):
+
+    def setUp(self) -> None:
+        self.currency = Currency(
+            acronym="BRL", name="Real", dolar_price_reference=0.19
+        ).model_dump()
+        return super().setUp()
+
+    def test_codecs_round_trip_as_bytes(self):
+        values = [self.currency, [self.currency, self.currency], {"empty": None}]
+        for name in CODECS:
+            codec = get_codec(name)
+            self.assertEqual(codec.name, name)
+            for value in values:
+                encoded = codec.encode(value)
+                self.assertIsInstance(encoded, bytes)
+                self.assertEqual(codec.decode(encoded), value)
+
+    def test_json_values_are_readable_by_orjson(self):
+        encoded = JsonCodec().encode(self.currency)
+        self.assertEqual(OrjsonCodec().decode(encoded), self.currency)
+
+    def test_msgpack_is_smaller_than_json(self):
+        payload = [self.currency] * 100
+        self.assertLess(
+            len(MsgpackCodec().encode(payload)), len(JsonCodec().encode(payload))
+        )
+
+    def test_invalid_codec(self):
+        with self.assertRaises(ValueError):
+            get_codec("pickle")
+
+    def test_base_codec_is_abstract(self):
+        with self.assertRaises(TypeError):
+            RedisCodec()
+
+        class EncodeOnlyCodec(RedisCodec):
+            def encode(self, value) -> bytes:
+                return b""
+
+        with self.assertRaises(TypeError):
+            EncodeOnlyCodec()
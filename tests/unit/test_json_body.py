@@ -0,0 +1,112 @@
+from unittest.mock import (
+    AsyncMock,
+    Mock,
+    patch,
+)
+
+from fastapi.exceptions import RequestValidationError
+
+from app.api.v1.words.sort.models import SortWordsRequest
+from app.api.v1.words.vowel_count.models import VowelCountRequest
+from app.utils import json_body as json_body_module
+from app.utils.json_body import (
+    ORJSONFallbackResponse,
+    is_str_list,
+    json_body,
+    json_body_openapi,
+    parse_json_body,
+)
+from tests.unit import DefaultAsyncTestCase
+
+
+class JsonBodyTestCase(DefaultAsyncTestCase):
+
+    def test_is_str_list(self):
+        self.assertTrue(is_str_list([]))
+        self.assertTrue(is_str_list(["a", "b"]))
+        self.assertFalse(is_str_list(["a", 1]))
+        self.assertFalse(is_str_list("ab"))
+        self.assertFalse(is_str_list(None))
+
+    def test_parse_json_body(self):
+        parsed = parse_json_body(
+            b'{"words": ["b", "a"], "order": "asc", "limit": 1}',
+            SortWordsRequest,
+            "words",
+        )
+        self.assertIsInstance(parsed, SortWordsRequest)
+        self.assertEqual(parsed.words, ["b", "a"])
+        self.assertEqual(parsed.limit, 1)
+
+    @patch.object(
+        SortWordsRequest, "model_validate", wraps=SortWordsRequest.model_validate
+    )
+    def test_fast_path_skips_word_validation(self, model_validate_mock: Mock):
+        parse_json_body(
+            b'{"words": ["b", "a"], "order": "asc"}', SortWordsRequest, "words"
+        )
+        model_validate_mock.assert_called_once_with({"words": [], "order": "asc"})
+
+        model_validate_mock.reset_mock()
+        parse_json_body(
+            b'{"words": ["b", "a"], "order": "asc"}', SortWordsRequest, "words", False
+        )
+        model_validate_mock.assert_called_once_with(
+            {"words": ["b", "a"], "order": "asc"}
+        )
+
+    def test_parse_json_body_errors(self):
+        cases = (
+            (
+                b'{"words": ["a", 1], "order": "asc"}',
+                ("body", "words", 1),
+                "string_type",
+            ),
+            (b'{"words": ["a"], "order": "asc", "limit": 0}', ("body", "limit"), None),
+            (b'{"words": ["a"]}', ("body", "order"), "missing"),
+            (b'["a"]', ("body",), "model_type"),
+            (b'{"words": ', ("body", 10), "json_invalid"),
+        )
+        for body, loc, error_type in cases:
+            with self.assertRaises(RequestValidationError) as context_error:
+                parse_json_body(body, SortWordsRequest, "words")
+            error = context_error.exception.errors()[0]
+            self.assertEqual(error["loc"], loc)
+            if error_type:
+                self.assertEqual(error["type"], error_type)
+
+    def test_lone_surrogates_are_read_and_rendered(self):
+        parsed = parse_json_body(
+            b'{"words": ["a\\ud800e"]}', VowelCountRequest, "words"
+        )
+        self.assertEqual(parsed.words, ["a\ud800e"])
+
+        response = ORJSONFallbackResponse(content={"a\ud800e": 2})
+        self.assertEqual(response.body, b'{"a\\ud800e":2}')
+        self.assertEqual(ORJSONFallbackResponse(content={"a": 1}).body, b'{"a":1}')
+
+    def test_missing_field_error_shows_the_sent_body(self):
+        with self.assertRaises(RequestValidationError) as context_error:
+            parse_json_body(b'{"words": ["a"]}', SortWordsRequest, "words")
+        self.assertEqual(context_error.exception.errors()[0]["input"], {"words": ["a"]})
+
+    async def test_json_body_dependency(self):
+        request = Mock()
+        request.body = AsyncMock(return_value=b'{"words": ["a", "b"]}')
+        parsed = await json_body(VowelCountRequest)(request)
+        self.assertEqual(parsed.words, ["a", "b"])
+
+        with patch.object(json_body_module.settings, "WORDS_FAST_JSON_BODY", False):
+            parsed = await json_body(VowelCountRequest)(request)
+        self.assertEqual(parsed.words, ["a", "b"])
+
+        # Bodies grandes são lidos no threadpool.
+        with patch.object(json_body_module, "THREADPOOL_BODY_SIZE", 0):
+            parsed = await json_body(VowelCountRequest)(request)
+        self.assertEqual(parsed.words, ["a", "b"])
+
+    def test_json_body_openapi(self):
+        schema = json_body_openapi(VowelCountRequest)["requestBody"]
+        self.assertEqual(
+            schema["content"]["application/json"]["schema"]["required"], ["words"]
+        )
@@ -1,19 +1,58 @@
 from types import FunctionType
 from typing import Any
 from unittest.mock import (
+    AsyncMock,
+    MagicMock,
     Mock,
     patch,
 )
 
 from fastapi import status
+from motor.motor_asyncio import AsyncIOMotorDatabase
 from pymongo.database import Database
+from pymongo.errors import (
+    DuplicateKeyError,
+    ServerSelectionTimeoutError,
+)
 
-from app.exceptions.default_exceptions import MongoRepositoryTransactionsException
-from app.repositories.mongo_repository import MongoRepository
-from tests.unit import DefaultTestCase
-from tests.unit.test_utils import MongoMockDB
+from app.api.v1.currency_converter.indexes import (
+    CURRENCY_INDEXES,
+    RATE_PROJECTION,
+)
+from app.exceptions.default_exceptions import (
+    CircuitOpenException,
+    MongoRepositoryTransactionsException,
+)
+from app.repositories.codecs import JsonCodec
+from app.repositories.mongo_repository import (
+    AsyncMongoRepository,
+    MongoRepository,
+    close_mongo_client,
+    get_mongo_client,
+    mongo_circuit_breaker,
+)
+from app.repositories.redis_repository import (
+    DEFAULT_TTL,
+    SET_IF_GENERATION_SCRIPT,
+    AsyncRedisRepository,
+    RedisRepository,
+    close_redis_client,
+    get_redis_client,
+    get_sync_redis_client,
+)
+from app.utils.circuit_breaker import CircuitState
+from app.utils.config import return_default_settings
+from tests.unit import (
+    DefaultAsyncTestCase,
+    DefaultTestCase,
+)
+from tests.unit.test_utils import (
+    AsyncMongoMockDB,
+    MongoMockDB,
+)
 
 default_date_format = "%d/%m/%Y"
+settings = return_default_settings()
 
 
 class MongoRepositoryTestCase(DefaultTestCase):
@@ -44,6 +83,7 @@ class MongoRepositoryTestCase(DefaultTestCase):
             (service.delete_by_acronym, "id_value"),
             (service.delete_by_acronym, "id_value"),
             (service.update_or_create_date_cache, {"test": "id"}),
+            (service.create_indexes, CURRENCY_INDEXES),
         ]
 
         for func in functions_list:
@@ -67,6 +107,7 @@ class MongoRepositoryTestCase(DefaultTestCase):
             (service.delete_by_acronym, "id_value"),
             (service.delete_by_acronym, "id_value"),
             (service.update_or_create_date_cache, {"test": "id"}),
+            (service.create_indexes, CURRENCY_INDEXES),
         ]
 
         for func in functions_list:
@@ -125,3 +166,319 @@ class MongoRepositoryTestCase(DefaultTestCase):
         self.assertEqual(
             context_error.exception.detail, {"error": "Invalid transaction in mongoDB"}
         )
+
+
+class AsyncMongoRepositoryTestCase(DefaultAsyncTestCase):
+
+    def setUp(self) -> None:
+        self.db_name = "db_name"
+        self.collection = "db_collection"
+        self.mongo_mock_aux = AsyncMongoMockDB()
+        return super().setUp()
+
+    def _repository_calls(self, service: AsyncMongoRepository) -> list:
+        return [
+            (service.get_by_id, ("id_value",)),
+            (service.get_by_acronym, ("acronym_value",)),
+            (service.get_by_acronyms, (["USD", "BRL"],)),
+            (service.get_page_by_acronym, ("USD", 10)),
+            (service.get_all_currency, ()),
+            (service.get_cached_date, ()),
+            (service.create, ({"test": "id"},)),
+            (service.delete_by_id, ("id_value",)),
+            (service.delete_by_acronym, ("id_value",)),
+            (service.update_by_id, ("id_value", {"updt": "test"})),
+            (service.update_or_create_by_acronym, ("USD", {"updt": "test"})),
+            (service.update_or_create_date_cache, ({"test": "id"},)),
+            (service.create_indexes, (CURRENCY_INDEXES,)),
+            (service.bulk_update_or_create_by_acronym, ([{"acronym": "USD"}],)),
+        ]
+
+    async def test_mongo_db_return(self):
+        service = AsyncMongoRepository()
+        response = service._get_database("currencys-test")
+        self.assertEqual(response.name, "currencys-test")
+        self.assertTrue(type(response) is AsyncIOMotorDatabase)
+
+    @patch.object(AsyncMongoRepository, "_get_database")
+    async def test_repository_calls(self, bd_mock: Mock):
+
+        bd_mock.return_value = self.mongo_mock_aux
+        service = AsyncMongoRepository()
+        self.assertEqual(
+            await service.get_by_acronym(self.db_name, self.collection, "USD"),
+            {"acronym": "USD"},
+        )
+        self.assertEqual(
+            await service.get_all_currency(self.db_name, self.collection), []
+        )
+        for function_to_test, function_data in self._repository_calls(service):
+            await function_to_test(self.db_name, self.collection, *function_data)
+        bd_mock.assert_called()
+
+    @patch.object(AsyncMongoRepository, "_get_database")
+    async def test_iter_by_acronym_yields_batches(self, bd_mock: Mock):
+
+        bd_mock.return_value = MagicMock()
+        cursor = bd_mock.return_value[self.collection].find.return_value
+        cursor = cursor.sort.return_value.batch_size.return_value
+        cursor.to_list = AsyncMock(side_effect=[[{"acronym": "BRL"}], []])
+        service = AsyncMongoRepository()
+
+        batches = [
+            batch
+            async for batch in service.iter_by_acronym(
+                self.db_name, self.collection, "AUD", 1
+            )
+        ]
+        self.assertEqual(batches, [[{"acronym": "BRL"}]])
+        bd_mock.return_value[self.collection].find.assert_called_once_with(
+            {"acronym": {"$gt": "AUD"}}, None
+        )
+
+        cursor.to_list.side_effect = Exception("test error")
+        with self.assertRaises(MongoRepositoryTransactionsException):
+            await anext(service.iter_by_acronym(self.db_name, self.collection, None, 1))
+
+    @patch.object(AsyncMongoRepository, "_get_database")
+    async def test_indexes_and_projection(self, bd_mock: Mock):
+
+        bd_mock.return_value = MagicMock()
+        collection = bd_mock.return_value[self.collection]
+        collection.find_one = AsyncMock(return_value={"acronym": "USD"})
+        collection.find.return_value.to_list = AsyncMock(return_value=[])
+        collection.create_indexes = AsyncMock(return_value=["acronym_unique"])
+        service = AsyncMongoRepository()
+
+        await service.get_by_acronym(
+            self.db_name, self.collection, "USD", RATE_PROJECTION
+        )
+        collection.find_one.assert_called_once_with({"acronym": "USD"}, RATE_PROJECTION)
+        await service.get_by_acronyms(
+            self.db_name, self.collection, ["USD"], RATE_PROJECTION
+        )
+        collection.find.assert_called_once_with(
+            {"acronym": {"$in": ["USD"]}}, RATE_PROJECTION
+        )
+        self.assertEqual(
+            await service.create_indexes(
+                self.db_name, self.collection, CURRENCY_INDEXES
+            ),
+            ["acronym_unique"],
+        )
+        collection.create_indexes.assert_called_once_with(CURRENCY_INDEXES)
+
+    @patch.object(AsyncMongoRepository, "_get_database")
+    async def test_repository_raises_unexpected_exception(self, bd_mock: Mock):
+
+        bd_mock.side_effect = Exception("test error")
+        service = AsyncMongoRepository()
+        for function_to_test, function_data in self._repository_calls(service):
+            with self.assertRaises(
+                MongoRepositoryTransactionsException
+            ) as context_error:
+                await function_to_test(self.db_name, self.collection, *function_data)
+            self.assertEqual(
+                context_error.exception.detail,
+                {"error": "Invalid transaction in mongoDB"},
+            )
+
+    @patch.object(AsyncMongoRepository, "_get_database")
+    async def test_open_breaker_passes_through_every_method(self, bd_mock: Mock):
+        mongo_circuit_breaker._open()
+        service = AsyncMongoRepository()
+        for function_to_test, function_data in self._repository_calls(service):
+            with self.assertRaises(CircuitOpenException):
+                await function_to_test(self.db_name, self.collection, *function_data)
+        bd_mock.return_value.__getitem__.return_value.find_one.assert_not_called()
+
+    @patch.object(AsyncMongoRepository, "_get_database")
+    async def test_duplicate_key_does_not_open_the_breaker(self, bd_mock: Mock):
+        collection = bd_mock.return_value.__getitem__.return_value
+        collection.insert_one = AsyncMock(side_effect=DuplicateKeyError("dup"))
+        service = AsyncMongoRepository()
+        for _ in range(settings.CIRCUIT_BREAKER_MINIMUM_CALLS * 2):
+            with self.assertRaises(MongoRepositoryTransactionsException):
+                await service.create(self.db_name, self.collection, {"acronym": "X"})
+        self.assertEqual(mongo_circuit_breaker.state, CircuitState.CLOSED)
+
+        collection.insert_one.side_effect = ServerSelectionTimeoutError("down")
+        for _ in range(settings.CIRCUIT_BREAKER_MINIMUM_CALLS):
+            with self.assertRaises(MongoRepositoryTransactionsException):
+                await service.create(self.db_name, self.collection, {"acronym": "X"})
+        self.assertEqual(mongo_circuit_breaker.state, CircuitState.OPEN)
+
+    async def test_repositories_share_the_process_client(self):
+        close_mongo_client()
+        first_repository = AsyncMongoRepository()
+        second_repository = AsyncMongoRepository()
+
+        self.assertIs(first_repository.client, second_repository.client)
+        self.assertIs(first_repository.client, get_mongo_client())
+        pool_options = first_repository.client.delegate.options.pool_options
+        self.assertEqual(pool_options.max_pool_size, settings.MONGO_MAX_POOL_SIZE)
+        self.assertEqual(
+            pool_options.wait_queue_timeout,
+            settings.MONGO_WAIT_QUEUE_TIMEOUT_MS / 1000,
+        )
+
+        close_mongo_client()
+        close_mongo_client()
+        self.assertIsNot(AsyncMongoRepository().client, first_repository.client)
+
+
+class RedisRepositoryTestCase(DefaultTestCase):
+
+    def setUp(self) -> None:
+        self.repository = RedisRepository(codec=JsonCodec())
+        self.repository.client = MagicMock()
+        return super().setUp()
+
+    def test_get_and_create(self):
+        self.repository.client.get.return_value = b'{"acronym": "USD"}'
+        self.assertEqual(self.repository.get("USD"), {"acronym": "USD"})
+
+        self.repository.client.get.return_value = None
+        self.assertIsNone(self.repository.get("USD"))
+
+        self.repository.create("USD", {"acronym": "USD"}, ttl=10)
+        self.repository.client.set.assert_called_once_with(
+            "USD", b'{"acronym": "USD"}', ex=10
+        )
+
+    def test_get_many_uses_one_mget(self):
+        self.repository.client.mget.return_value = [b'{"acronym": "USD"}', None]
+
+        response = self.repository.get_many(["USD", "BRL"])
+        self.assertEqual(response, [{"acronym": "USD"}, None])
+        self.repository.client.mget.assert_called_once_with(["USD", "BRL"])
+
+    def test_set_many_uses_one_pipeline(self):
+        pipeline = self.repository.client.pipeline.return_value.__enter__.return_value
+        pipeline.execute.return_value = [True, True]
+
+        response = self.repository.set_many({"USD": {"v": 1}, "BRL": {"v": 2}})
+        self.assertEqual(response, [True, True])
+        self.repository.client.pipeline.assert_called_once_with(transaction=False)
+        pipeline.set.assert_any_call("USD", b'{"v": 1}', ex=DEFAULT_TTL)
+        pipeline.set.assert_any_call("BRL", b'{"v": 2}', ex=DEFAULT_TTL)
+        pipeline.execute.assert_called_once()
+
+
+class AsyncRedisRepositoryTestCase(DefaultAsyncTestCase):
+
+    def setUp(self) -> None:
+        self.repository = AsyncRedisRepository(codec=JsonCodec())
+        self.repository.client = MagicMock()
+        return super().setUp()
+
+    async def test_get_and_create(self):
+        self.repository.client.get = AsyncMock(return_value=b'{"acronym": "USD"}')
+        self.repository.client.set = AsyncMock(return_value=True)
+
+        self.assertEqual(await self.repository.get("USD"), {"acronym": "USD"})
+        self.assertTrue(await self.repository.create("USD", {"acronym": "USD"}))
+        self.repository.client.set.assert_called_once_with(
+            "USD", b'{"acronym": "USD"}', ex=DEFAULT_TTL
+        )
+
+    async def test_get_many_uses_one_mget(self):
+        self.repository.client.mget = AsyncMock(return_value=[None, b"invalid"])
+
+        response = await self.repository.get_many(["USD", "BRL"])
+        self.assertEqual(response, [None, None])
+        self.repository.client.mget.assert_called_once_with(["USD", "BRL"])
+
+    async def test_set_many_uses_one_pipeline(self):
+        pipeline = MagicMock()
+        pipeline.execute = AsyncMock(return_value=[True])
+        self.repository.client.pipeline.return_value.__aenter__.return_value = pipeline
+
+        response = await self.repository.set_many({"USD": {"v": 1}}, ttl=30)
+        self.assertEqual(response, [True])
+        self.repository.client.pipeline.assert_called_once_with(transaction=False)
+        pipeline.set.assert_called_once_with("USD", b'{"v": 1}', ex=30)
+        pipeline.execute.assert_called_once()
+
+    async def test_repository_uses_codec_from_settings(self):
+        repository = AsyncRedisRepository()
+        self.assertEqual(repository.codec.name, settings.REDIS_CODEC)
+
+    async def test_write_through_uses_one_transaction(self):
+        pipeline = MagicMock()
+        pipeline.execute = AsyncMock(return_value=[True, 2])
+        self.repository.client.pipeline.return_value.__aenter__.return_value = pipeline
+
+        await self.repository.write_through({"USD": {"v": 1}}, ["all", "list"])
+        self.repository.client.pipeline.assert_called_once_with(transaction=True)
+        pipeline.set.assert_called_once_with("USD", b'{"v": 1}', ex=DEFAULT_TTL)
+        pipeline.delete.assert_called_once_with("all", "list")
+        pipeline.incr.assert_not_called()
+
+        await self.repository.write_through({}, ["all"], generation_key="generation")
+        pipeline.incr.assert_called_once_with("generation")
+
+    async def test_get_generation(self):
+        self.repository.client.get = AsyncMock(return_value=None)
+        self.assertEqual(await self.repository.get_generation("generation"), "0")
+
+        self.repository.client.get = AsyncMock(return_value=b"3")
+        self.assertEqual(await self.repository.get_generation("generation"), "3")
+        self.repository.client.get.assert_called_once_with("generation")
+
+    async def test_set_many_if_generation_uses_one_script(self):
+        script = AsyncMock(side_effect=[1, 0])
+        self.repository.client.register_script.return_value = script
+
+        self.assertTrue(
+            await self.repository.set_many_if_generation(
+                {"USD": {"v": 1}}, "generation", "3", ttl=30
+            )
+        )
+        self.repository.client.register_script.assert_called_with(
+            SET_IF_GENERATION_SCRIPT
+        )
+        script.assert_called_once_with(
+            keys=["generation", "USD"], args=["3", 30, b'{"v": 1}']
+        )
+        # Uma escrita mudou a geração, o script não grava nada.
+        self.assertFalse(
+            await self.repository.set_bytes_if_generation(
+                {"body": b"[]"}, "generation", "3"
+            )
+        )
+        self.assertTrue(
+            await self.repository.set_bytes_if_generation({}, "generation", "3")
+        )
+        self.assertEqual(script.call_count, 2)
+
+    async def test_repositories_share_the_process_client(self):
+        await close_redis_client()
+        first_repository = AsyncRedisRepository()
+        second_repository = AsyncRedisRepository()
+
+        self.assertIs(first_repository.client, second_repository.client)
+        self.assertIs(first_repository.client, get_redis_client())
+        self.assertIs(RedisRepository().client, get_sync_redis_client())
+        self.assertIs(RedisRepository().client, RedisRepository().client)
+
+        await close_redis_client()
+        await close_redis_client()
+        self.assertIsNot(AsyncRedisRepository().client, first_repository.client)
+
+    async def test_publish_and_subscribe(self):
+        self.repository.client.publish = AsyncMock(return_value=1)
+        self.assertEqual(await self.repository.publish("channel", {"v": 1}), 1)
+        self.repository.client.publish.assert_called_once_with("channel", b'{"v": 1}')
+
+        async def listen():
+            yield {"type": "message", "data": b'{"v": 1}'}
+
+        pubsub = MagicMock()
+        pubsub.subscribe = AsyncMock()
+        pubsub.listen = listen
+        self.repository.client.pubsub.return_value.__aenter__.return_value = pubsub
+
+        messages = [message async for message in self.repository.subscribe("ch")]
+        self.assertEqual(messages, [{"v": 1}])
+        pubsub.subscribe.assert_called_once_with("ch")
@@ -1,3 +1,9 @@
+from httpx import (
+    MockTransport,
+    Request,
+    Response,
+)
+
 default_date_format = "%d/%m/%Y"
 
 
@@ -23,3 +29,77 @@ class MongoMockDB:
 
     def replace_one(self, filter, *_, **__):
         return _
+
+    def create_indexes(self, indexes, *_, **__):
+        return [index.document["name"] for index in indexes]
+
+
+class AsyncMongoMockCursor:
+
+    def sort(self, *_, **__):
+        return self
+
+    def limit(self, *_, **__):
+        return self
+
+    def batch_size(self, *_, **__):
+        return self
+
+    async def to_list(self, *_, **__):
+        return []
+
+
+class AsyncMongoMockDB:
+
+    def __getitem__(self, _):
+        return self
+
+    def find(self, filter, *_, **__):
+        return AsyncMongoMockCursor()
+
+    async def find_one(self, filter, *_, **__):
+        return filter
+
+    async def insert_one(self, filter, *_, **__):
+        return _
+
+    async def delete_one(self, filter, *_, **__):
+        return _
+
+    async def update_one(self, filter, *_, **__):
+        return _
+
+    async def replace_one(self, filter, *_, **__):
+        return _
+
+    async def create_indexes(self, indexes, *_, **__):
+        return [index.document["name"] for index in indexes]
+
+    async def bulk_write(self, requests, *_, **__):
+        return requests
+
+
+class AwesomeApiMockTransport(MockTransport):
+    """
+    Transport local que responde as rotas /json/last/ e /json/available
+    da AwesomeAPI com as cotações passadas, sem acessar a rede.
+    """
+
+    def __init__(self, quotations: dict, status_code: int = 200) -> None:
+        self.quotations = quotations
+        self.status_code = status_code
+        self.requests: list[Request] = []
+        super().__init__(self._handler)
+
+    def _handler(self, request: Request) -> Response:
+        self.requests.append(request)
+        if request.url.path == "/json/available":
+            content = {pair: pair for pair in self.quotations}
+            return Response(self.status_code, json=content)
+        pairs = request.url.path.removeprefix("/json/last/").split(",")
+        content = {
+            pair.replace("-", ""): self.quotations[pair]
+            for pair in pairs
+            if pair in self.quotations
+        }
+        return Response(self.status_code, json=content)
@@ -0,0 +1,118 @@
+import asyncio
+from unittest.mock import (
+    Mock,
+    patch,
+)
+
+from app.exceptions.default_exceptions import CircuitOpenException
+from app.utils.circuit_breaker import (
+    CircuitBreaker,
+    CircuitState,
+    circuit_breakers_state,
+    get_circuit_breaker,
+)
+from tests.unit import DefaultAsyncTestCase
+
+
+class CircuitBreakerTestCase(DefaultAsyncTestCase):
+
+    def setUp(self) -> None:
+        self.breaker = CircuitBreaker(
+            "test",
+            slow_call_duration=0.05,
+            failure_rate=0.5,
+            window_size=4,
+            minimum_calls=4,
+            open_duration=30,
+        )
+        return super().setUp()
+
+    async def _ok(self) -> str:
+        return "value"
+
+    async def _slow(self) -> str:
+        await asyncio.sleep(0.06)
+        return "slow value"
+
+    async def _fail(self) -> str:
+        raise ValueError("dependency error")
+
+    async def _call_failing(self, breaker: CircuitBreaker, times: int = 1):
+        for _ in range(times):
+            with self.assertRaises(ValueError):
+                await breaker.call(self._fail)
+
+    async def test_opens_on_error_rate(self):
+        await self.breaker.call(self._ok)
+        await self.breaker.call(self._ok)
+        await self._call_failing(self.breaker)
+        self.assertEqual(self.breaker.state, CircuitState.CLOSED)
+
+        await self._call_failing(self.breaker)
+        self.assertEqual(self.breaker.state, CircuitState.OPEN)
+        with self.assertRaises(CircuitOpenException) as context_error:
+            await self.breaker.call(self._ok)
+        self.assertEqual(context_error.exception.status_code, 503)
+
+    async def test_only_failure_exceptions_count(self):
+        breaker = CircuitBreaker(
+            "test",
+            slow_call_duration=0.05,
+            failure_exceptions=(ConnectionError,),
+            minimum_calls=2,
+        )
+        await self._call_failing(breaker, times=4)
+        self.assertEqual(breaker.current_failure_rate(), 0)
+        self.assertEqual(breaker.state, CircuitState.CLOSED)
+
+        async def connection_error():
+            raise ConnectionError("dependency down")
+
+        for _ in range(4):
+            with self.assertRaises(ConnectionError):
+                await breaker.call(connection_error)
+        self.assertEqual(breaker.state, CircuitState.OPEN)
+
+    async def test_slow_calls_count_as_failures(self):
+        await self.breaker.call(self._ok)
+        await self.breaker.call(self._ok)
+        self.assertEqual(await self.breaker.call(self._slow), "slow value")
+        await self.breaker.call(self._slow)
+        self.assertEqual(self.breaker.state, CircuitState.OPEN)
+
+    @patch("app.utils.circuit_breaker.monotonic")
+    async def test_half_open_probe_closes_or_reopens(self, mock_monotonic: Mock):
+        mock_monotonic.return_value = 100.0
+        await self._call_failing(self.breaker, times=4)
+        self.assertEqual(self.breaker.state, CircuitState.OPEN)
+
+        mock_monotonic.return_value = 131.0
+        self.assertEqual(self.breaker.state, CircuitState.HALF_OPEN)
+        await self._call_failing(self.breaker)
+        self.assertEqual(self.breaker.state, CircuitState.OPEN)
+
+        mock_monotonic.return_value = 162.0
+        self.assertEqual(await self.breaker.call(self._ok), "value")
+        self.assertEqual(self.breaker.state, CircuitState.CLOSED)
+        self.assertEqual(self.breaker.snapshot()["calls"], 0)
+
+    async def test_half_open_allows_a_single_probe(self):
+        self.breaker._open()
+        self.breaker.open_duration = 0
+        opened_at = self.breaker._opened_at
+        probe = asyncio.create_task(self.breaker.call(self._slow))
+        await asyncio.sleep(0)
+
+        with self.assertRaises(CircuitOpenException):
+            await self.breaker.call(self._ok)
+        # A chamada de teste foi lenta, o circuito abre de novo.
+        await probe
+        self.assertGreater(self.breaker._opened_at, opened_at)
+
+    async def test_registry(self):
+        breaker = get_circuit_breaker("registry-test", 1.0)
+        self.assertIs(get_circuit_breaker("registry-test", 2.0), breaker)
+        self.assertEqual(
+            circuit_breakers_state()["registry-test"],
+            {"state": "closed", "failure_rate": 0.0, "calls": 0},
+        )
@@ -0,0 +1,95 @@
+import asyncio
+
+from app.utils.single_flight import SingleFlight
+from tests.unit import DefaultAsyncTestCase
+
+
+class SingleFlightTestCase(DefaultAsyncTestCase):
+
+    def setUp(self) -> None:
+        self.single_flight = SingleFlight()
+        self.loader_calls = 0
+        return super().setUp()
+
+    async def _slow_loader(self) -> str:
+        self.loader_calls += 1
+        await asyncio.sleep(0.01)
+        return "value"
+
+    async def _failing_loader(self) -> str:
+        self.loader_calls += 1
+        await asyncio.sleep(0.01)
+        raise ValueError("loader error")
+
+    async def test_concurrent_calls_run_loader_once(self):
+        responses = await asyncio.gather(
+            *[self.single_flight.do("key", self._slow_loader) for _ in range(10)]
+        )
+
+        self.assertEqual(responses, ["value"] * 10)
+        self.assertEqual(self.loader_calls, 1)
+        self.assertFalse(self.single_flight.in_flight("key"))
+
+    async def test_different_keys_run_their_own_loader(self):
+        await asyncio.gather(
+            self.single_flight.do("first", self._slow_loader),
+            self.single_flight.do("second", self._slow_loader),
+        )
+        self.assertEqual(self.loader_calls, 2)
+
+    async def test_loader_error_is_shared_with_waiters(self):
+        responses = await asyncio.gather(
+            *[self.single_flight.do("key", self._failing_loader) for _ in range(3)],
+            return_exceptions=True,
+        )
+
+        self.assertEqual(self.loader_calls, 1)
+        for response in responses:
+            self.assertIsInstance(response, ValueError)
+
+        # Depois do erro a chave é liberada para uma nova tentativa.
+        with self.assertRaises(ValueError):
+            await self.single_flight.do("key", self._failing_loader)
+        self.assertEqual(self.loader_calls, 2)
+
+    async def test_cancelled_caller_does_not_cancel_waiters(self):
+        leader = asyncio.create_task(self.single_flight.do("key", self._slow_loader))
+        await asyncio.sleep(0)
+        waiter = asyncio.create_task(self.single_flight.do("key", self._slow_loader))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        self.assertEqual(await waiter, "value")
+        with self.assertRaises(asyncio.CancelledError):
+            await leader
+        self.assertEqual(self.loader_calls, 1)
+        self.assertFalse(self.single_flight.in_flight("key"))
+
+    async def test_loader_keeps_running_when_every_caller_is_cancelled(self):
+        caller = asyncio.create_task(self.single_flight.do("key", self._slow_loader))
+        await asyncio.sleep(0)
+        caller.cancel()
+        await asyncio.sleep(0)
+        self.assertTrue(self.single_flight.in_flight("key"))
+
+        # Quem chega depois aproveita o loader que ainda está rodando.
+        self.assertEqual(await self.single_flight.do("key", self._slow_loader), "value")
+        self.assertEqual(self.loader_calls, 1)
+        self.assertFalse(self.single_flight.in_flight("key"))
+
+    async def test_start_runs_loader_in_background(self):
+        task = self.single_flight.start("key", self._slow_loader)
+        await asyncio.sleep(0)
+        self.assertTrue(self.single_flight.in_flight("key"))
+        self.assertIsNone(self.single_flight.start("key", self._slow_loader))
+
+        self.assertEqual(await task, "value")
+        self.assertEqual(self.loader_calls, 1)
+
+    async def test_start_logs_loader_error(self):
+        task = self.single_flight.start("key", self._failing_loader)
+        with self.assertLogs("app.utils.single_flight", level="ERROR"):
+            with self.assertRaises(ValueError):
+                await task
+            await asyncio.sleep(0)
+        self.assertFalse(self.single_flight._tasks)